@@ -0,0 +1,105 @@
+"""Benchmark thread vs process backends of ConversionThread.
+
+Usage:
+    python -m benchmarks.bench_backends --files 40 --paragraphs 2000
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from convertext.config import Config
+from convertext.converters.loader import load_converters
+from convertext.core import ConversionEngine
+
+from convertext_gui.threads import ConversionThread
+
+PARAGRAPH = (
+    "The quick brown fox jumps over the lazy dog while **bold** and _italic_ "
+    "runs keep the Markdown parser busy with [links](https://example.com)."
+)
+
+
+def make_corpus(directory, count, paragraphs):
+    """Write `count` Markdown files of `paragraphs` paragraphs each."""
+    files = []
+    for i in range(count):
+        path = directory / f"doc{i:04d}.md"
+        body = "\n\n".join(
+            f"## Section {p}\n\n{PARAGRAPH}" if p % 20 == 0 else PARAGRAPH
+            for p in range(paragraphs)
+        )
+        path.write_text(f"# Document {i}\n\n{body}\n", encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def run_batch(files, formats, output_dir, workers, backend):
+    """Run one batch and return its wall time in seconds."""
+    engine = ConversionEngine(Config())
+    thread = ConversionThread(
+        engine=engine,
+        files=files,
+        formats=formats,
+        output_dir=output_dir,
+        overwrite=True,
+        keep_intermediate=False,
+        callback=lambda *args: None,
+        workers=workers,
+        backend=backend
+    )
+    start = time.perf_counter()
+    thread.run()
+    elapsed = time.perf_counter() - start
+    failed = [r for r in thread.results if not r.success]
+    if failed:
+        raise RuntimeError(f"{len(failed)} conversions failed: {failed[0].error}")
+    return elapsed
+
+
+def worker_counts(limit):
+    """1, 2, 4, ... up to and including `limit`."""
+    counts = []
+    n = 1
+    while n < limit:
+        counts.append(n)
+        n *= 2
+    counts.append(limit)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=40)
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--formats", default="html,txt")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    load_converters()
+    formats = args.formats.split(",")
+    work_dir = Path(tempfile.mkdtemp(prefix="convertext-bench-"))
+    try:
+        source_dir = work_dir / "src"
+        output_dir = work_dir / "out"
+        source_dir.mkdir()
+        output_dir.mkdir()
+        files = make_corpus(source_dir, args.files, args.paragraphs)
+
+        print(f"{len(files)} files x {len(formats)} formats, up to {args.max_workers} workers")
+        print(f"{'backend':<8} {'workers':>7} {'seconds':>9} {'speedup':>8}")
+        for backend in ("thread", "process"):
+            baseline = None
+            for workers in worker_counts(args.max_workers):
+                elapsed = run_batch(files, formats, output_dir, workers, backend)
+                baseline = baseline or elapsed
+                print(f"{backend:<8} {workers:>7} {elapsed:>9.2f} {baseline / elapsed:>7.2f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
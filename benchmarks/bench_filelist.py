@@ -0,0 +1,56 @@
+"""Benchmark FileList add/remove at large sizes (needs a display).
+
+Usage:
+    python -m benchmarks.bench_filelist --files 50000
+"""
+
+import argparse
+import time
+import tkinter as tk
+
+from convertext_gui.widgets import FileList
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:>9.1f} ms")
+    return elapsed
+
+
+def drain(root, file_list):
+    """Run the event loop until every pending row is drawn, tracking the longest stall."""
+    longest = 0.0
+    while file_list._pending_rows or file_list._flush_scheduled:
+        start = time.perf_counter()
+        root.update()
+        longest = max(longest, time.perf_counter() - start)
+    return longest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50000)
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.withdraw()
+    file_list = FileList(root)
+    file_list.pack()
+    paths = [f"/archive/batch{i // 1000:03d}/document{i:06d}.pdf" for i in range(args.files)]
+
+    print(f"{args.files} files")
+    timed("add_files (index)", lambda: file_list.add_files(paths))
+    stall = []
+    timed("draw rows", lambda: stall.append(drain(root, file_list)))
+    print(f"{'longest event-loop stall':<32} {stall[0] * 1000:>9.1f} ms")
+    timed("re-add duplicates", lambda: file_list.add_files(paths))
+    timed("remove 1000 files", lambda: file_list.remove_files(paths[::max(1, args.files // 1000)]))
+    timed("files snapshot", lambda: file_list.files)
+    timed("clear", file_list.clear)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
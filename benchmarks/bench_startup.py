@@ -0,0 +1,43 @@
+"""Benchmark GUI cold start (needs a display).
+
+Runs the app with --measure-startup several times and reports the median
+of each milestone, measured from the first line of convertext_gui.gui:
+imports done, window shown, formats loaded. Pass --command to time a
+frozen build instead of the source tree.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --command "./dist/convertext-gui"
+"""
+
+import argparse
+import json
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--command", default=f"{sys.executable} -m convertext_gui")
+    args = parser.parse_args()
+
+    command = shlex.split(args.command) + ["--measure-startup"]
+    samples = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        timings["process_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        samples.append(timings)
+
+    result = {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+    result["runs"] = args.runs
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
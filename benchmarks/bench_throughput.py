@@ -0,0 +1,268 @@
+"""Batch conversion throughput on a synthetic corpus, as machine-readable JSON.
+
+Generates a reproducible corpus of TXT/MD/HTML/EPUB files in several size
+classes, runs it through ConversionThread once per worker count (each run in
+a fresh process, so peak memory is per run) and reports files/s, MB/s,
+p50/p95 per-conversion latency and peak RSS.
+
+Usage:
+    python -m benchmarks.bench_throughput --sizes small=40,medium=10,large=2 \\
+        --sources txt,md,html,epub --formats txt,html,md,epub --workers 1,2,4 \\
+        --output bench.json
+    python -m benchmarks.bench_throughput --compare bench.json   # exit 1 on >10% regression
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from benchmarks.bench_backends import worker_counts
+
+# Approximate bytes per file in each size class
+SIZE_CLASSES = {
+    'small': 4 * 1024,
+    'medium': 256 * 1024,
+    'large': 4 * 1024 ** 2,
+    'xlarge': 32 * 1024 ** 2,
+}
+
+WORDS = (
+    "convert document chapter reader paragraph format ebook section margin "
+    "library index archive author title page volume note table figure"
+).split()
+
+
+def parse_sizes(spec):
+    """"small=40,medium=10" -> {'small': 40, 'medium': 10}."""
+    sizes = {}
+    for item in spec.split(","):
+        name, _, count = item.partition("=")
+        if name not in SIZE_CLASSES:
+            raise argparse.ArgumentTypeError(f"unknown size class {name!r}; use {', '.join(SIZE_CLASSES)}")
+        sizes[name] = int(count)
+    return sizes
+
+
+def _paragraphs(rng, target_bytes):
+    """Random paragraphs totalling about `target_bytes`."""
+    paragraphs = []
+    total = 0
+    while total < target_bytes:
+        paragraph = " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120))).capitalize() + "."
+        paragraphs.append(paragraph)
+        total += len(paragraph) + 2
+    return paragraphs
+
+
+def _render(fmt, title, paragraphs):
+    if fmt == "md":
+        body = "\n\n".join(f"## Section {i}\n\n{p}" if i % 20 == 0 else p for i, p in enumerate(paragraphs))
+        return f"# {title}\n\n{body}\n"
+    if fmt == "html":
+        body = "\n".join(f"<h2>Section {i}</h2>\n<p>{p}</p>" if i % 20 == 0 else f"<p>{p}</p>"
+                         for i, p in enumerate(paragraphs))
+        return f"<html><head><title>{title}</title></head><body><h1>{title}</h1>\n{body}\n</body></html>\n"
+    return f"{title}\n\n" + "\n\n".join(paragraphs) + "\n"
+
+
+def make_corpus(directory, sizes, sources, seed=0):
+    """Write the corpus; EPUB sources are produced from Markdown with convertext itself."""
+    from convertext.config import Config
+    from convertext.core import ConversionEngine
+
+    rng = random.Random(seed)
+    engine = ConversionEngine(Config(), overrides={'output': {'overwrite': True}})
+    files = []
+    for size_name, count in sizes.items():
+        for i in range(count):
+            fmt = sources[(len(files)) % len(sources)]
+            title = f"{size_name.title()} document {i}"
+            paragraphs = _paragraphs(rng, SIZE_CLASSES[size_name])
+            stem = f"{size_name}-{i:04d}"
+
+            if fmt == "epub":
+                markdown = directory / f"{stem}.md"
+                markdown.write_text(_render("md", title, paragraphs), encoding="utf-8")
+                result = engine.convert(markdown, "epub")
+                markdown.unlink()
+                if not result.success:
+                    raise RuntimeError(f"Could not build EPUB source: {result.error}")
+                path = result.target_path
+            else:
+                path = directory / f"{stem}.{fmt}"
+                path.write_text(_render(fmt, title, paragraphs), encoding="utf-8")
+            files.append(path)
+    return files
+
+
+def _percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _round(value):
+    return None if value is None else round(value, 4)
+
+
+def run_once(files, formats, output_dir, workers, backend):
+    """One measured batch; runs in a fresh process so its peak RSS is its own."""
+    import resource
+    from convertext.config import Config
+    from convertext.converters.loader import load_converters
+    from convertext.core import ConversionEngine
+    from convertext.registry import get_registry
+    from convertext_gui.threads import ConversionThread
+
+    load_converters()
+    registry = get_registry()
+
+    # Same-format and unsupported pairs are left out rather than counted as failures
+    groups = {}
+    for file in files:
+        source = file.suffix.lstrip('.').lower()
+        targets = tuple(fmt for fmt in formats if fmt != source and registry.find_conversion_path(source, fmt))
+        if targets:
+            groups.setdefault(targets, []).append(file)
+
+    results = []
+    elapsed = 0.0
+    for targets, group in groups.items():
+        thread = ConversionThread(
+            engine=ConversionEngine(Config()),
+            files=group,
+            formats=list(targets),
+            output_dir=output_dir,
+            overwrite=True,
+            keep_intermediate=False,
+            callback=lambda *args: None,
+            workers=workers,
+            backend=backend,
+            multi_target=True
+        )
+        start = time.perf_counter()
+        thread.run()
+        elapsed += time.perf_counter() - start
+        results.extend(thread.results)
+
+    failed = [r for r in results if not r.success]
+    latencies = [r.seconds for r in results if r.success]
+    input_bytes = sum(f.stat().st_size for group in groups.values() for f in group)
+    scale = 1 if sys.platform == "darwin" else 1024
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) * scale
+
+    return {
+        'workers': workers,
+        'backend': backend,
+        'files': sum(len(group) for group in groups.values()),
+        'conversions': len(results),
+        'failed': len(failed),
+        'first_error': failed[0].error if failed else None,
+        'seconds': round(elapsed, 4),
+        'files_per_second': round(sum(len(g) for g in groups.values()) / elapsed, 3) if elapsed else None,
+        'mb_per_second': round(input_bytes / 1024 ** 2 / elapsed, 3) if elapsed else None,
+        'latency_p50': _round(_percentile(latencies, 0.50)),
+        'latency_p95': _round(_percentile(latencies, 0.95)),
+        'peak_rss': peak,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes("small=40,medium=10,large=2"),
+                        help=f"files per size class ({', '.join(SIZE_CLASSES)})")
+    parser.add_argument("--sources", default="txt,md,html,epub", help="source formats, used round-robin")
+    parser.add_argument("--formats", default="txt,html,md,epub", help="target formats")
+    parser.add_argument("--workers", help="comma-separated worker counts (default: 1, 2, 4, ... CPU count)")
+    parser.add_argument("--backend", choices=("thread", "process"), default="thread")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE",
+                        help="exit 1 if files/s drops more than --tolerance below this earlier report")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    from convertext.converters.loader import load_converters
+    load_converters()
+
+    sources = args.sources.split(",")
+    formats = args.formats.split(",")
+    workers = ([int(n) for n in args.workers.split(",")] if args.workers
+               else worker_counts(os.cpu_count() or 1))
+
+    work_dir = Path(tempfile.mkdtemp(prefix="convertext-bench-"))
+    try:
+        source_dir = work_dir / "src"
+        source_dir.mkdir()
+        files = make_corpus(source_dir, args.sizes, sources, args.seed)
+        corpus_bytes = sum(f.stat().st_size for f in files)
+        print(f"Corpus: {len(files)} files, {corpus_bytes / 1024 ** 2:.1f} MB", file=sys.stderr)
+
+        runs = []
+        context = multiprocessing.get_context("spawn")
+        for count in workers:
+            output_dir = work_dir / f"out-{count}"
+            output_dir.mkdir()
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                run = pool.submit(run_once, files, formats, output_dir, count, args.backend).result()
+            runs.append(run)
+            print(f"{count:>3} workers: {run['files_per_second']} files/s, {run['mb_per_second']} MB/s, "
+                  f"p95 {run['latency_p95']:.3f}s, peak {run['peak_rss'] / 1024 ** 2:.0f} MB",
+                  file=sys.stderr)
+            shutil.rmtree(output_dir, ignore_errors=True)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    from convertext import __version__ as convertext_version
+    from convertext_gui import __version__
+
+    report = {
+        'app_version': __version__,
+        'convertext_version': convertext_version,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'corpus': {'sizes': args.sizes, 'sources': sources, 'seed': args.seed,
+                   'files': len(files), 'bytes': corpus_bytes},
+        'formats': formats,
+        'runs': runs,
+    }
+    text = json.dumps(report, indent=1)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.compare:
+        sys.exit(compare(report, json.loads(args.compare.read_text(encoding="utf-8")), args.tolerance))
+
+
+def compare(report, baseline, tolerance):
+    """Exit code 1 if any worker count got slower than `baseline` by more than `tolerance`."""
+    before = {(run['backend'], run['workers']): run for run in baseline['runs']}
+    status = 0
+    for run in report['runs']:
+        old = before.get((run['backend'], run['workers']))
+        if not old or not old['files_per_second'] or not run['files_per_second']:
+            continue
+        change = run['files_per_second'] / old['files_per_second'] - 1
+        regressed = change < -tolerance
+        status = status or int(regressed)
+        print(f"{run['backend']} x{run['workers']}: {change:+.1%} files/s vs baseline"
+              f"{' REGRESSION' if regressed else ''}", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    main()
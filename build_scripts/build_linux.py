@@ -10,7 +10,7 @@ def build_linux():
     """Build Linux executable."""
 
     args = [
-        str(PROJECT_ROOT / "convertext_gui" / "gui.py"),
+        str(PROJECT_ROOT / "convertext_gui" / "__main__.py"),
         "--name=convertext-gui",
         "--onefile",
         f"--icon={ICON_PATH}" if ICON_PATH.exists() else "",
@@ -14,7 +14,7 @@ def build_macos():
     os.chdir(PROJECT_ROOT)
 
     args = [
-        str(PROJECT_ROOT / "convertext_gui" / "gui.py"),
+        str(PROJECT_ROOT / "convertext_gui" / "__main__.py"),
         "--name=ConverText",
         "--windowed",
         "--onedir",
@@ -10,7 +10,7 @@ def build_windows():
     """Build Windows executable."""
 
     args = [
-        str(PROJECT_ROOT / "convertext_gui" / "gui.py"),
+        str(PROJECT_ROOT / "convertext_gui" / "__main__.py"),
         "--name=ConverText",
         "--noconsole",
         "--onefile",
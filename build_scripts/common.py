@@ -8,6 +8,9 @@ PROJECT_ROOT = Path(__file__).parent.parent
 def get_common_args():
     """PyInstaller arguments shared across all platforms."""
     return [
+        # The entry script is convertext_gui/__main__.py; the package itself resolves from the root
+        f"--paths={PROJECT_ROOT}",
+        "--hidden-import=convertext_gui.gui",
         "--hidden-import=convertext",
         "--hidden-import=convertext.converters",
         "--hidden-import=convertext.core",
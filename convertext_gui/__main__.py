@@ -0,0 +1,7 @@
+"""Allow ``python -m convertext_gui``; also the entry script of frozen builds."""
+
+from convertext_gui.cli import main
+
+# Spawned pool workers import this module again as __mp_main__
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Content-addressed cache of conversion outputs."""
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+CHUNK_SIZE = 1024 * 1024
+# ioctl from <linux/fs.h> (btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+
+
+class ConversionCache:
+    """Conversion outputs stored under ``~/.convertext/cache`` by content key.
+
+    A key covers the source bytes, the target format and every config setting
+    that can change the output. Entries are touched on every hit, so evicting
+    by oldest mtime is least-recently-used. Hits are copied out by default;
+    ``clone=True`` makes copy-on-write clones instead where the filesystem
+    supports them, which is as fast as a hardlink but leaves the target a
+    file of its own, so rewriting it never touches the entry.
+    """
+
+    def __init__(self, root=None, max_bytes=DEFAULT_MAX_BYTES, clone=False):
+        self.root = Path(root) if root else Path.home() / ".convertext" / "cache"
+        self.max_bytes = max_bytes
+        self.clone = clone
+        self._digests = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_digests'] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def key(self, source, fmt, settings):
+        """Cache key for converting `source` to `fmt` under `settings`."""
+        h = hashlib.sha256()
+        h.update(self._digest(source).encode())
+        # Writers derive default titles from the file name
+        h.update(source.stem.encode())
+        h.update(fmt.lower().encode())
+        h.update(json.dumps(settings, sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    def fetch(self, key, fmt, target_path):
+        """Place a cached output at `target_path`; False on a miss."""
+        entry = self._entry_path(key, fmt)
+        if not entry.exists():
+            return False
+        try:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            if target_path.exists():
+                target_path.unlink()
+            if not (self.clone and _clone(entry, target_path)):
+                shutil.copy2(entry, target_path)
+            os.utime(entry)
+            return True
+        except OSError as e:
+            logger.warning("Cache entry %s unusable: %s", entry.name, e)
+            return False
+
+    def store(self, key, fmt, output_path):
+        """Copy a fresh output into the cache (atomic, best-effort)."""
+        entry = self._entry_path(key, fmt)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=entry.parent, suffix=".part")
+            os.close(fd)
+            shutil.copyfile(output_path, tmp)
+            os.replace(tmp, entry)
+        except OSError as e:
+            logger.warning("Could not cache %s: %s", output_path, e)
+
+    def evict(self):
+        """Delete least-recently-used entries until under `max_bytes`."""
+        if not self.root.exists():
+            return 0
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        if removed:
+            logger.info("Cache eviction removed %d entries", removed)
+        return removed
+
+    def _entry_path(self, key, fmt):
+        return self.root / key[:2] / f"{key}.{fmt.lower()}"
+
+    def _digest(self, source):
+        """SHA-256 of the file content, memoized by size and mtime."""
+        stat = source.stat()
+        memo_key = (str(source), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(memo_key)
+        if digest:
+            return digest
+
+        h = hashlib.sha256()
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            self._digests[memo_key] = digest
+        return digest
+
+
+def _clone(source, target):
+    """Copy-on-write clone of `source` at `target`; False where the filesystem cannot."""
+    if sys.platform.startswith("linux"):
+        import fcntl
+        try:
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return True
+        except OSError:
+            try:
+                os.unlink(target)
+            except OSError:
+                pass
+            return False
+    if sys.platform == "darwin":
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            return libc.clonefile(os.fsencode(source), os.fsencode(target), 0) == 0
+        except (OSError, AttributeError):
+            return False
+    return False
+
+
+def cache_settings(config):
+    """Config settings that can change a conversion's output."""
+    settings = {k: v for k, v in config.config.items() if k != 'output'}
+    settings['filename_pattern'] = config.get('output.filename_pattern')
+    return settings
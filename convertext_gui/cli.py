@@ -0,0 +1,275 @@
+"""Command-line entry point, including a headless batch mode.
+
+Headless mode never imports tkinter or ttkbootstrap. It prints one JSON
+object per line to stdout (``start``, one ``result`` per conversion, then
+``done``) and exits 0 when every conversion succeeded, 1 otherwise. With
+``--watch`` it keeps running, printing ``watch`` once and then one such
+batch per group of files that arrived, until Ctrl+C.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+
+def build_parser():
+    """Argument parser shared by GUI and headless modes."""
+    parser = argparse.ArgumentParser(
+        prog="convertext-gui",
+        description="ConverText desktop converter. Use --headless to convert without a window."
+    )
+    parser.add_argument("--headless", action="store_true",
+                        help="convert PATHS without opening a window")
+    parser.add_argument("--formats",
+                        help="comma-separated target formats, e.g. epub,txt")
+    parser.add_argument("--out", type=Path,
+                        help="output directory (default: beside each source)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="parallel workers (default: CPU count)")
+    parser.add_argument("--backend", choices=("thread", "process"), default="thread",
+                        help="worker pool backend (default: thread)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="overwrite existing output files")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only convert files whose outputs are missing or older than their source, "
+                             "rebuilding stale ones")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="do not reuse or store cached outputs")
+    parser.add_argument("--verbose", action="store_true",
+                        help="log progress details to stderr")
+    parser.add_argument("--profile-over", type=float, metavar="SECONDS",
+                        help="save a cProfile dump to ~/.convertext/profiles for files slower than this")
+    parser.add_argument("--stream-over", type=float, default=64, metavar="MB",
+                        help="convert TXT/HTML/Markdown sources at least this large in chunks (default: 64)")
+    parser.add_argument("--memory-budget", type=float, metavar="MB",
+                        help="hold back conversions while estimated and resident memory would exceed this "
+                             "(default: half of RAM; 0 for no limit)")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and convert files as they appear in the PATHS folders "
+                             "(implies --incremental; needs --out)")
+    parser.add_argument("--settle", type=float, default=2.0, metavar="SECONDS",
+                        help="with --watch, how long a file must stay unchanged before it is converted "
+                             "(default: 2)")
+    parser.add_argument("--report", type=Path,
+                        help="write per-conversion metrics to this .csv or .json file "
+                             "(with --watch, written on exit and kept in memory until then)")
+    parser.add_argument("--log-policy", choices=("drop", "block"), default="drop",
+                        help="when the log queue is full, drop records or make callers wait (default: drop)")
+    parser.add_argument("--measure-startup", action="store_true",
+                        help="open the window, print startup timings as JSON and exit")
+    parser.add_argument("paths", nargs="*", metavar="PATHS",
+                        help="files or folders to convert (folders are scanned recursively)")
+    return parser
+
+
+def main(argv=None):
+    """Console-script entry point."""
+    # Process-pool workers re-enter the frozen executable
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.headless:
+        from convertext_gui.gui import main as gui_main
+        return gui_main(measure_startup=args.measure_startup, log_policy=args.log_policy)
+
+    if not args.formats:
+        parser.error("--headless requires --formats")
+    if not args.paths:
+        parser.error("--headless requires at least one path")
+    if args.watch:
+        from convertext_gui.watcher import within
+        if not args.out:
+            parser.error("--watch requires --out, so outputs are not picked up as new sources")
+        if not all(os.path.isdir(path) for path in args.paths):
+            parser.error("--watch takes folders only")
+        if any(within(path, args.out) for path in args.paths):
+            parser.error("--out must not be a watched folder or contain one")
+    sys.exit(run_headless(args))
+
+
+def run_headless(args):
+    """Run one batch, or watch folders, without a display; returns the process exit code."""
+    from convertext_gui.logging_config import install_queue_logging
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setLevel(logging.INFO if args.verbose else logging.WARNING)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    install_queue_logging([handler], args.log_policy)
+
+    from convertext.config import Config
+    from convertext.converters.loader import load_converters
+    from convertext.core import ConversionEngine
+    from convertext_gui.cache import ConversionCache
+    from convertext_gui.incremental import SAVE_INTERVAL, OutputManifest
+    from convertext_gui.jobs import FairScheduler
+    from convertext_gui.memory import MemoryBudget, default_budget
+    from convertext_gui.profiling import ProfileSettings
+    from convertext_gui.scheduler import CostModel
+    from convertext_gui.threads import ConversionThread
+
+    load_converters()
+    formats = [fmt.strip().lower().lstrip('.') for fmt in args.formats.split(",") if fmt.strip()]
+
+    if args.out:
+        args.out.mkdir(parents=True, exist_ok=True)
+
+    budget = default_budget() if args.memory_budget is None else args.memory_budget * 1024 ** 2
+    engine = ConversionEngine(Config())
+    cache = None if args.no_cache else ConversionCache()
+    cost_model = CostModel.load()
+    memory_budget = MemoryBudget(int(budget)) if budget else None
+    incremental = None
+    if args.incremental or args.watch:
+        incremental = OutputManifest.load(save_interval=SAVE_INTERVAL if args.watch else 0.0)
+    # A watch keeps one set of workers (and process pool) for every batch it runs
+    scheduler = FairScheduler(args.workers) if args.watch else None
+
+    def on_progress(progress, status, result):
+        if result is None:
+            return
+        emit({
+            "event": "result",
+            "progress": round(progress, 2),
+            "source": str(result.source_path),
+            "target": str(result.target_path) if result.target_path else None,
+            "success": result.success,
+            "cached": result.cached,
+            "error": result.error,
+            "converter": result.converter,
+            "seconds": round(result.seconds, 4),
+            "cpu_seconds": round(result.cpu_seconds, 4),
+            "peak_rss": result.peak_rss,
+            "memory_bytes": result.memory_bytes,
+            "input_bytes": result.input_bytes,
+            "output_bytes": result.output_bytes,
+        })
+
+    def run_batch(files):
+        emit({"event": "start", "files": len(files), "formats": formats})
+        thread = ConversionThread(
+            engine=engine,
+            files=files,
+            formats=formats,
+            output_dir=args.out,
+            overwrite=args.overwrite,
+            keep_intermediate=False,
+            callback=on_progress,
+            workers=args.workers,
+            backend=args.backend,
+            multi_target=True,
+            cache=cache,
+            cost_model=cost_model,
+            profile=None if args.profile_over is None else ProfileSettings(threshold=args.profile_over),
+            stream_over=int(args.stream_over * 1024 ** 2),
+            memory_budget=memory_budget,
+            scheduler=scheduler,
+            incremental=incremental
+        )
+        thread.start()
+        interrupted = False
+        while thread.is_alive():
+            try:
+                thread.join(0.2)
+            except KeyboardInterrupt:
+                # First Ctrl+C lets in-flight files finish; the batch then reports as cancelled
+                interrupted = True
+                thread.token.cancel()
+
+        failed = sum(1 for r in thread.results if not r.success)
+        emit({
+            "event": "done",
+            "succeeded": len(thread.results) - failed,
+            "failed": failed,
+            "skipped": thread.skipped,
+            "cancelled": thread.cancelled,
+        })
+        return thread, interrupted
+
+    if args.watch:
+        # The watcher's own first walk finds the files already there
+        try:
+            results = watch_folders(args, run_batch)
+        finally:
+            scheduler.shutdown()
+            incremental.flush()
+        code = 0
+    else:
+        thread, _ = run_batch(collect_files(args.paths))
+        results = thread.results
+        code = 1 if thread.cancelled or any(not r.success for r in results) else 0
+
+    if args.report:
+        from convertext_gui.metrics import export_report
+        export_report(results, args.report)
+    return code
+
+
+def watch_folders(args, run_batch):
+    """Convert files arriving in the watched folders until Ctrl+C.
+
+    Returns every result when a ``--report`` will be written and nothing
+    otherwise, so a long-running watch does not accumulate records.
+    """
+    import queue
+    from convertext_gui.scanner import supported_extensions
+    from convertext_gui.watcher import FolderWatcher
+
+    ready = queue.Queue()
+    watcher = FolderWatcher(args.paths, supported_extensions(), on_ready=ready.put,
+                            settle=args.settle, exclude=[args.out])
+    watcher.start()
+    emit({"event": "watch", "folders": watcher.roots, "backend": watcher.backend})
+
+    results = []
+    try:
+        while True:
+            try:
+                files = ready.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            # One batch at a time; files settling meanwhile make up the next one
+            thread, interrupted = run_batch([Path(path) for path in files])
+            if args.report:
+                results.extend(thread.results)
+            if interrupted:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+    emit({"event": "stopped"})
+    return results
+
+
+def collect_files(paths):
+    """Expand folders to the supported files inside them; files pass through."""
+    from convertext_gui.scanner import FolderScanThread, supported_extensions
+
+    files = []
+    folders = []
+    for path in paths:
+        (folders if os.path.isdir(path) else files).append(Path(path))
+
+    if folders:
+        found = []
+        FolderScanThread(folders, supported_extensions(),
+                         on_batch=lambda batch, _: found.extend(batch)).run()
+        files.extend(Path(p) for p in found)
+
+    return list(dict.fromkeys(files))
+
+
+def emit(event):
+    """Write one machine-readable progress line."""
+    sys.stdout.write(json.dumps(event) + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""Per-file conversion units shared by every ConversionThread backend."""
+
+import copy
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Writers that take the parsed Document directly: method name and whether it
+# also needs (config, default_title).
+IN_MEMORY_WRITERS = {
+    'txt': ('_write_txt', False),
+    'html': ('_write_html', False),
+    'md': ('_write_md', False),
+    'epub': ('_create_epub', True),
+    'fb2': ('_create_fb2', True),
+}
+
+
+@dataclass
+class ConversionRecord:
+    """Small picklable summary of one conversion."""
+
+    success: bool
+    source_path: Path
+    target_path: Optional[Path]
+    error: Optional[str] = None
+    cached: bool = False
+    seconds: float = 0.0
+    target_format: str = ""
+    cpu_seconds: float = 0.0
+    peak_rss: Optional[int] = None
+    input_bytes: int = 0
+    output_bytes: int = 0
+    converter: str = ""
+    memory_bytes: Optional[int] = None
+
+
+def convert_pair(engine, file, fmt):
+    """Convert one file to one format, never raising."""
+    logger.debug("Converting %s to %s", file.name, fmt)
+    start = time.perf_counter()
+    cpu_start = time.thread_time()
+
+    try:
+        result = engine.convert(file, fmt)
+        return ConversionRecord(
+            success=bool(result.success),
+            source_path=file,
+            target_path=result.target_path,
+            error=result.error,
+            seconds=time.perf_counter() - start,
+            cpu_seconds=time.thread_time() - cpu_start,
+            converter=_converter_name(engine, getattr(result, 'conversion_path', None))
+        )
+    except Exception as e:
+        logger.exception("Conversion failed for %s to %s: %s", file.name, fmt, e)
+        return ConversionRecord(
+            success=False,
+            source_path=file,
+            target_path=None,
+            error=str(e),
+            seconds=time.perf_counter() - start,
+            cpu_seconds=time.thread_time() - cpu_start
+        )
+
+
+def _converter_name(engine, conversion_path):
+    """Converter class(es) used along a conversion path, e.g. "PDFConverter → TXTConverter"."""
+    if not conversion_path:
+        return ""
+    try:
+        names = [type(engine.registry.get_converter(src, tgt)).__name__
+                 for src, tgt in zip(conversion_path, conversion_path[1:])]
+    except Exception:
+        return ""
+    return " → ".join(names)
+
+
+def convert_source(engine, file, formats, keep_intermediate=False, cache=None, profile=None,
+                   stream_over=None, measure_memory=False):
+    """Convert one file to every format in `formats`, parsing it only once.
+
+    Targets whose converter can write straight from the intermediate Document
+    share a single parse; any other target (multi-hop routes, binary ebook
+    writers) falls back to a regular `engine.convert` call. With a `cache`,
+    targets already converted from identical content are copied out of it
+    instead. With `profile` (see `convertext_gui.profiling.ProfileSettings`)
+    the conversion runs under cProfile and slow ones leave a profile behind.
+    Sources of at least `stream_over` bytes are converted in chunks (see
+    `convertext_gui.streaming`) for the targets that support it. Set
+    `measure_memory` only when nothing else converts in this process
+    meanwhile: the unit's `memory_bytes` is read from process-wide RSS.
+    Returns one record per format, in `formats` order.
+    """
+    records = {}
+    keys = {}
+    if cache is not None:
+        for fmt in formats:
+            keys[fmt], record = _fetch_cached(engine, cache, file, fmt)
+            if record:
+                records[fmt] = record
+
+    from convertext_gui.memory import process_rss
+    from convertext_gui.metrics import peak_rss_bytes
+
+    rss_before = process_rss() if measure_memory else None
+    peak_before = peak_rss_bytes()
+    pending = [fmt for fmt in formats if fmt not in records]
+    if profile is not None and pending:
+        from convertext_gui.profiling import run_profiled
+        converted = run_profiled(profile, file, pending,
+                                 lambda: _convert_pending(engine, file, pending, keep_intermediate, stream_over))
+    else:
+        converted = _convert_pending(engine, file, pending, keep_intermediate, stream_over)
+
+    for fmt, record in zip(pending, converted):
+        records[fmt] = record
+        if cache is not None and keys[fmt] and record.success and record.target_path:
+            cache.store(keys[fmt], fmt, record.target_path)
+
+    input_bytes = _file_size(file)
+    peak_rss = peak_rss_bytes()
+    # Growth is only known when this unit raised the high-water mark
+    memory_bytes = None
+    if pending and rss_before is not None and peak_before is not None and peak_rss > peak_before:
+        memory_bytes = peak_rss - rss_before
+    for fmt in formats:
+        record = records[fmt]
+        record.target_format = fmt
+        record.input_bytes = input_bytes
+        record.peak_rss = peak_rss
+        if not record.cached:
+            record.memory_bytes = memory_bytes
+        if record.success and record.target_path:
+            record.output_bytes = _file_size(record.target_path)
+        if record.cached:
+            record.converter = "cache"
+    return [records[fmt] for fmt in formats]
+
+
+def _file_size(path):
+    try:
+        return path.stat().st_size
+    except (OSError, TypeError):
+        return 0
+
+
+def _fetch_cached(engine, cache, file, fmt):
+    """(cache key, record) for `fmt`; the record is None on a miss."""
+    from convertext_gui.cache import cache_settings
+
+    try:
+        config = _effective_config(engine, file)
+        key = cache.key(file, fmt, cache_settings(config))
+        target_path = engine._get_target_path(file, fmt, config)
+    except Exception as e:
+        logger.debug("Cache lookup skipped for %s: %s", file.name, e)
+        return None, None
+
+    if target_path.exists() and not config.get('output.overwrite', False):
+        return key, None
+    if cache.fetch(key, fmt, target_path):
+        logger.debug("Cache hit: %s → %s", file.name, target_path.name)
+        return key, ConversionRecord(success=True, source_path=file, target_path=target_path, cached=True)
+    return key, None
+
+
+def streamed_formats(engine, file, formats, stream_over, size=None):
+    """The subset of `formats` that will be streamed for `file`."""
+    if stream_over is None or not formats:
+        return []
+    if (_file_size(file) if size is None else size) < stream_over:
+        return []
+    from convertext_gui.streaming import can_stream
+    return [fmt for fmt in formats if can_stream(engine, file, fmt)]
+
+
+def _convert_pending(engine, file, formats, keep_intermediate, stream_over):
+    """Records for `formats`, streaming large sources where possible."""
+    streamed = streamed_formats(engine, file, formats, stream_over)
+    if not streamed:
+        return _convert_formats(engine, file, formats, keep_intermediate)
+
+    from convertext_gui.streaming import stream_convert
+
+    rest = [fmt for fmt in formats if fmt not in streamed]
+    records = dict(zip(rest, _convert_formats(engine, file, rest, keep_intermediate)))
+    for fmt in streamed:
+        records[fmt] = stream_convert(engine, file, fmt)
+    return [records[fmt] for fmt in formats]
+
+
+def _convert_formats(engine, file, formats, keep_intermediate):
+    """Records for `formats`, sharing one parse where the writers allow it."""
+    if len(formats) < 2:
+        return [convert_pair(engine, file, fmt) for fmt in formats]
+
+    writers = {}
+    for fmt in formats:
+        writer = _in_memory_writer(engine, file, fmt)
+        if writer:
+            writers[fmt] = writer
+
+    doc = config = None
+    parse_seconds = parse_cpu = 0.0
+    if len(writers) > 1:
+        try:
+            start = time.perf_counter()
+            cpu_start = time.thread_time()
+            config = _effective_config(engine, file)
+            from convertext.converters.readers import read_source
+            doc = read_source(file, config.config)
+            parse_seconds = time.perf_counter() - start
+            parse_cpu = time.thread_time() - cpu_start
+            logger.debug("Parsed %s once for %s", file.name, sorted(writers))
+        except Exception as e:
+            logger.debug("Shared parse of %s unavailable (%s); converting per format", file.name, e)
+
+    if doc is not None and keep_intermediate:
+        _save_intermediate(doc, file)
+
+    records = []
+    remaining = [fmt for fmt in formats if doc is not None and fmt in writers]
+    for fmt in formats:
+        if doc is None or fmt not in writers:
+            records.append(convert_pair(engine, file, fmt))
+            continue
+        remaining.remove(fmt)
+        # Writers may annotate the Document; only the last one gets the original
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        target_doc = copy.deepcopy(doc) if remaining else doc
+        record = _write_from_document(engine, writers[fmt], target_doc, file, fmt, config)
+        # Each shared-parse target is charged an equal share of the parse
+        record.seconds = time.perf_counter() - start + parse_seconds / len(writers)
+        record.cpu_seconds = time.thread_time() - cpu_start + parse_cpu / len(writers)
+        record.converter = type(writers[fmt][0]).__name__
+        records.append(record)
+    return records
+
+
+def _in_memory_writer(engine, file, fmt):
+    """(converter, method, takes_config) for a direct Document write, or None."""
+    if fmt not in IN_MEMORY_WRITERS:
+        return None
+    converter = engine.registry.get_converter(file.suffix.lstrip('.').lower(), fmt)
+    if converter is None:
+        return None
+    method, takes_config = IN_MEMORY_WRITERS[fmt]
+    if not hasattr(converter, method):
+        return None
+    return converter, method, takes_config
+
+
+def _effective_config(engine, file):
+    """Per-file config exactly as `engine.convert` would build it."""
+    if hasattr(engine, '_effective_config'):
+        return engine._effective_config(file)
+    return engine.config
+
+
+def _write_from_document(engine, writer, doc, file, fmt, config):
+    """Write one target from an already parsed Document, never raising."""
+    converter, method, takes_config = writer
+    target_path = engine._get_target_path(file, fmt, config)
+
+    if target_path.exists() and not config.get('output.overwrite', False):
+        return ConversionRecord(
+            success=False,
+            source_path=file,
+            target_path=target_path,
+            error="Target file already exists (use --overwrite)"
+        )
+
+    try:
+        converter._apply_metadata_overrides(doc, file, config.config)
+        if takes_config:
+            ok = getattr(converter, method)(doc, target_path, config.config, target_path.stem)
+        else:
+            ok = getattr(converter, method)(doc, target_path)
+        return ConversionRecord(
+            success=bool(ok),
+            source_path=file,
+            target_path=target_path,
+            error=None if ok else "Conversion failed"
+        )
+    except Exception as e:
+        logger.exception("Conversion failed for %s to %s: %s", file.name, fmt, e)
+        return ConversionRecord(
+            success=False,
+            source_path=file,
+            target_path=target_path,
+            error=str(e)
+        )
+
+
+def _save_intermediate(doc, file):
+    """Write the parsed Document next to its source for inspection."""
+    path = file.parent / f"{file.stem}_intermediate.json"
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'metadata': doc.metadata,
+                'toc': doc.toc,
+                'content': doc.content,
+                'images': {name: {'format': image.get('format'), 'bytes': len(image.get('data') or b'')}
+                           for name, image in doc.images.items()},
+            }, f, ensure_ascii=False, indent=1, default=str)
+        logger.debug("Intermediate document saved: %s", path)
+    except OSError as e:
+        logger.warning("Could not save intermediate document %s: %s", path, e)
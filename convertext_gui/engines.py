@@ -0,0 +1,76 @@
+"""Conversion engines per configuration snapshot."""
+
+import copy
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# Distinct option sets kept warm; batches rarely use more than a handful
+MAX_ENGINES = 8
+
+
+def snapshot_key(overrides):
+    """Hashable, order-independent identity of a set of config overrides."""
+    return json.dumps(overrides or {}, sort_keys=True, default=str)
+
+
+def merge_overrides(base, update):
+    """Deep-merged copy of two override dicts; `update` wins."""
+    merged = copy.deepcopy(base or {})
+    for key, value in (update or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_overrides(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def engine_with_overrides(engine, overrides):
+    """A new engine sharing `engine`'s base config and registry, with extra overrides.
+
+    The base Config is never modified: `ConversionEngine` applies overrides
+    to a fresh per-file copy, so engines for different option sets can run
+    side by side.
+    """
+    from convertext.core import ConversionEngine
+
+    return ConversionEngine(engine.config, keep_intermediate=engine.keep_intermediate,
+                            overrides=merge_overrides(engine.overrides, overrides))
+
+
+class EnginePool:
+    """Engines built on one base config, reused per override snapshot.
+
+    `get` returns the same engine for equal overrides, so repeated batches
+    with the same options skip engine construction, while batches with
+    different options never share (or mutate) each other's settings. The
+    least recently used engines are dropped beyond `max_engines`.
+    """
+
+    def __init__(self, config, max_engines=MAX_ENGINES):
+        self.config = config
+        self.max_engines = max_engines
+        self._engines = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, overrides=None, keep_intermediate=False):
+        """Engine for `overrides` (a deep copy is kept, so later edits do not leak in)."""
+        key = (snapshot_key(overrides), keep_intermediate)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                return engine
+
+            from convertext.core import ConversionEngine
+
+            engine = ConversionEngine(self.config, keep_intermediate=keep_intermediate,
+                                      overrides=copy.deepcopy(overrides or {}))
+            self._engines[key] = engine
+            logger.debug("Built engine for config snapshot %s", key[0])
+            while len(self._engines) > self.max_engines:
+                self._engines.popitem(last=False)
+            return engine
@@ -1,28 +1,57 @@
 """Main GUI application."""
 
+import time
+
+# Startup clock: imports and window timings are measured from here
+STARTUP_T0 = time.perf_counter()
+
+import os
 import sys
+import json
 import logging
+import threading
+from datetime import datetime
 from pathlib import Path
 import tkinter as tk
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import queue
 
-from convertext.converters.loader import load_converters
-from convertext.config import Config
-from convertext.core import ConversionEngine
-from convertext.registry import get_registry
-
-from convertext_gui.widgets import DropZone, FileList, DebugConsole
+from convertext_gui.widgets import DropZone, FileList, DebugConsole, MetricsPanel, JobQueuePanel
+from convertext_gui.cache import ConversionCache
+from convertext_gui.engines import EnginePool
+from convertext_gui.incremental import SAVE_INTERVAL, OutputManifest
+from convertext_gui.jobs import PRIORITIES, FairScheduler, Job, JobQueue
+from convertext_gui.journal import BatchJournal, discard, unfinished
+from convertext_gui.manifest import load_manifest, save_manifest
+from convertext_gui.memory import MemoryBudget, default_budget
+from convertext_gui.profiling import PROFILE_DIR, ProfileSettings
+from convertext_gui.progress import ProgressChannel, RateMeter
+from convertext_gui.scheduler import CostModel
+from convertext_gui.scanner import FolderScanThread
+from convertext_gui.watcher import FolderWatcher, within
 from convertext_gui.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
 
+IMPORTS_DONE = time.perf_counter()
+
+# At most one progress refresh per frame (~30 fps) while a batch runs
+FRAME_MS = 33
+# Queued batches started alongside the one driving the progress bar, and how often they are polled
+MAX_BACKGROUND_JOBS = 3
+JOB_POLL_MS = 250
+WATCH_POLL_MS = 500
+
 
 class ConvertExtGUI(ttk.Window):
-    """Main GUI window for ConverText."""
+    """Main GUI window for ConverText.
 
-    def __init__(self):
+    Converters are discovered on a background thread so the window appears
+    immediately; the format panel shows a loading state until they are ready.
+    """
+
+    def __init__(self, measure_startup=False, log_policy="drop"):
         super().__init__(
             themename="darkly",  # Start with dark theme
             title="ConverText",
@@ -103,30 +132,58 @@ class ConvertExtGUI(ttk.Window):
 
         # Setup logging
         self.debug_mode = False
-        self.log_file = setup_logging(self.debug_mode)
-        logger.info(f"Starting ConverText GUI v{self._get_version()}")
-        logger.info(f"Debug mode: {self.debug_mode}")
-        logger.info(f"Log file: {self.log_file}")
-
-        # Initialize convertext
-        load_converters()
-        self.convertext_config = Config()
-        self.engine = ConversionEngine(self.convertext_config)
+        self.log_policy = log_policy
+        self.log_file = setup_logging(self.debug_mode, self.log_policy)
+        logger.info("Starting ConverText GUI v%s", self._get_version())
+        logger.info("Debug mode: %s", self.debug_mode)
+        logger.info("Log file: %s", self.log_file)
+
+        # Convertext is loaded in the background (see _start_converter_loading)
+        self.convertext_config = None
+        self.engine = None
+        self.engine_pool = None
+        self.cache = ConversionCache()
+        self.memory_budget = None
+        self.measure_startup = measure_startup
+        self.startup_times = {'imports_ms': round((IMPORTS_DONE - STARTUP_T0) * 1000, 1)}
 
         # State
         self.format_vars = {}
+        self.known_formats = None
         self.output_dir = None
         self.debug_console = None
-        self.progress_queue = queue.Queue()
+        self.progress_channel = ProgressChannel()
+        self.progress_meter = None
+        self.conversion_thread = None
+        self.last_results = []
+        self._quit_pending = False
+        self.scan_queue = queue.Queue()
+        self.scan_threads = []
+        self.pending_folders = []
+        self.loader_queue = queue.Queue()
+        self.jobs = JobQueue.load()
+        self.scheduler = None
+        self.cost_model = None
+        self.output_manifest = None
+        self.foreground_job = None
+        self.job_threads = {}  # job id -> ConversionThread
+        self.job_channels = {}  # job id -> ProgressChannel, background jobs only
+        self.job_panel = None
+        self._jobs_polling = False
+        self.watch_queue = queue.Queue()
+        self.watchers = {}  # folder -> (FolderWatcher, job options)
+        self.watch_jobs = {}  # folder -> its newest Job
+        self._watch_polling = False
 
         # Build UI
         self._create_widgets()
         self._bind_shortcuts()
         self._create_menu()
         self._center_window()
+        self.protocol("WM_DELETE_WINDOW", self.request_quit)
 
-        # Start queue processor
-        self._process_progress_queue()
+        self._start_converter_loading()
+        self.after(0, self._on_window_shown)
 
     def _get_version(self):
         """Get application version."""
@@ -159,17 +216,39 @@ class ConvertExtGUI(ttk.Window):
         self._create_progress_section()
 
     def _create_format_section(self):
-        """Create format selection checkboxes."""
-        frame = ttk.Labelframe(
+        """Create the format panel from the cached manifest, or in its loading state."""
+        self.format_frame = ttk.Labelframe(
             self,
             text="Output Formats",
             padding=13
         )
-        frame.pack(fill=X, padx=21, pady=13)
+        self.format_frame.pack(fill=X, padx=21, pady=13)
+
+        self.formats_loading_label = None
+        manifest = load_manifest()
+        if manifest:
+            logger.debug("Format panel built from manifest: %d source formats", len(manifest))
+            self._populate_formats(manifest)
+            return
 
-        # Get available formats from registry
-        registry = get_registry()
-        formats = registry.list_supported_formats()
+        self.formats_loading_label = ttk.Label(
+            self.format_frame,
+            text="Loading formats...",
+            font=("Monaco", 10)
+        )
+        self.formats_loading_label.pack(anchor=W)
+
+    def _populate_formats(self, formats):
+        """Create format selection checkboxes from source -> targets, keeping existing selections."""
+        if self.formats_loading_label:
+            self.formats_loading_label.destroy()
+            self.formats_loading_label = None
+
+        selected = {fmt for fmt, var in self.format_vars.items() if var.get()}
+        for child in self.format_frame.winfo_children():
+            child.destroy()
+        self.format_vars = {}
+        self.known_formats = formats
 
         # Unique target formats
         all_targets = set()
@@ -180,10 +259,10 @@ class ConvertExtGUI(ttk.Window):
         row_frame = None
         for i, fmt in enumerate(sorted(all_targets)):
             if i % 3 == 0:
-                row_frame = ttk.Frame(frame)
+                row_frame = ttk.Frame(self.format_frame)
                 row_frame.pack(fill=X, pady=2)
 
-            var = tk.BooleanVar()
+            var = tk.BooleanVar(value=fmt in selected)
             self.format_vars[fmt] = var
 
             cb = ttk.Checkbutton(
@@ -193,6 +272,89 @@ class ConvertExtGUI(ttk.Window):
             )
             cb.pack(side=LEFT, padx=13)
 
+    def _start_converter_loading(self):
+        """Discover converters and build the engine on a background thread."""
+        def load():
+            try:
+                from convertext.converters.loader import load_converters
+                from convertext.config import Config
+                from convertext.core import ConversionEngine
+                from convertext.registry import get_registry
+
+                load_converters()
+                config = Config()
+                self.loader_queue.put((config, ConversionEngine(config),
+                                       get_registry().list_supported_formats(), None))
+            except Exception as e:
+                logger.exception("Loading converters failed: %s", e)
+                self.loader_queue.put((None, None, {}, e))
+
+        self.convert_btn.configure(state="disabled", text="Loading...")
+        threading.Thread(target=load, name="load-converters", daemon=True).start()
+        self._check_converters_loaded()
+
+    def _check_converters_loaded(self):
+        """Poll for the loader result (runs in main thread) and stop once it arrives."""
+        try:
+            config, engine, formats, error = self.loader_queue.get_nowait()
+        except queue.Empty:
+            self.after(20, self._check_converters_loaded)
+            return
+
+        if error:
+            if self.formats_loading_label:
+                self.formats_loading_label.configure(text=f"Could not load formats: {error}")
+            self.convert_btn.configure(text="Unavailable")
+            return
+
+        self.convertext_config = config
+        self.engine = engine
+        self.engine_pool = EnginePool(config)
+        if formats != self.known_formats:
+            # No manifest yet, or the installed converters changed since it was written
+            if self.known_formats is not None:
+                logger.info("Format manifest out of date; rebuilding format panel")
+            self._populate_formats(formats)
+            save_manifest(formats)
+        self.convert_btn.configure(state="normal", text="Convert")
+        self.queue_btn.configure(state="normal")
+        self._record_startup('formats_ms')
+        logger.info("Converters loaded: %d source formats", len(formats))
+
+        if self.pending_folders:
+            folders, self.pending_folders = self.pending_folders, []
+            self._scan_folders(folders)
+
+        if self.measure_startup:
+            print(json.dumps(self.startup_times), flush=True)
+            self.after(0, self.quit)
+            return
+
+        # Batches left queued last session carry on; interrupted ones only if the user agrees
+        self._offer_resume()
+        self._start_queued_jobs()
+
+    def _on_window_shown(self):
+        """First event-loop turn: the window is on screen."""
+        self._record_startup('window_ms')
+
+    def _record_startup(self, key):
+        """Record a startup milestone; all milestones are appended to ~/.convertext/startup.jsonl."""
+        self.startup_times[key] = round((time.perf_counter() - STARTUP_T0) * 1000, 1)
+        logger.info("Startup %s: %s", key, self.startup_times[key])
+        if 'window_ms' in self.startup_times and 'formats_ms' in self.startup_times:
+            entry = {
+                'version': self._get_version(),
+                'frozen': bool(getattr(sys, 'frozen', False)),
+                'date': datetime.now().isoformat(timespec='seconds'),
+                **self.startup_times,
+            }
+            try:
+                with open(Path.home() / ".convertext" / "startup.jsonl", 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                logger.debug("Could not record startup time: %s", e)
+
     def _create_output_section(self):
         """Create output directory selector."""
         frame = ttk.Frame(self)
@@ -234,6 +396,96 @@ class ConvertExtGUI(ttk.Window):
         )
         overwrite_cb.pack(anchor=W, pady=8)
 
+        self.incremental_var = tk.BooleanVar(value=False)
+        incremental_cb = ttk.Checkbutton(
+            frame,
+            text="Only convert files whose outputs are out of date",
+            variable=self.incremental_var
+        )
+        incremental_cb.pack(anchor=W, pady=8)
+
+        self.multi_target_var = tk.BooleanVar(value=True)
+        multi_target_cb = ttk.Checkbutton(
+            frame,
+            text="Read each file once for all formats",
+            variable=self.multi_target_var
+        )
+        multi_target_cb.pack(anchor=W, pady=8)
+
+        self.cache_var = tk.BooleanVar(value=True)
+        cache_cb = ttk.Checkbutton(
+            frame,
+            text="Reuse cached results for unchanged files",
+            variable=self.cache_var
+        )
+        cache_cb.pack(anchor=W, pady=8)
+
+        # Parallel workers
+        workers_row = ttk.Frame(frame)
+        workers_row.pack(fill=X, pady=8)
+
+        ttk.Label(workers_row, text="Parallel workers:").pack(side=LEFT)
+
+        self.workers_var = tk.IntVar(value=os.cpu_count() or 1)
+        workers_spin = ttk.Spinbox(
+            workers_row,
+            from_=1,
+            to=max(64, os.cpu_count() or 1),
+            textvariable=self.workers_var,
+            width=4,
+            font=("Monaco", 13)
+        )
+        workers_spin.pack(side=LEFT, padx=(13, 0))
+
+        ttk.Label(workers_row, text="Backend:").pack(side=LEFT, padx=(21, 0))
+
+        self.backend_var = tk.StringVar(value="thread")
+        backend_combo = ttk.Combobox(
+            workers_row,
+            textvariable=self.backend_var,
+            values=["thread", "process"],
+            state="readonly",
+            width=8,
+            font=("Monaco", 13)
+        )
+        backend_combo.pack(side=LEFT, padx=(13, 0))
+
+        # Large files
+        stream_row = ttk.Frame(frame)
+        stream_row.pack(fill=X, pady=8)
+
+        self.stream_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            stream_row,
+            text="Stream text files over",
+            variable=self.stream_var
+        ).pack(side=LEFT)
+
+        self.stream_threshold_var = tk.StringVar(value="64")
+        ttk.Spinbox(
+            stream_row,
+            from_=1,
+            to=100000,
+            increment=16,
+            width=6,
+            textvariable=self.stream_threshold_var
+        ).pack(side=LEFT, padx=(5, 0))
+        ttk.Label(stream_row, text="MB").pack(side=LEFT, padx=(3, 0))
+
+        ttk.Label(stream_row, text="Memory budget:").pack(side=LEFT, padx=(21, 0))
+
+        budget = default_budget()
+        self.memory_budget_var = tk.StringVar(value=str(budget // 1024 ** 2) if budget else "")
+        ttk.Spinbox(
+            stream_row,
+            from_=0,
+            to=1024 ** 2,
+            increment=512,
+            width=7,
+            textvariable=self.memory_budget_var
+        ).pack(side=LEFT, padx=(5, 0))
+        ttk.Label(stream_row, text="MB").pack(side=LEFT, padx=(3, 0))
+
         # Debug options
         debug_row = ttk.Frame(frame)
         debug_row.pack(fill=X, pady=8)
@@ -247,6 +499,25 @@ class ConvertExtGUI(ttk.Window):
         )
         debug_cb.pack(side=LEFT)
 
+        self.profile_var = tk.BooleanVar(value=False)
+        profile_cb = ttk.Checkbutton(
+            debug_row,
+            text="Profile conversions over",
+            variable=self.profile_var
+        )
+        profile_cb.pack(side=LEFT, padx=(13, 0))
+
+        self.profile_threshold_var = tk.StringVar(value="5")
+        ttk.Spinbox(
+            debug_row,
+            from_=0,
+            to=3600,
+            increment=1,
+            width=4,
+            textvariable=self.profile_threshold_var
+        ).pack(side=LEFT, padx=(5, 0))
+        ttk.Label(debug_row, text="s").pack(side=LEFT, padx=(3, 0))
+
         self.keep_intermediate_var = tk.BooleanVar(value=False)
         keep_cb = ttk.Checkbutton(
             debug_row,
@@ -264,7 +535,46 @@ class ConvertExtGUI(ttk.Window):
             style='Convert.TButton',
             width=21
         )
-        self.convert_btn.pack(pady=21)
+        self.convert_btn.pack(pady=(21, 8))
+
+        controls = ttk.Frame(self)
+        controls.pack()
+
+        self.pause_btn = ttk.Button(
+            controls,
+            text="Pause",
+            command=self.toggle_pause,
+            state="disabled",
+            width=10
+        )
+        self.pause_btn.pack(side=LEFT, padx=8)
+
+        self.cancel_btn = ttk.Button(
+            controls,
+            text="Cancel",
+            command=self.cancel_conversion,
+            state="disabled",
+            width=10
+        )
+        self.cancel_btn.pack(side=LEFT, padx=8)
+
+        self.queue_btn = ttk.Button(
+            controls,
+            text="Add to Queue",
+            command=self.queue_conversion,
+            state="disabled",
+            width=13
+        )
+        self.queue_btn.pack(side=LEFT, padx=8)
+
+        self.priority_var = tk.StringVar(value="normal")
+        ttk.Combobox(
+            controls,
+            textvariable=self.priority_var,
+            values=list(PRIORITIES),
+            state="readonly",
+            width=7
+        ).pack(side=LEFT)
 
     def _create_progress_section(self):
         """Create progress bar and status."""
@@ -304,14 +614,58 @@ class ConvertExtGUI(ttk.Window):
         )
         self.status_label.pack(anchor=W)
 
-    def _on_files_dropped(self, files):
-        """Handle files dropped or selected."""
-        self.file_list.add_files(files)
-        self._update_output_from_files()
+    def _on_files_dropped(self, paths):
+        """Handle files or folders dropped or selected."""
+        files = []
+        folders = []
+        for path in paths:
+            (folders if os.path.isdir(path) else files).append(path)
+
+        if files:
+            self.file_list.add_files(files)
+            self._update_output_from_files()
+        if folders:
+            if self.known_formats is None:
+                # Extension filter needs the formats; scan once converters are loaded
+                self.pending_folders.extend(folders)
+                self.status_label.configure(text="Scanning folders once formats are loaded...")
+            else:
+                self._scan_folders(folders)
+
+    def _scan_folders(self, folders):
+        """Scan folder trees in the background, streaming files into the list."""
+        thread = FolderScanThread(
+            folders,
+            set(self.known_formats),
+            on_batch=lambda paths, found: self.scan_queue.put(paths)
+        )
+        if not self.scan_threads:
+            self.after(50, self._process_scan_queue)
+        self.scan_threads.append(thread)
+        self.status_label.configure(text="Scanning folders...")
+        thread.start()
+
+    def _process_scan_queue(self):
+        """Add scanned batches to the file list (runs in main thread)."""
+        # Check liveness before draining so a finished scan's last batch is never missed
+        active = [t for t in self.scan_threads if t.is_alive()]
+        try:
+            while True:
+                self.file_list.add_files(self.scan_queue.get_nowait())
+        except queue.Empty:
+            pass
+        self.scan_threads = active
+
+        if self.scan_threads:
+            self.status_label.configure(text=f"Scanning folders... {len(self.file_list)} files")
+            self.after(50, self._process_scan_queue)
+        else:
+            self.status_label.configure(text=f"{len(self.file_list)} files selected")
+            self._update_output_from_files()
 
     def _update_output_from_files(self):
         """Update output path based on first selected file."""
-        if self.file_list.files:
+        if len(self.file_list):
             # Default to first file's directory
             first_file = self.file_list.files[0]
             self.output_dir = first_file.parent
@@ -333,56 +687,507 @@ class ConvertExtGUI(ttk.Window):
 
     def start_conversion(self):
         """Start conversion process."""
+        job = self._new_job()
+        if job is None:
+            return
+
+        # Disable UI
+        self._set_running(True)
+        self.progress_bar['value'] = 0
+
+        logger.info("Starting conversion: %d files to %s", len(job.files), job.formats)
+        job.state = "running"
+        self.jobs.add(job)
+        self.jobs.save()
+        self.foreground_job = job
+        self.progress_channel = ProgressChannel()
+        self.progress_meter = RateMeter(self.progress_channel)
+        self.conversion_thread = self._start_job_thread(job, self._on_conversion_progress)
+        self._refresh_job_panel()
+        self.after(FRAME_MS, self._process_progress)
+
+    def queue_conversion(self):
+        """Submit the current selection as a batch of its own, run alongside others."""
+        job = self._new_job()
+        if job is None:
+            return
+        self.jobs.add(job)
+        self.jobs.save()
+        logger.info("Queued batch %s: %d files to %s (%s priority)",
+                    job.id, len(job.files), job.formats, job.priority)
+        self.status_label.configure(text=f"Queued {job.name} ({job.priority} priority)")
+        self._start_queued_jobs()
+        self._refresh_job_panel()
+
+    def _new_job(self):
+        """Job for the current files and options, or None (with a message) if incomplete."""
+        if self.engine is None:
+            return None
+
         # Validate
-        if not self.file_list.files:
+        files = self.file_list.files
+        if not files:
             self._show_error("No files selected", "Please add files to convert.")
-            return
+            return None
 
         selected_formats = [fmt for fmt, var in self.format_vars.items() if var.get()]
         if not selected_formats:
             self._show_error("No formats selected", "Please select at least one output format.")
-            return
-
-        # Disable UI
-        self.convert_btn.configure(state="disabled", text="Converting...")
-        self.progress_bar['value'] = 0
+            return None
 
-        # Start thread
-        from convertext_gui.threads import ConversionThread
-        logger.info(f"Starting conversion: {len(self.file_list.files)} files to {selected_formats}")
-        thread = ConversionThread(
-            engine=self.engine,
-            files=self.file_list.files,
+        return Job(
+            files=files,
             formats=selected_formats,
             output_dir=self.output_dir,
             overwrite=self.overwrite_var.get(),
             keep_intermediate=self.keep_intermediate_var.get(),
-            callback=self._on_conversion_progress
+            multi_target=self.multi_target_var.get(),
+            incremental=self.incremental_var.get(),
+            priority=self.priority_var.get(),
+            **self._run_settings()
+        )
+
+    def _run_settings(self):
+        """Backend, workers, cache, streaming and profiling options a new job keeps."""
+        return dict(backend=self.backend_var.get(), workers=self._get_workers(), cache=self.cache_var.get(),
+                    stream_over=self._get_stream_threshold(), profile_threshold=self._get_profile_threshold())
+
+    def _start_job_thread(self, job, callback):
+        """Start a ConversionThread for `job` on the shared scheduler, with the settings it was submitted with."""
+        from convertext_gui.threads import ConversionThread
+
+        thread = ConversionThread(
+            engine=self.engine,
+            files=job.files,
+            formats=job.formats,
+            output_dir=job.output_dir,
+            overwrite=job.overwrite,
+            keep_intermediate=job.keep_intermediate,
+            callback=callback,
+            workers=job.workers,
+            backend=job.backend,
+            multi_target=job.multi_target,
+            cache=self.cache if job.cache else None,
+            cost_model=self._get_cost_model(),
+            profile=ProfileSettings(threshold=job.profile_threshold) if job.profile_threshold is not None else None,
+            stream_over=job.stream_over,
+            memory_budget=self._get_memory_budget(),
+            engine_pool=self.engine_pool,
+            scheduler=self._get_scheduler(job),
+            weight=job.weight,
+            journal=BatchJournal.open(job.id, job.files, job.formats, job.options),
+            incremental=self._get_output_manifest() if job.incremental else None
         )
+        self.job_threads[job.id] = thread
+        job.completed = len(thread.journal.completed)
+        job.failed = 0
         thread.start()
+        return thread
 
-    def _on_conversion_progress(self, progress, status, result):
-        """Update UI from conversion thread."""
-        self.progress_queue.put((progress, status, result))
+    def _offer_resume(self):
+        """Ask whether to resume batches a crash or quit left unfinished."""
+        # Journals whose job record was lost still describe their batch
+        for journal in unfinished():
+            if self.jobs.get(journal.batch_id) is None:
+                self.jobs.add(Job.from_journal(journal.header))
+
+        interrupted = [job for job in self.jobs.jobs if job.state == "interrupted"]
+        if not interrupted:
+            return
 
-    def _process_progress_queue(self):
-        """Process queued progress updates (runs in main thread)."""
+        from tkinter import messagebox
+        names = "\n".join(f"• {job.name}" for job in interrupted[:5])
+        resume = messagebox.askyesno(
+            "Resume Interrupted Batches",
+            f"{len(interrupted)} batch(es) did not finish last time:\n{names}\n\n"
+            "Resume them? Files already converted are checked and skipped.",
+            parent=self
+        )
+        for job in interrupted:
+            if resume:
+                job.state = "queued"
+            else:
+                job.state = "cancelled"
+                discard(job.id)
+        logger.info("%s %d interrupted batch(es)", "Resuming" if resume else "Discarded", len(interrupted))
+        self.jobs.save()
+
+    def _get_scheduler(self, job):
+        """The fair-share scheduler every batch's workers come from.
+
+        It is sized to the most workers any running batch (or `job`, about
+        to start) was submitted with, not to the current options.
+        """
+        running = [self.jobs.get(job_id) for job_id in self.job_threads]
+        workers = max([job.workers] + [other.workers for other in running if other])
+        if self.scheduler is None:
+            self.scheduler = FairScheduler(workers)
+        elif workers != self.scheduler.workers:
+            self.scheduler.resize(workers)
+        return self.scheduler
+
+    def _get_cost_model(self):
+        """The cost model every batch reads and updates, loaded on first use."""
+        if self.cost_model is None:
+            self.cost_model = CostModel.load()
+        return self.cost_model
+
+    def _get_output_manifest(self):
+        """The output manifest incremental and watch batches share, loaded on first use.
+
+        Batches save it at most every SAVE_INTERVAL seconds; it is flushed
+        when the background queue empties and on quit.
+        """
+        if self.output_manifest is None:
+            self.output_manifest = OutputManifest.load(save_interval=SAVE_INTERVAL)
+        return self.output_manifest
+
+    def _start_queued_jobs(self):
+        """Start queued batches (highest priority first) while background slots are free."""
+        if self.engine is None or self._quit_pending:
+            return
+        while len(self.job_channels) < MAX_BACKGROUND_JOBS:
+            job = self.jobs.next_queued()
+            if job is None:
+                break
+            job.state = "running"
+            channel = ProgressChannel()
+            self.job_channels[job.id] = channel
+            self._start_job_thread(job, channel.publish)
+            logger.info("Started queued batch %s (%s priority)", job.id, job.priority)
+            self.jobs.save()
+
+        if self.job_channels and not self._jobs_polling:
+            self._jobs_polling = True
+            self.after(JOB_POLL_MS, self._poll_jobs)
+
+    def _poll_jobs(self):
+        """Fold background batches' progress into their jobs (runs in main thread)."""
+        changed = False
+        for job_id, channel in list(self.job_channels.items()):
+            job = self.jobs.get(job_id)
+            thread = self.job_threads.get(job_id)
+            alive = bool(thread and thread.is_alive())
+            _, results, finished = channel.drain()
+            for result in results:
+                job.completed += 1
+                job.failed += 0 if result.success else 1
+            if finished or not alive:
+                self._finish_job(job, thread)
+                del self.job_channels[job_id]
+                changed = True
+
+        if changed:
+            self.jobs.save()
+            self._start_queued_jobs()
+        self._refresh_job_panel()
+
+        if self.job_channels:
+            self.after(JOB_POLL_MS, self._poll_jobs)
+        else:
+            self._jobs_polling = False
+            if self.output_manifest:
+                self.output_manifest.flush()
+
+    def watch_folder(self):
+        """Convert files as they appear in a folder, with the current formats and options."""
+        if self.engine is None or self.known_formats is None:
+            self.status_label.configure(text="Formats are still loading...")
+            return
+        formats = [fmt for fmt, var in self.format_vars.items() if var.get()]
+        if not formats:
+            self._show_error("No formats selected", "Please select at least one output format.")
+            return
+
+        from tkinter import filedialog
+        folder = filedialog.askdirectory(title="Select Folder to Watch")
+        if not folder or folder in self.watchers:
+            return
+        if self.output_dir is None or within(folder, self.output_dir):
+            self._show_error("Choose an output folder",
+                             "Set an output folder that is not the watched folder or above it, "
+                             "so converted files are not picked up again.")
+            return
+
+        # Watched files are re-saved over time; only what changed is converted again
+        options = dict(formats=formats, output_dir=self.output_dir, overwrite=self.overwrite_var.get(),
+                       keep_intermediate=self.keep_intermediate_var.get(),
+                       multi_target=self.multi_target_var.get(), incremental=True,
+                       watched_folder=folder, priority=self.priority_var.get(), **self._run_settings())
+        watcher = FolderWatcher([folder], set(self.known_formats),
+                                on_ready=lambda paths: self.watch_queue.put((folder, paths)),
+                                exclude=[self.output_dir])
+        self.watchers[folder] = (watcher, options)
+        if not self._watch_polling:
+            self._watch_polling = True
+            self.after(WATCH_POLL_MS, self._process_watch_queue)
+        watcher.start()
+        logger.info("Watching %s (%s) for %s", folder, watcher.backend, formats)
+        self.status_label.configure(text=f"Watching {len(self.watchers)} folder(s)")
+
+    def stop_watching(self):
+        """Stop every folder watch; batches already queued still run."""
+        for watcher, _ in self.watchers.values():
+            watcher.stop()
+        if self.watchers:
+            logger.info("Stopped watching %d folder(s)", len(self.watchers))
+            self.status_label.configure(text="Stopped watching")
+        self.watchers = {}
+        self.watch_jobs = {}
+
+    def _process_watch_queue(self):
+        """Queue files that settled in watched folders (runs in main thread).
+
+        Files join their folder's batch while it waits to start, so a busy
+        folder has at most one batch queued behind the running ones.
+        """
+        added = False
         try:
             while True:
-                progress, status, result = self.progress_queue.get_nowait()
-                self._update_ui(progress, status, result)
+                folder, paths = self.watch_queue.get_nowait()
+                if folder not in self.watchers:
+                    continue
+                job = self.watch_jobs.get(folder)
+                if job is None or job.state != "queued":
+                    job = self.watch_jobs[folder] = self.jobs.add(Job(files=[], **self.watchers[folder][1]))
+                known = set(job.files)
+                job.files.extend(Path(path) for path in paths if Path(path) not in known)
+                added = True
         except queue.Empty:
             pass
-        finally:
-            self.after(100, self._process_progress_queue)
 
-    def _update_ui(self, progress, status, result):
-        """Update UI elements (called from main thread)."""
+        if added:
+            self.jobs.save()
+            self._start_queued_jobs()
+            self._refresh_job_panel()
+        if self.watchers:
+            self.after(WATCH_POLL_MS, self._process_watch_queue)
+        else:
+            self._watch_polling = False
+
+    def _finish_job(self, job, thread):
+        """Record how a batch ended and forget its thread."""
+        self.job_threads.pop(job.id, None)
+        if thread:
+            job.completed += thread.skipped
+        if thread and thread.interrupted:
+            job.state = "interrupted"
+            logger.info("Batch %s interrupted; it can be resumed next launch", job.id)
+            return
+        if job.state == "cancelled" or (thread and thread.cancelled):
+            job.state = "cancelled"
+        else:
+            job.state = "failed" if job.failed and job.failed == job.completed else "done"
+        logger.info("Batch %s %s: %d/%d converted, %d failed",
+                    job.id, job.state, job.completed - job.failed, job.total, job.failed)
+        if job.watched_folder:
+            # A watch runs indefinitely; its finished batches would pile up in jobs.json
+            self.jobs.remove(job.id)
+
+    def show_job_queue(self):
+        """Open (or raise) the job queue panel."""
+        if self.job_panel and self.job_panel.winfo_exists():
+            self.job_panel.lift()
+            return
+        self.job_panel = JobQueuePanel(self, self)
+
+    def _refresh_job_panel(self):
+        if self.job_panel and self.job_panel.winfo_exists():
+            self.job_panel.refresh()
+
+    def change_job_priority(self, job_id, step):
+        """Move a batch one priority level up (+1) or down (-1)."""
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return
+        levels = list(PRIORITIES)
+        index = min(max(levels.index(job.priority) + step, 0), len(levels) - 1)
+        job.priority = levels[index]
+        thread = self.job_threads.get(job_id)
+        if thread:
+            thread.set_weight(job.weight)
+        self.jobs.save()
+        self._refresh_job_panel()
+
+    def toggle_job_pause(self, job_id):
+        """Pause or resume one batch."""
+        job = self.jobs.get(job_id)
+        thread = self.job_threads.get(job_id)
+        if job is None or thread is None or thread.cancelled:
+            return
+        if job is self.foreground_job:
+            self.toggle_pause()
+        elif thread.token.paused:
+            thread.token.resume()
+        else:
+            thread.token.pause()
+        job.state = "paused" if thread.token.paused else "running"
+        self._refresh_job_panel()
+
+    def cancel_job(self, job_id):
+        """Cancel a queued or running batch."""
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return
+        thread = self.job_threads.get(job_id)
+        if job is self.foreground_job:
+            self.cancel_conversion()
+        elif thread:
+            thread.token.cancel()
+        else:
+            discard(job_id)
+            if job.watched_folder:
+                self.jobs.remove(job_id)
+        job.state = "cancelled"
+        self.jobs.save()
+        self._refresh_job_panel()
+
+    def remove_job(self, job_id):
+        """Drop a batch that is not running from the queue."""
+        if job_id in self.job_threads:
+            self._show_error("Batch running", "Cancel the batch before removing it.")
+            return
+        self.jobs.remove(job_id)
+        discard(job_id)
+        self.jobs.save()
+        self._refresh_job_panel()
+
+    def clear_finished_jobs(self):
+        """Drop every finished batch from the queue."""
+        self.jobs.clear_finished()
+        self.jobs.save()
+        self._refresh_job_panel()
+
+    def toggle_pause(self):
+        """Pause or resume the running batch."""
+        thread = self.conversion_thread
+        if not thread or thread.cancelled:
+            return
+        if thread.token.paused:
+            thread.token.resume()
+            self.pause_btn.configure(text="Pause")
+            logger.info("Conversion resumed")
+        else:
+            thread.token.pause()
+            self.pause_btn.configure(text="Resume")
+            self.status_label.configure(text="Paused - current files are finishing")
+            logger.info("Conversion paused")
+        if self.foreground_job:
+            self.foreground_job.state = "paused" if thread.token.paused else "running"
+            self._refresh_job_panel()
+
+    def cancel_conversion(self):
+        """Cancel the running batch; files already in progress finish."""
+        thread = self.conversion_thread
+        if not thread or thread.cancelled:
+            return
+        thread.token.cancel()
+        self.pause_btn.configure(state="disabled", text="Pause")
+        self.cancel_btn.configure(state="disabled")
+        self.status_label.configure(text="Cancelling - finishing current files...")
+        logger.info("Conversion cancel requested")
+
+    def _set_running(self, running):
+        """Toggle controls between idle and converting."""
+        if running:
+            self.convert_btn.configure(state="disabled", text="Converting...")
+            self.pause_btn.configure(state="normal", text="Pause")
+            self.cancel_btn.configure(state="normal")
+        else:
+            self.convert_btn.configure(state="normal", text="Convert")
+            self.pause_btn.configure(state="disabled", text="Pause")
+            self.cancel_btn.configure(state="disabled")
+
+    def _get_workers(self):
+        """Worker count from the spinbox, falling back to 1 on bad input."""
+        try:
+            return max(1, int(self.workers_var.get()))
+        except (tk.TclError, ValueError):
+            return 1
+
+    def _get_profile_threshold(self):
+        """Profiling threshold in seconds when enabled, else None."""
+        if not self.profile_var.get():
+            return None
+        try:
+            return max(0.0, float(self.profile_threshold_var.get()))
+        except (tk.TclError, ValueError):
+            return ProfileSettings.threshold
+
+    def _get_stream_threshold(self):
+        """Streaming threshold in bytes when enabled, else None."""
+        if not self.stream_var.get():
+            return None
+        try:
+            megabytes = max(1.0, float(self.stream_threshold_var.get()))
+        except (tk.TclError, ValueError):
+            megabytes = 64.0
+        return int(megabytes * 1024 ** 2)
+
+    def _get_memory_budget(self):
+        """The shared MemoryBudget sized from the options, or None when unlimited (empty or 0)."""
         try:
-            self.progress_bar['value'] = progress
-            self.status_label.configure(text=status)
+            megabytes = float(self.memory_budget_var.get() or 0)
+        except (tk.TclError, ValueError):
+            megabytes = 0
+        if megabytes <= 0:
+            return None
+        max_bytes = int(megabytes * 1024 ** 2)
+        if self.memory_budget is None:
+            self.memory_budget = MemoryBudget(max_bytes)
+        else:
+            self.memory_budget.resize(max_bytes)
+        return self.memory_budget
+
+    def _on_conversion_progress(self, progress, status, result):
+        """Hand an update from the conversion thread to the UI."""
+        self.progress_channel.publish(progress, status, result)
+
+    def _process_progress(self):
+        """Apply everything published since the last frame (runs in main thread).
+
+        Reschedules itself only while the batch runs, so an idle window
+        has no timer.
+        """
+        channel = self.progress_channel
+        # Check liveness before draining so the final update is never missed
+        alive = bool(self.conversion_thread and self.conversion_thread.is_alive())
+        latest, results, finished = channel.drain()
+        if not (finished or alive):
+            logger.error("Conversion thread stopped without finishing the batch")
+            finished = True
+        if latest or results or finished:
+            self._update_ui(latest, results, finished)
+
+        if self.debug_mode and self.progress_meter:
+            rate = self.progress_meter.sample()
+            if rate:
+                logger.debug("Progress UI: %.1f refreshes/s, %d updates merged (%d total)",
+                             rate[0], rate[1], channel.merged)
+
+        if not finished:
+            self.after(FRAME_MS, self._process_progress)
+        else:
+            logger.debug("Progress UI: %d updates shown in %d refreshes",
+                         channel.published, channel.refreshes)
 
-            if result:
+    def _update_ui(self, latest, results, finished):
+        """Update UI elements for one frame (called from main thread)."""
+        try:
+            if latest:
+                progress, status = latest
+                self.progress_bar['value'] = progress
+                self.status_label.configure(text=status)
+
+            job = self.foreground_job
+            if job:
+                for result in results:
+                    job.completed += 1
+                    job.failed += 0 if result.success else 1
+
+            # Only the newest result is visible; the rest are in the log
+            if results:
+                result = results[-1]
                 if result.success:
                     self.progress_label.configure(
                         text=f"✓ {result.source_path.name} → {result.target_path.name}",
@@ -394,28 +1199,53 @@ class ConvertExtGUI(ttk.Window):
                         foreground="#FFFFFF"
                     )
 
-            # Show success dialog only on final completion (when result is None)
-            if progress >= 100 and result is None:
-                self.convert_btn.configure(state="normal", text="Convert")
-                self._show_success()
+            # Batch finished (complete or cancelled)
+            if finished:
+                thread, self.conversion_thread = self.conversion_thread, None
+                self._set_running(False)
+                if job:
+                    self.foreground_job = None
+                    self._finish_job(job, thread)
+                    self.jobs.save()
+                    self._refresh_job_panel()
+                if self.output_manifest and not self.job_channels:
+                    self.output_manifest.flush()
+                if thread:
+                    self.last_results = thread.results
+                if not self._quit_pending and not (thread and thread.cancelled):
+                    self._show_success(thread)
+                    if self.last_results:
+                        self._show_metrics()
         except Exception as e:
-            logger.exception(f"UI update failed: {e}")
+            logger.exception("UI update failed: %s", e)
             try:
-                self.convert_btn.configure(state="normal", text="Convert")
+                self._set_running(False)
             except:
                 pass
 
-    def _show_success(self):
+    def _show_success(self, thread=None):
         """Show success dialog."""
         from tkinter import messagebox
+        summary = f"Successfully converted {len(self.file_list)} file(s)!"
+        if thread and thread.incremental is not None:
+            failed = sum(1 for r in thread.results if not r.success)
+            summary = (f"Converted {len(thread.results) - failed}, {thread.skipped} already up to date, "
+                       f"{failed} failed.")
         result = messagebox.askyesno(
             "Conversion Complete",
-            f"Successfully converted {len(self.file_list.files)} file(s)!\n\nOpen output folder?",
+            f"{summary}\n\nOpen output folder?",
             parent=self
         )
         if result:
             self._open_output_folder()
 
+    def _show_metrics(self):
+        """Show the performance report for the last batch."""
+        if not self.last_results:
+            self._show_error("No report", "Convert some files first.")
+            return
+        MetricsPanel(self, self.last_results)
+
     def _open_output_folder(self):
         """Open output folder in system file manager."""
         import subprocess
@@ -437,8 +1267,8 @@ class ConvertExtGUI(ttk.Window):
     def _toggle_debug(self):
         """Toggle debug mode."""
         self.debug_mode = self.debug_var.get()
-        setup_logging(self.debug_mode)
-        logger.info(f"Debug mode {'enabled' if self.debug_mode else 'disabled'}")
+        setup_logging(self.debug_mode, self.log_policy)
+        logger.info("Debug mode %s", "enabled" if self.debug_mode else "disabled")
 
         if self.debug_mode and not self.debug_console:
             self._show_debug_console()
@@ -456,19 +1286,59 @@ class ConvertExtGUI(ttk.Window):
     def _hide_debug_console(self):
         """Hide debug console window."""
         if self.debug_console:
-            self.debug_console.destroy()
+            self.debug_console.on_close()
             self.debug_console = None
             logger.info("Debug console closed")
 
     def _bind_shortcuts(self):
         """Bind keyboard shortcuts."""
         self.bind('<Control-o>', lambda e: self.drop_zone._on_click(None))
+        self.bind('<Control-O>', lambda e: self.drop_zone._on_folder_click())
         self.bind('<Control-Return>', lambda e: self.start_conversion())
-        self.bind('<Escape>', lambda e: self.quit())
-        self.bind('<Control-q>', lambda e: self.quit())
+        self.bind('<Escape>', lambda e: self._on_escape())
+        self.bind('<Control-q>', lambda e: self.request_quit())
         self.bind('<Control-d>', lambda e: self._toggle_debug())
         logger.debug("Keyboard shortcuts bound")
 
+    def _on_escape(self):
+        """Escape cancels a running batch, otherwise quits."""
+        if self.conversion_thread:
+            self.cancel_conversion()
+        else:
+            self.request_quit()
+
+    def request_quit(self):
+        """Quit once every running batch has finished its current files.
+
+        The foreground batch is cancelled; background batches are
+        interrupted, keeping their journals, and resume next launch.
+        """
+        if self._quit_pending:
+            return
+        self._quit_pending = True
+        self.stop_watching()
+        self.cancel_conversion()
+        for thread in self.job_threads.values():
+            if thread is not self.conversion_thread:
+                thread.interrupt()
+        self._quit_when_idle()
+
+    def _quit_when_idle(self):
+        """Quit when no batch thread is left running (runs in main thread)."""
+        running = [thread for thread in self.job_threads.values() if thread.is_alive()]
+        if self.conversion_thread and self.conversion_thread.is_alive() and self.conversion_thread not in running:
+            running.append(self.conversion_thread)
+        if running:
+            self.status_label.configure(text=f"Finishing current files of {len(running)} batch(es) before quitting...")
+            self.after(JOB_POLL_MS, self._quit_when_idle)
+            return
+        if self.scheduler:
+            self.scheduler.shutdown()
+        if self.output_manifest:
+            self.output_manifest.flush()
+        self.jobs.save()
+        self.quit()
+
     def _create_menu(self):
         """Create menu bar."""
         menubar = tk.Menu(self)
@@ -478,19 +1348,26 @@ class ConvertExtGUI(ttk.Window):
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Open Files...", command=lambda: self.drop_zone._on_click(None), accelerator="Ctrl+O")
+        file_menu.add_command(label="Open Folder...", command=self.drop_zone._on_folder_click, accelerator="Ctrl+Shift+O")
+        file_menu.add_separator()
+        file_menu.add_command(label="Watch Folder...", command=self.watch_folder)
+        file_menu.add_command(label="Stop Watching", command=self.stop_watching)
         file_menu.add_separator()
-        file_menu.add_command(label="Quit", command=self.quit, accelerator="Ctrl+Q")
+        file_menu.add_command(label="Quit", command=self.request_quit, accelerator="Ctrl+Q")
 
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="View", menu=view_menu)
         view_menu.add_checkbutton(label="Debug Console", variable=self.debug_var, command=self._toggle_debug, accelerator="Ctrl+D")
+        view_menu.add_command(label="Performance Report", command=self._show_metrics)
+        view_menu.add_command(label="Job Queue", command=self.show_job_queue)
 
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="About", command=self._show_about)
         help_menu.add_command(label="View Logs", command=self._open_log_file)
+        help_menu.add_command(label="View Profiles", command=self._open_profiles_folder)
 
     def _show_about(self):
         """Show about dialog."""
@@ -516,6 +1393,17 @@ class ConvertExtGUI(ttk.Window):
         else:
             subprocess.Popen(['xdg-open', str(self.log_file)])
 
+    def _open_profiles_folder(self):
+        """Open the folder of saved slow-conversion profiles."""
+        import subprocess
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        if sys.platform == "win32":
+            subprocess.Popen(f'explorer "{PROFILE_DIR}"')
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", str(PROFILE_DIR)])
+        else:
+            subprocess.Popen(["xdg-open", str(PROFILE_DIR)])
+
     def _center_window(self):
         """Center window on screen."""
         self.update_idletasks()
@@ -527,11 +1415,23 @@ class ConvertExtGUI(ttk.Window):
         self.minsize(700, 800)
 
 
-def main():
+def main(measure_startup=False, log_policy="drop"):
     """Main entry point."""
-    app = ConvertExtGUI()
+    # Process-pool workers re-enter the frozen executable
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    app = ConvertExtGUI(measure_startup=measure_startup, log_policy=log_policy)
     app.mainloop()
 
 
 if __name__ == "__main__":
-    main()
+    # Run as a script: going through cli.main would import this module a second time
+    # and restart the startup clock, so only headless runs are handed over
+    from convertext_gui.cli import build_parser, main as cli_main
+
+    args = build_parser().parse_args()
+    if args.headless:
+        cli_main()
+    else:
+        main(measure_startup=args.measure_startup, log_policy=args.log_policy)
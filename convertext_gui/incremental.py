@@ -0,0 +1,133 @@
+"""Skip conversions whose outputs are already up to date, judged from file stats alone."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+OUTPUTS_PATH = Path.home() / ".convertext" / "outputs.json"
+# Long-lived manifests (watch mode, the GUI) rewrite the file at most this often
+SAVE_INTERVAL = 30.0
+
+
+def _stat(path):
+    """(size, mtime_ns) of a file, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def settings_key(config):
+    """Short fingerprint of the config settings that can change an output."""
+    from convertext_gui.cache import cache_settings
+
+    blob = json.dumps(cache_settings(config), sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+class OutputManifest:
+    """Stats of every output written, keyed by source and target format.
+
+    An entry records the source's and target's (size, mtime_ns) when the
+    target was written, plus a fingerprint of the settings it was written
+    with. A pair is up to date when both files still match their entry and
+    the settings are unchanged; a pair with no entry yet falls back to
+    make's rule, a non-empty target at least as new as its source. Only
+    ``stat`` is used, so deciding never opens a file.
+
+    `save` merges into whatever is on disk, so batches running side by
+    side (or a headless run next to the GUI) do not drop each other's
+    entries. A manifest shared by many batches can pass `save_interval`:
+    saves closer together than that are left for a later save or `flush`.
+    """
+
+    def __init__(self, outputs=None, path=OUTPUTS_PATH, save_interval=0.0):
+        self.outputs = outputs or {}
+        self.path = path
+        self.save_interval = save_interval
+        self._changed = {}
+        self._saved_at = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=OUTPUTS_PATH, save_interval=0.0):
+        """Manifest stored at `path`, or an empty one."""
+        return cls(_read(path), path, save_interval)
+
+    def save(self, force=False):
+        """Write recorded entries back (atomic, best-effort)."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and self._saved_at is not None and now - self._saved_at < self.save_interval:
+                return
+            changed, self._changed = self._changed, {}
+            if changed:
+                self._saved_at = now
+        if not changed:
+            return
+        outputs = _read(self.path)
+        for source, targets in changed.items():
+            outputs.setdefault(source, {}).update(targets)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'outputs': outputs}, f, separators=(',', ':'))
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning("Could not save output manifest: %s", e)
+
+    def flush(self):
+        """Save now, whatever the interval."""
+        self.save(force=True)
+
+    def up_to_date(self, source, fmt, target, settings):
+        """True if `target` need not be rebuilt from `source`."""
+        source, target = os.fspath(source), os.fspath(target)
+        source_stat = _stat(source)
+        target_stat = _stat(target)
+        if source_stat is None or target_stat is None:
+            return False
+
+        entry = self.outputs.get(source, {}).get(fmt)
+        if entry is not None:
+            return (entry['source'] == list(source_stat) and entry['target'] == list(target_stat)
+                    and entry['path'] == target and entry['settings'] == settings)
+
+        if target_stat[0] == 0 or target_stat[1] < source_stat[1]:
+            return False
+        # Adopt outputs from before the manifest so later runs compare exact stats
+        self._store(source, fmt, target, settings, source_stat, target_stat)
+        return True
+
+    def record(self, source, fmt, target, settings):
+        """Note a freshly written target."""
+        source_stat = _stat(source)
+        target_stat = _stat(target)
+        if source_stat is not None and target_stat is not None:
+            self._store(source, fmt, target, settings, source_stat, target_stat)
+
+    def _store(self, source, fmt, target, settings, source_stat, target_stat):
+        entry = {'source': list(source_stat), 'target': list(target_stat), 'path': str(target),
+                 'settings': settings}
+        with self._lock:
+            self.outputs.setdefault(str(source), {})[fmt] = entry
+            self._changed.setdefault(str(source), {})[fmt] = entry
+
+
+def _read(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            outputs = json.load(f)['outputs']
+        if isinstance(outputs, dict):
+            return outputs
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug("No usable output manifest: %s", e)
+    return {}
@@ -0,0 +1,318 @@
+"""Persistent job queue and the fair-share scheduler batches run on."""
+
+import json
+import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+JOBS_PATH = Path.home() / ".convertext" / "jobs.json"
+
+# Share of the workers each priority gets relative to "normal"
+PRIORITIES = {"low": 1.0, "normal": 2.0, "high": 4.0}
+STATES = ("queued", "running", "paused", "interrupted", "done", "cancelled", "failed")
+
+
+@dataclass
+class Job:
+    """One batch: its files, options, priority and how far it got."""
+
+    files: List[Path]
+    formats: List[str]
+    output_dir: Optional[Path] = None
+    overwrite: bool = False
+    keep_intermediate: bool = False
+    multi_target: bool = True
+    incremental: bool = False
+    # How the batch runs, fixed when it is submitted rather than read from the options later
+    backend: str = "thread"
+    workers: int = 1
+    cache: bool = False
+    stream_over: Optional[int] = None
+    profile_threshold: Optional[float] = None
+    # Folder a watch-mode batch came from; such batches leave the queue when they finish
+    watched_folder: Optional[str] = None
+    priority: str = "normal"
+    state: str = "queued"
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    created: float = field(default_factory=time.time)
+    completed: int = 0
+    failed: int = 0
+
+    @property
+    def total(self):
+        return len(self.files) * len(self.formats)
+
+    @property
+    def weight(self):
+        return PRIORITIES.get(self.priority, PRIORITIES["normal"])
+
+    @property
+    def finished(self):
+        return self.state in ("done", "cancelled", "failed")
+
+    @property
+    def name(self):
+        if not self.files:
+            return "(empty)"
+        first = self.files[0]
+        return first.name if len(self.files) == 1 else f"{first.parent.name or first.name} ({len(self.files)} files)"
+
+    def to_dict(self):
+        data = asdict(self)
+        data['files'] = [str(f) for f in self.files]
+        data['output_dir'] = str(self.output_dir) if self.output_dir else None
+        return data
+
+    @property
+    def options(self):
+        """Batch options as recorded in its journal header."""
+        return {
+            'output_dir': str(self.output_dir) if self.output_dir else None,
+            'overwrite': self.overwrite,
+            'keep_intermediate': self.keep_intermediate,
+            'multi_target': self.multi_target,
+            'incremental': self.incremental,
+            'backend': self.backend,
+            'workers': self.workers,
+            'cache': self.cache,
+            'stream_over': self.stream_over,
+            'profile_threshold': self.profile_threshold,
+            'watched_folder': self.watched_folder,
+            'priority': self.priority,
+        }
+
+    @classmethod
+    def from_journal(cls, header):
+        """Job rebuilt from a batch journal header (see `convertext_gui.journal`)."""
+        options = header.get('options', {})
+        return cls.from_dict({
+            **options,
+            'id': header['id'],
+            'created': header.get('time', time.time()),
+            'files': header.get('files', []),
+            'formats': header.get('formats', []),
+            'state': "interrupted",
+        })
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        data['files'] = [Path(f) for f in data.get('files', [])]
+        data['output_dir'] = Path(data['output_dir']) if data.get('output_dir') else None
+        return cls(**{key: value for key, value in data.items() if key in cls.__dataclass_fields__})
+
+
+class JobQueue:
+    """Batches submitted from the GUI, saved across restarts.
+
+    Jobs that were running when the app stopped come back as interrupted,
+    for the app to offer resuming from their journals.
+    """
+
+    def __init__(self, jobs=None, path=JOBS_PATH):
+        self.jobs = jobs or []
+        self.path = path
+
+    @classmethod
+    def load(cls, path=JOBS_PATH):
+        """Queue stored at `path`, or an empty one."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                jobs = [Job.from_dict(item) for item in json.load(f)['jobs']]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("No saved job queue: %s", e)
+            return cls(path=path)
+        for job in jobs:
+            if job.state in ("running", "paused"):
+                job.state = "interrupted"
+        return cls(jobs, path)
+
+    def save(self):
+        """Write the queue back (atomic, best-effort)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'jobs': [job.to_dict() for job in self.jobs]}, f, indent=1)
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning("Could not save job queue: %s", e)
+
+    def add(self, job):
+        self.jobs.append(job)
+        return job
+
+    def get(self, job_id):
+        return next((job for job in self.jobs if job.id == job_id), None)
+
+    def remove(self, job_id):
+        self.jobs = [job for job in self.jobs if job.id != job_id]
+
+    def clear_finished(self):
+        self.jobs = [job for job in self.jobs if not job.finished]
+
+    def next_queued(self):
+        """Queued job to start next: highest priority, then oldest."""
+        queued = [job for job in self.jobs if job.state == "queued"]
+        if not queued:
+            return None
+        return min(queued, key=lambda job: (-job.weight, job.created))
+
+
+class FairScheduler:
+    """One set of worker threads shared by several batches.
+
+    Each batch gets a share of the workers proportional to its weight.
+    Every batch keeps a virtual clock that advances by the (estimated, then
+    measured) seconds of its work divided by its weight, and a free worker
+    always takes the next task of the batch whose clock is furthest behind.
+    A batch that joins late starts at the current minimum, so a small
+    urgent batch runs right away instead of waiting behind a long one, and
+    a long batch is not starved either.
+
+    Process-backend batches share one process pool of the same size (see
+    `submit_process`): a worker thread waits on the process running its task,
+    so fair shares and the worker count cover them too.
+    """
+
+    def __init__(self, workers):
+        self.workers = max(1, int(workers))
+        self._queues = {}
+        self._weights = {}
+        self._clocks = {}
+        self._threads = []
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._process_pool = None
+        self._process_workers = 0
+
+    def register(self, batch, weight=1.0):
+        """Add a batch; its clock starts level with the batches already running."""
+        with self._condition:
+            self._clocks[batch] = min(self._clocks.values(), default=0.0)
+            self._weights[batch] = weight
+            self._queues[batch] = deque()
+
+    def set_weight(self, batch, weight):
+        """Change a batch's share (e.g. after its priority changed)."""
+        with self._condition:
+            if batch in self._weights:
+                self._weights[batch] = weight
+
+    def unregister(self, batch):
+        """Remove a batch, cancelling any of its tasks that have not started."""
+        with self._condition:
+            for future, _, _, _ in self._queues.pop(batch, ()):
+                future.cancel()
+            self._weights.pop(batch, None)
+            self._clocks.pop(batch, None)
+
+    def submit(self, batch, cost, fn, *args):
+        """Queue `fn(*args)` for `batch`; `cost` is its estimated seconds."""
+        future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("scheduler is shut down")
+            self._queues[batch].append((future, cost, fn, args))
+            self._start_workers()
+            self._condition.notify()
+        return future
+
+    def resize(self, workers):
+        """Change the number of worker threads; extra ones exit when idle."""
+        with self._condition:
+            self.workers = max(1, int(workers))
+            self._start_workers()
+            self._condition.notify_all()
+
+    def shutdown(self):
+        """Stop the workers once their current tasks end."""
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+            pool, self._process_pool = self._process_pool, None
+        if pool:
+            pool.shutdown(wait=False)
+
+    def submit_process(self, initializer, fn, *args):
+        """Run `fn(*args)` on the process pool shared by process batches, sized to `workers`.
+
+        The pool is replaced after a resize, or once a crashed worker broke
+        it; tasks already on the old pool finish there. Picking the pool and
+        submitting happen under one lock, so a pool is never shut down
+        between the two.
+        """
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("scheduler is shut down")
+            pool = self._process_pool
+            if pool is not None and self._process_workers == self.workers:
+                try:
+                    return pool.submit(fn, *args)
+                except BrokenProcessPool:
+                    logger.warning("A worker process died; starting a new process pool")
+            old = pool
+            # spawn: forking a process that runs Tk and other threads is unsafe
+            self._process_pool = ProcessPoolExecutor(max_workers=self.workers, initializer=initializer,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            self._process_workers = self.workers
+            future = self._process_pool.submit(fn, *args)
+        if old:
+            old.shutdown(wait=False)
+        return future
+
+    def _start_workers(self):
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name=f"fair-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_task(self):
+        """(batch, task) of the batch furthest behind, charging its estimate up front."""
+        ready = [batch for batch, queue in self._queues.items() if queue]
+        if not ready:
+            return None, None
+        batch = min(ready, key=lambda b: self._clocks[b])
+        task = self._queues[batch].popleft()
+        self._clocks[batch] += task[1] / self._weights[batch]
+        return batch, task
+
+    def _work(self):
+        me = threading.current_thread()
+        while True:
+            with self._condition:
+                while True:
+                    if self._shutdown or self._threads.index(me) >= self.workers:
+                        self._threads.remove(me)
+                        return
+                    batch, task = self._next_task()
+                    if task:
+                        break
+                    self._condition.wait()
+
+            future, cost, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            start = time.perf_counter()
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+            with self._condition:
+                # Replace the estimate with what the task really took
+                if batch in self._clocks:
+                    self._clocks[batch] += (time.perf_counter() - start - cost) / self._weights[batch]
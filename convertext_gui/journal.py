@@ -0,0 +1,187 @@
+"""Append-only journal of a batch, so an interrupted batch can be resumed."""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR = Path.home() / ".convertext" / "journal"
+
+# Records are flushed as they are written; fsync is batched to at most once per interval
+SYNC_INTERVAL = 1.0
+
+
+def _stat(path):
+    """(size, mtime) of a file, or None if it cannot be read."""
+    try:
+        st = path.stat()
+        return st.st_size, st.st_mtime
+    except (OSError, TypeError):
+        return None
+
+
+class BatchJournal:
+    """JSONL journal of one batch: a header line, then one line per finished pair.
+
+    The header records the batch's files, formats and options; each
+    ``done`` line records a target with the source and target sizes and
+    mtimes it was made from. `open` replays an existing journal and keeps
+    as completed only the pairs whose source is unchanged and whose target
+    is still there with the recorded size, so `ConversionThread` can skip
+    exactly those. A finished batch deletes its journal; one left behind
+    means the batch was interrupted.
+    """
+
+    def __init__(self, path, header=None, completed=None):
+        self.path = path
+        self.header = header or {}
+        self.completed = completed or set()
+        self._file = None
+        self._last_sync = 0.0
+
+    @classmethod
+    def open(cls, batch_id, files=(), formats=(), options=None, directory=JOURNAL_DIR):
+        """Journal for `batch_id`, resuming an existing one or starting a new one."""
+        path = directory / f"{batch_id}.jsonl"
+        journal = cls.load(path)
+        if journal is None:
+            journal = cls(path, {
+                'event': 'batch',
+                'id': batch_id,
+                'time': time.time(),
+                'files': [str(f) for f in files],
+                'formats': list(formats),
+                'options': options or {},
+            })
+            journal._write(journal.header, sync=True)
+        else:
+            logger.info("Resuming batch %s: %d conversions already done", batch_id, len(journal.completed))
+        return journal
+
+    @classmethod
+    def load(cls, path):
+        """Replay the journal at `path`, or None if it is missing or has no header."""
+        header = None
+        done = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A torn last line from a crash mid-write
+                        continue
+                    event = entry.get('event')
+                    if event == 'batch':
+                        header = entry
+                    elif event == 'done':
+                        done[(entry['source'], entry['format'])] = entry
+                    elif event == 'failed':
+                        done.pop((entry['source'], entry['format']), None)
+        except OSError:
+            return None
+        if header is None:
+            return None
+
+        completed = set()
+        for (source, fmt), entry in done.items():
+            if _verify(entry):
+                completed.add((source, fmt))
+            else:
+                logger.info("Will redo %s -> %s: output missing or changed", source, fmt)
+        return cls(path, header, completed)
+
+    @property
+    def batch_id(self):
+        return self.header.get('id', self.path.stem)
+
+    def is_done(self, file, fmt):
+        return (str(file), fmt) in self.completed
+
+    def record(self, result):
+        """Append the outcome of one conversion."""
+        if result.success and result.target_path:
+            source = _stat(result.source_path)
+            target = _stat(result.target_path)
+            self._write({
+                'event': 'done',
+                'source': str(result.source_path),
+                'format': result.target_format,
+                'target': str(result.target_path),
+                'source_size': source[0] if source else None,
+                'source_mtime': source[1] if source else None,
+                'target_size': target[0] if target else None,
+            })
+            self.completed.add((str(result.source_path), result.target_format))
+        else:
+            self._write({
+                'event': 'failed',
+                'source': str(result.source_path),
+                'format': result.target_format,
+                'error': result.error,
+            })
+
+    def finish(self, remove=True):
+        """Close the journal; a batch that ran to its end (or was cancelled) has nothing to resume."""
+        self.close()
+        if remove:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def close(self):
+        if self._file:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    def _write(self, entry, sync=False):
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            if sync or time.monotonic() - self._last_sync >= SYNC_INTERVAL:
+                self._sync()
+        except OSError as e:
+            logger.warning("Could not write batch journal %s: %s", self.path, e)
+
+    def _sync(self):
+        try:
+            os.fsync(self._file.fileno())
+        except OSError:
+            pass
+        self._last_sync = time.monotonic()
+
+
+def _verify(entry):
+    """True if a journalled output is intact and its source unchanged."""
+    source = _stat(Path(entry['source']))
+    target = _stat(Path(entry['target']))
+    if source is None or target is None:
+        return False
+    return (source[0] == entry.get('source_size') and source[1] == entry.get('source_mtime')
+            and target[0] == entry.get('target_size'))
+
+
+def unfinished(directory=JOURNAL_DIR):
+    """Journals left behind by batches that did not finish."""
+    journals = []
+    for path in sorted(directory.glob("*.jsonl")) if directory.is_dir() else ():
+        journal = BatchJournal.load(path)
+        if journal is not None:
+            journals.append(journal)
+    return journals
+
+
+def discard(batch_id, directory=JOURNAL_DIR):
+    """Forget an interrupted batch."""
+    try:
+        (directory / f"{batch_id}.jsonl").unlink()
+    except OSError:
+        pass
@@ -1,13 +1,68 @@
 """Logging configuration for GUI."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
 
+LOG_POLICIES = ("drop", "block")
+DEFAULT_QUEUE_SIZE = 10000
 
-def setup_logging(debug=False):
-    """Configure logging for the application."""
+_listener = None
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a bounded queue.
+
+    When the queue is full, the "drop" policy discards the record and counts
+    it, while "block" makes the logging thread wait for the listener.
+    The number of dropped records is reported once the queue has room again.
+    """
+
+    def __init__(self, log_queue, policy="drop"):
+        if policy not in LOG_POLICIES:
+            raise ValueError(f"Unknown log policy: {policy}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+        self._reported = 0
+
+    def enqueue(self, record):
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped > self._reported:
+            self._report_dropped(record)
+
+    def _report_dropped(self, record):
+        count = self.dropped - self._reported
+        notice = logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0,
+            "%d log records dropped (log queue full)", (count,), None
+        )
+        notice.created = record.created
+        try:
+            self.queue.put_nowait(self.prepare(notice))
+            self._reported = self.dropped
+        except queue.Full:
+            pass
+
+
+def setup_logging(debug=False, policy="drop", queue_size=DEFAULT_QUEUE_SIZE):
+    """Configure logging for the application.
+
+    Records are handed to a background listener through a bounded queue, so
+    no logging call waits on disk I/O unless `policy` is "block" and the
+    queue is full. Calling this again replaces the previous listener.
+    """
     # Create logs directory
     log_dir = Path.home() / ".convertext"
     log_dir.mkdir(exist_ok=True)
@@ -34,16 +89,45 @@ def setup_logging(debug=False):
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
 
-    # Configure root logger
+    handlers = [file_handler]
+    if debug:
+        handlers.append(console_handler)
+
+    install_queue_logging(handlers, policy, queue_size)
+    return log_file
+
+
+def install_queue_logging(handlers, policy="drop", queue_size=DEFAULT_QUEUE_SIZE):
+    """Route every root-logger record to `handlers` via a background listener."""
+    global _listener
+
+    log_queue = queue.Queue(maxsize=queue_size)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    # Records below every handler's level are discarded before being queued
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(min(handler.level or logging.DEBUG for handler in handlers))
     root_logger.handlers.clear()
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(BoundedQueueHandler(log_queue, policy))
 
-    if debug:
-        root_logger.addHandler(console_handler)
+    # Only once nothing can enqueue to it: flush and close the previous listener
+    stop_logging()
+    _listener = listener
 
-    return log_file
+
+def stop_logging():
+    """Stop the background listener, writing out every queued record."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(stop_logging)
 
 
 def is_development_mode():
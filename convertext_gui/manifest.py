@@ -0,0 +1,60 @@
+"""Cached manifest of supported formats for instant format-panel builds."""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path.home() / ".convertext" / "formats.json"
+
+
+def manifest_key():
+    """Fingerprint of the installed converters, computed without importing them.
+
+    Covers the app and convertext versions plus the mtime of every converter
+    module, so editing a development checkout of convertext invalidates the
+    manifest too. Frozen builds have no module files to stat and fall back to
+    the versions alone, which is enough since their converters never change.
+    """
+    import convertext
+    from convertext_gui import __version__
+
+    root = Path(convertext.__file__).parent
+    fingerprint = {
+        'app': __version__,
+        'convertext': getattr(convertext, '__version__', 'unknown'),
+        'modules': {},
+    }
+    for path in sorted([root / "registry.py", *(root / "converters").rglob("*.py")]):
+        try:
+            fingerprint['modules'][path.relative_to(root).as_posix()] = path.stat().st_mtime_ns
+        except OSError:
+            continue
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Cached source -> targets map, or None if missing or stale."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('key') == manifest_key():
+            return data['formats']
+        logger.debug("Format manifest is stale")
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug("No usable format manifest: %s", e)
+    return None
+
+
+def save_manifest(formats, path=MANIFEST_PATH):
+    """Store the live registry's formats for the next launch."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'key': manifest_key(), 'formats': formats}, f, sort_keys=True)
+        tmp.replace(path)
+    except OSError as e:
+        logger.warning("Could not save format manifest: %s", e)
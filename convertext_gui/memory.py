@@ -0,0 +1,248 @@
+"""Memory budget shared by the conversions of a batch."""
+
+import ctypes
+import ctypes.util
+import functools
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Rough peak memory of an in-memory conversion relative to its source size
+# (decoded text, parse tree and Document all alive at once), until the cost
+# model has measured the pair
+IN_MEMORY_FACTOR = 8
+# Streamed conversions hold a few buffers regardless of file size
+STREAMING_BYTES = 16 * 1024 * 1024
+
+
+def total_memory():
+    """Physical memory in bytes, or None where it cannot be read."""
+    if sys.platform == "win32":
+        return _windows_total_memory()
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        pass
+    if sys.platform == "darwin":
+        return _darwin_total_memory()
+    return None
+
+
+def default_budget():
+    """Half of physical memory, or None (unlimited) if unknown."""
+    total = total_memory()
+    return total // 2 if total else None
+
+
+def process_rss(pid="self"):
+    """Current resident memory of a process in bytes, or None where it cannot be read.
+
+    Reads /proc on Linux, proc_pidinfo on macOS and GetProcessMemoryInfo on
+    Windows.
+    """
+    if sys.platform == "win32":
+        return _windows_rss(None if pid == "self" else pid)
+    if sys.platform == "darwin":
+        return _darwin_rss(os.getpid() if pid == "self" else pid)
+    try:
+        with open(f"/proc/{pid}/statm", 'r') as f:
+            resident = int(f.read().split()[1])
+        return resident * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _libc():
+    return ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+
+class _ProcTaskInfo(ctypes.Structure):
+    """struct proc_taskinfo from <sys/proc_info.h>."""
+
+    _fields_ = [("virtual_size", ctypes.c_uint64), ("resident_size", ctypes.c_uint64)] + [
+        (name, ctypes.c_uint64) for name in ("total_user", "total_system", "threads_user", "threads_system")] + [
+        (name, ctypes.c_int32) for name in ("policy", "faults", "pageins", "cow_faults", "messages_sent",
+                                            "messages_received", "syscalls_mach", "syscalls_unix", "csw",
+                                            "threadnum", "numrunning", "priority")]
+
+
+PROC_PIDTASKINFO = 4
+
+
+def _darwin_rss(pid):
+    try:
+        info = _ProcTaskInfo()
+        size = _libc().proc_pidinfo(pid, PROC_PIDTASKINFO, ctypes.c_uint64(0), ctypes.byref(info),
+                                    ctypes.sizeof(info))
+    except (OSError, AttributeError):
+        return None
+    return info.resident_size if size == ctypes.sizeof(info) else None
+
+
+def _darwin_total_memory():
+    try:
+        value = ctypes.c_uint64()
+        size = ctypes.c_size_t(ctypes.sizeof(value))
+        if _libc().sysctlbyname(b"hw.memsize", ctypes.byref(value), ctypes.byref(size), None, ctypes.c_size_t(0)):
+            return None
+    except (OSError, AttributeError):
+        return None
+    return value.value
+
+
+class _MemoryStatusEx(ctypes.Structure):
+    """MEMORYSTATUSEX from <sysinfoapi.h>."""
+
+    _fields_ = [("dwLength", ctypes.c_uint32), ("dwMemoryLoad", ctypes.c_uint32)] + [
+        (name, ctypes.c_uint64) for name in ("ullTotalPhys", "ullAvailPhys", "ullTotalPageFile", "ullAvailPageFile",
+                                             "ullTotalVirtual", "ullAvailVirtual", "ullAvailExtendedVirtual")]
+
+
+class _ProcessMemoryCounters(ctypes.Structure):
+    """PROCESS_MEMORY_COUNTERS from <psapi.h>."""
+
+    _fields_ = [("cb", ctypes.c_uint32), ("PageFaultCount", ctypes.c_uint32)] + [
+        (name, ctypes.c_size_t) for name in ("PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage",
+                                             "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage",
+                                             "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+PROCESS_VM_READ = 0x0010
+
+
+@functools.lru_cache(maxsize=None)
+def _kernel32():
+    kernel32 = ctypes.WinDLL("kernel32")
+    kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+    kernel32.OpenProcess.restype = ctypes.c_void_p
+    kernel32.OpenProcess.argtypes = [ctypes.c_uint32, ctypes.c_int, ctypes.c_uint32]
+    kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+    kernel32.K32GetProcessMemoryInfo.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+    return kernel32
+
+
+def _windows_total_memory():
+    try:
+        status = _MemoryStatusEx(dwLength=ctypes.sizeof(_MemoryStatusEx))
+        if not _kernel32().GlobalMemoryStatusEx(ctypes.byref(status)):
+            return None
+    except (OSError, AttributeError):
+        return None
+    return status.ullTotalPhys
+
+
+def _windows_rss(pid):
+    """Working set of `pid`, or of this process when None."""
+    try:
+        kernel32 = _kernel32()
+        if pid is None:
+            handle = kernel32.GetCurrentProcess()
+        else:
+            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_VM_READ, False, pid)
+            if not handle:
+                return None
+        counters = _ProcessMemoryCounters(cb=ctypes.sizeof(_ProcessMemoryCounters))
+        try:
+            ok = kernel32.K32GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb)
+        finally:
+            if pid is not None:
+                kernel32.CloseHandle(handle)
+    except (OSError, AttributeError):
+        return None
+    return counters.WorkingSetSize if ok else None
+
+
+def live_rss():
+    """Resident memory of this process plus its worker processes, or None if unknown."""
+    total = process_rss()
+    if total is None:
+        return None
+    for child in multiprocessing.active_children():
+        total += process_rss(child.pid) or 0
+    return total
+
+
+def estimate_memory(size, streamed=False, factor=None):
+    """Estimated peak bytes for converting a source of `size` bytes.
+
+    `factor` is a measured bytes of memory per source byte (see
+    `CostModel.memory_per_byte`); without one IN_MEMORY_FACTOR is assumed.
+    """
+    if streamed:
+        return STREAMING_BYTES
+    return max(int(size * (IN_MEMORY_FACTOR if factor is None else factor)), 1)
+
+
+class MemoryBudget:
+    """Weighted semaphore over estimated conversion memory.
+
+    A job is admitted when both the estimates already admitted and the
+    live resident memory of the process and its workers (`measure`) leave
+    room for its own estimate under `max_bytes`; otherwise `acquire`
+    waits, re-measuring as memory is freed. A job is always admitted when
+    nothing else is running, so a single file bigger than the whole budget
+    still converts, just alone.
+    """
+
+    def __init__(self, max_bytes, measure=live_rss):
+        self.max_bytes = max_bytes
+        self.measure = measure
+        if measure is live_rss and live_rss() is None:
+            logger.info("Resident memory cannot be read on this platform; the memory budget uses estimates only")
+        self.in_use = 0
+        self.running = 0
+        self.waiting = 0
+        self._condition = threading.Condition()
+
+    def _fits(self, amount):
+        if not self.running:
+            return True
+        if self.in_use + amount > self.max_bytes:
+            return False
+        rss = self.measure() if self.measure else None
+        return rss is None or rss + amount <= self.max_bytes
+
+    def acquire(self, amount, should_stop=lambda: False):
+        """Reserve `amount` bytes; False if `should_stop()` became true while waiting."""
+        with self._condition:
+            self.waiting += 1
+            try:
+                while not self._fits(amount):
+                    if should_stop():
+                        return False
+                    self._condition.wait(0.2)
+            finally:
+                self.waiting -= 1
+            self._admit(amount)
+            return True
+
+    def try_acquire(self, amount):
+        """Reserve `amount` bytes if that fits right now."""
+        with self._condition:
+            if not self._fits(amount):
+                return False
+            self._admit(amount)
+            return True
+
+    def _admit(self, amount):
+        self.in_use += amount
+        self.running += 1
+
+    def release(self, amount):
+        """Return a reservation."""
+        with self._condition:
+            self.in_use -= amount
+            self.running -= 1
+            self._condition.notify_all()
+
+    def resize(self, max_bytes):
+        """Change the limit, waking waiters that may now fit."""
+        with self._condition:
+            self.max_bytes = max_bytes
+            self._condition.notify_all()
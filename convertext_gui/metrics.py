@@ -0,0 +1,102 @@
+"""Per-conversion performance metrics, batch summaries and report export."""
+
+import csv
+import json
+import sys
+from dataclasses import asdict
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPORT_FIELDS = (
+    'source_path', 'target_format', 'target_path', 'success', 'cached', 'converter',
+    'seconds', 'cpu_seconds', 'peak_rss', 'memory_bytes', 'input_bytes', 'output_bytes', 'error',
+)
+
+
+def peak_rss_bytes():
+    """High-water resident memory of this process in bytes, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def summarize(records):
+    """Batch totals plus per-converter figures for a list of ConversionRecords."""
+    fresh = [r for r in records if r.success and not r.cached]
+    peaks = [r.peak_rss for r in records if r.peak_rss]
+    summary = {
+        'conversions': len(records),
+        'succeeded': sum(1 for r in records if r.success),
+        'failed': sum(1 for r in records if not r.success),
+        'cached': sum(1 for r in records if r.cached),
+        'seconds': sum(r.seconds for r in fresh),
+        'cpu_seconds': sum(r.cpu_seconds for r in fresh),
+        'input_bytes': sum(r.input_bytes for r in fresh),
+        'output_bytes': sum(r.output_bytes for r in fresh),
+        'peak_rss': max(peaks) if peaks else None,
+        'converters': {},
+    }
+
+    for record in fresh:
+        stats = summary['converters'].setdefault(record.converter or "unknown", {
+            'conversions': 0, 'seconds': 0.0, 'cpu_seconds': 0.0,
+            'input_bytes': 0, 'output_bytes': 0, 'slowest': 0.0,
+        })
+        stats['conversions'] += 1
+        stats['seconds'] += record.seconds
+        stats['cpu_seconds'] += record.cpu_seconds
+        stats['input_bytes'] += record.input_bytes
+        stats['output_bytes'] += record.output_bytes
+        stats['slowest'] = max(stats['slowest'], record.seconds)
+
+    for stats in summary['converters'].values():
+        stats['mb_per_second'] = (stats['input_bytes'] / 1024 ** 2 / stats['seconds']
+                                  if stats['seconds'] else None)
+    return summary
+
+
+def record_row(record):
+    """One record as a flat dict of REPORT_FIELDS."""
+    row = asdict(record)
+    for key in ('source_path', 'target_path'):
+        row[key] = str(row[key]) if row[key] else ""
+    return {field: row.get(field) for field in REPORT_FIELDS}
+
+
+def export_report(records, path):
+    """Write records as CSV or JSON, chosen by the file suffix.
+
+    Both name the app and convertext versions, so a regression can be
+    tied to an upgrade: JSON once at the top, CSV as two columns per row.
+    """
+    versions = _versions()
+    if path.suffix.lower() == ".csv":
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS + tuple(versions))
+            writer.writeheader()
+            writer.writerows({**record_row(r), **versions} for r in records)
+        return
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'date': datetime.now().isoformat(timespec='seconds'),
+            **versions,
+            'summary': summarize(records),
+            'conversions': [record_row(r) for r in records],
+        }, f, indent=1)
+
+
+def _versions():
+    try:
+        from convertext import __version__ as convertext_version
+    except ImportError:
+        convertext_version = "unknown"
+    from convertext_gui import __version__
+
+    return {'app_version': __version__, 'convertext_version': convertext_version}
@@ -0,0 +1,168 @@
+"""Opt-in cProfile capture of slow conversions."""
+
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = Path.home() / ".convertext" / "profiles"
+
+# cProfile allows one active profiler per process (sys.monitoring on 3.12+),
+# so concurrent threads take turns and the rest are stack-sampled instead.
+_profiler_lock = threading.Lock()
+SAMPLE_INTERVAL = 0.01
+
+
+@dataclass
+class ProfileSettings:
+    """Where and when to keep profiles; picklable for process workers."""
+
+    threshold: float = 5.0
+    directory: Path = field(default_factory=lambda: PROFILE_DIR)
+
+
+def run_profiled(settings, file, formats, func):
+    """Call `func()` under cProfile and save the profile if it was slow.
+
+    Each process worker profiles its own conversions. With thread workers
+    one conversion at a time holds cProfile (on Python 3.12+ its profile
+    also picks up whatever the other threads ran meanwhile); the others are
+    sampled every `SAMPLE_INTERVAL` seconds and slow ones leave a sampled
+    summary instead.
+    """
+    if not _profiler_lock.acquire(blocking=False):
+        return _run_sampled(settings, file, formats, func)
+
+    try:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Another profiler or debugger already owns the hook
+            logger.debug("Profiling unavailable: %s", e)
+            return _run_sampled(settings, file, formats, func)
+
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            if elapsed >= settings.threshold:
+                save_profile(profiler, settings.directory, file, formats, elapsed)
+    finally:
+        _profiler_lock.release()
+
+
+def _run_sampled(settings, file, formats, func):
+    """Call `func()` while `_sampler` records this thread's stacks; save them if it was slow."""
+    stacks = _sampler.add(threading.get_ident())
+    start = time.perf_counter()
+    try:
+        return func()
+    finally:
+        _sampler.remove(threading.get_ident())
+        elapsed = time.perf_counter() - start
+        if elapsed >= settings.threshold:
+            save_samples(stacks, settings.directory, file, formats, elapsed)
+
+
+class _StackSampler:
+    """Background thread that counts the call stacks of registered threads."""
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self._stacks = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def add(self, ident):
+        stacks = Counter()
+        with self._lock:
+            self._stacks[ident] = stacks
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+                self._thread.start()
+        return stacks
+
+    def remove(self, ident):
+        with self._lock:
+            self._stacks.pop(ident, None)
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._stacks:
+                    self._thread = None
+                    return
+                frames = sys._current_frames()
+                for ident, stacks in self._stacks.items():
+                    frame = frames.get(ident)
+                    stack = []
+                    while frame is not None:
+                        code = frame.f_code
+                        stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                        frame = frame.f_back
+                    if stack:
+                        stacks[tuple(reversed(stack))] += 1
+
+
+_sampler = _StackSampler()
+
+
+def save_profile(profiler, directory, file, formats, elapsed):
+    """Write `<name>.prof` (for snakeviz/pstats) and a readable `<name>.txt` summary."""
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    name = f"{file.stem}-{'+'.join(formats)}-{stamp}"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(directory / f"{name}.prof"))
+
+        summary = io.StringIO()
+        summary.write(f"{file} -> {', '.join(formats)}: {elapsed:.2f}s\n\n")
+        pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(40)
+        (directory / f"{name}.txt").write_text(summary.getvalue(), encoding='utf-8')
+        logger.info("Saved profile for slow conversion of %s (%.1fs): %s", file.name, elapsed, directory / name)
+    except OSError as e:
+        logger.warning("Could not save profile for %s: %s", file.name, e)
+
+
+def save_samples(stacks, directory, file, formats, elapsed):
+    """Write a readable `<name>.txt` summary and `<name>.folded` stacks (for flamegraph/speedscope)."""
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    name = f"{file.stem}-{'+'.join(formats)}-{stamp}-sampled"
+    total = sum(stacks.values())
+    if not total:
+        return
+    inclusive, own = Counter(), Counter()
+    for stack, count in stacks.items():
+        own[stack[-1]] += count
+        for function in set(stack):
+            inclusive[function] += count
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / f"{name}.folded", 'w', encoding='utf-8') as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+        summary = io.StringIO()
+        summary.write(f"{file} -> {', '.join(formats)}: {elapsed:.2f}s, "
+                      f"{total} samples every {_sampler.interval * 1000:.0f}ms\n\n")
+        summary.write(f"{'cumulative':>10} {'own':>6}  function\n")
+        for function, count in inclusive.most_common(40):
+            summary.write(f"{count / total:>10.1%} {own[function] / total:>6.1%}  {function}\n")
+        (directory / f"{name}.txt").write_text(summary.getvalue(), encoding='utf-8')
+        logger.info("Saved sampled profile for slow conversion of %s (%.1fs): %s",
+                    file.name, elapsed, directory / name)
+    except OSError as e:
+        logger.warning("Could not save profile for %s: %s", file.name, e)
@@ -0,0 +1,69 @@
+"""Coalescing hand-off of conversion progress from worker threads to the UI."""
+
+import threading
+import time
+
+
+class ProgressChannel:
+    """Thread-safe mailbox between a ConversionThread and the Tk main loop.
+
+    Workers `publish()` as often as they like; only the latest progress value
+    is kept, while results are batched. The UI `drain()`s once per frame and
+    gets everything since the previous frame in one go. A ``None`` result
+    marks the end of the batch, as with the ConversionThread callback.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest = None
+        self._results = []
+        self._finished = False
+        self.published = 0
+        self.merged = 0
+        self.refreshes = 0
+
+    def publish(self, progress, status, result):
+        """Record an update (any thread)."""
+        with self._lock:
+            self.published += 1
+            if self._latest is not None:
+                self.merged += 1
+            self._latest = (progress, status)
+            if result is None:
+                self._finished = True
+            else:
+                self._results.append(result)
+
+    def drain(self):
+        """(latest (progress, status) or None, results, finished) since the last drain."""
+        with self._lock:
+            latest, self._latest = self._latest, None
+            results, self._results = self._results, []
+            finished, self._finished = self._finished, False
+            if latest is not None:
+                self.refreshes += 1
+        return latest, results, finished
+
+
+class RateMeter:
+    """Turns ProgressChannel counters into per-second rates for debug logging."""
+
+    def __init__(self, channel, interval=1.0):
+        self.channel = channel
+        self.interval = interval
+        self._since = time.monotonic()
+        self._refreshes = channel.refreshes
+        self._merged = channel.merged
+
+    def sample(self):
+        """(refreshes/s, merged updates) once per interval, else None."""
+        now = time.monotonic()
+        elapsed = now - self._since
+        if elapsed < self.interval:
+            return None
+        refreshes = self.channel.refreshes - self._refreshes
+        merged = self.channel.merged - self._merged
+        self._since = now
+        self._refreshes = self.channel.refreshes
+        self._merged = self.channel.merged
+        return refreshes / elapsed, merged
@@ -0,0 +1,89 @@
+"""Background scanning of folders for convertible files."""
+
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def supported_extensions():
+    """Source extensions the loaded converters can read, lowercase without dots."""
+    from convertext.registry import get_registry
+    return set(get_registry().list_supported_formats())
+
+
+class FolderScanThread(threading.Thread):
+    """Walk directory trees with os.scandir, streaming matches in batches.
+
+    `on_batch(paths, total_found)` is called from this thread every
+    `batch_size` matches and once more at the end; `on_done(total_found)`
+    follows the last batch. Both callbacks must hand work to the UI thread
+    themselves. Symlinked directories are not followed.
+    """
+
+    def __init__(self, roots, extensions, on_batch, on_done=None, batch_size=500):
+        super().__init__(daemon=True)
+        self.roots = [os.fspath(root) for root in roots]
+        self.extensions = {ext.lower().lstrip('.') for ext in extensions}
+        self.on_batch = on_batch
+        self.on_done = on_done
+        self.batch_size = batch_size
+        self.found = 0
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """Abandon the scan after the current directory."""
+        self._stop_event.set()
+
+    @property
+    def stopped(self):
+        return self._stop_event.is_set()
+
+    def run(self):
+        """Scan all roots depth-first in name order."""
+        logger.info("Scanning %d folder(s) for %d extensions", len(self.roots), len(self.extensions))
+        batch = []
+        stack = list(reversed(self.roots))
+
+        while stack and not self.stopped:
+            directory = stack.pop()
+            files, subdirs = self._scan_directory(directory)
+            stack.extend(reversed(subdirs))
+
+            batch.extend(files)
+            self.found += len(files)
+            if len(batch) >= self.batch_size:
+                self.on_batch(batch, self.found)
+                batch = []
+
+        if batch:
+            self.on_batch(batch, self.found)
+
+        logger.info("Scan %s: %d files", "stopped" if self.stopped else "complete", self.found)
+        if self.on_done:
+            self.on_done(self.found)
+
+    def _scan_directory(self, directory):
+        """(matching files, subdirectories) of one directory, each sorted by name."""
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file() and self._matches(entry.name):
+                            files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning("Cannot scan %s: %s", directory, e)
+        files.sort()
+        subdirs.sort()
+        return files, subdirs
+
+    def _matches(self, name):
+        _, ext = os.path.splitext(name)
+        return ext[1:].lower() in self.extensions
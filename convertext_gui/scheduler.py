@@ -0,0 +1,189 @@
+"""Cost model for ordering conversion work, learned from earlier batches."""
+
+import json
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+COST_MODEL_PATH = Path.home() / ".convertext" / "cost_model.json"
+
+# Seconds per byte before a pair has been measured (~5 MB/s) and per-file setup time
+DEFAULT_SECONDS_PER_BYTE = 1 / (5 * 1024 * 1024)
+OVERHEAD_SECONDS = 0.02
+SMOOTHING = 0.3
+# Smallest source whose memory growth says anything about the converter
+MIN_MEMORY_SAMPLE_BYTES = 1024 * 1024
+
+
+class CostModel:
+    """Per source->target throughput, smoothed across runs.
+
+    Each pair keeps an exponentially weighted average of seconds per input
+    byte, and of peak memory per input byte once one has been measured.
+    Pairs never measured fall back to the median of the measured ones, so a
+    machine that is slow overall still gets sensible relative costs. One
+    model can be shared by batches running at the same time.
+    """
+
+    def __init__(self, pairs=None, path=COST_MODEL_PATH):
+        self.pairs = pairs or {}
+        self.path = path
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=COST_MODEL_PATH):
+        """Model stored at `path`, or an empty one."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                pairs = json.load(f)['pairs']
+            return cls({key: dict(value) for key, value in pairs.items()}, path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug("No usable cost model: %s", e)
+            return cls(path=path)
+
+    def save(self):
+        """Write the model back (atomic, best-effort)."""
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump({'pairs': self.pairs}, f, indent=1, sort_keys=True)
+                tmp.replace(self.path)
+            except OSError as e:
+                logger.warning("Could not save cost model: %s", e)
+
+    def seconds_per_byte(self, source_fmt, target_fmt):
+        """Smoothed seconds per input byte for a pair."""
+        entry = self.pairs.get(_pair(source_fmt, target_fmt))
+        if entry:
+            return entry['seconds_per_byte']
+        if self.pairs:
+            rates = sorted(e['seconds_per_byte'] for e in list(self.pairs.values()))
+            return rates[len(rates) // 2]
+        return DEFAULT_SECONDS_PER_BYTE
+
+    def estimate(self, size, source_fmt, target_fmt):
+        """Expected seconds to convert `size` bytes from one format to another."""
+        return OVERHEAD_SECONDS + size * self.seconds_per_byte(source_fmt, target_fmt)
+
+    def observe(self, size, source_fmt, target_fmt, seconds):
+        """Fold one measured conversion into the model."""
+        if size <= 0 or seconds <= 0:
+            return
+        sample = max(seconds - OVERHEAD_SECONDS, 0) / size
+        key = _pair(source_fmt, target_fmt)
+        with self._lock:
+            entry = self.pairs.get(key)
+            if entry is None:
+                self.pairs[key] = {'seconds_per_byte': sample, 'samples': 1}
+            else:
+                entry['seconds_per_byte'] += SMOOTHING * (sample - entry['seconds_per_byte'])
+                entry['samples'] += 1
+
+    def memory_per_byte(self, source_fmt, target_fmt):
+        """Smoothed peak memory per input byte for a pair, or None if never measured."""
+        entry = self.pairs.get(_pair(source_fmt, target_fmt))
+        return entry.get('memory_per_byte') if entry else None
+
+    def observe_memory(self, size, source_fmt, target_fmt, memory_bytes):
+        """Fold one conversion's memory growth into an already observed pair.
+
+        Small sources are ignored: their growth is mostly interpreter and
+        import overhead, which would inflate the per-byte figure.
+        """
+        entry = self.pairs.get(_pair(source_fmt, target_fmt))
+        if entry is None or not memory_bytes or size < MIN_MEMORY_SAMPLE_BYTES:
+            return
+        sample = memory_bytes / size
+        with self._lock:
+            if 'memory_per_byte' not in entry:
+                entry['memory_per_byte'] = sample
+            else:
+                entry['memory_per_byte'] += SMOOTHING * (sample - entry['memory_per_byte'])
+
+    def order(self, units, sizes):
+        """Units (file, formats) sorted most expensive first.
+
+        Starting the longest jobs first keeps one big file from stretching
+        the tail of a parallel batch. Ties keep their original order.
+        """
+        def cost(unit):
+            file, formats = unit
+            source_fmt = file.suffix.lstrip('.').lower()
+            return sum(self.estimate(sizes.get(file, 0), source_fmt, fmt) for fmt in formats)
+
+        return sorted(units, key=cost, reverse=True)
+
+
+def _pair(source_fmt, target_fmt):
+    return f"{source_fmt.lower()}->{target_fmt.lower()}"
+
+
+class ETAEstimator:
+    """Byte-weighted progress and time-remaining for one batch.
+
+    Every (file, format) pair is weighted by its cost-model estimate, so a
+    300 MB PDF counts for far more than a 2 KB text file. How fast that
+    estimated work is actually getting done is tracked as an exponentially
+    smoothed rate, seeded with `workers` (the model's estimates are per
+    worker), which absorbs parallelism and machine speed.
+    """
+
+    # Shortest interval the rate is sampled over; parallel completions arrive in bursts
+    MIN_SAMPLE_SECONDS = 0.5
+
+    def __init__(self, cost_model, workers=1):
+        self.cost_model = cost_model
+        self.rate = float(max(1, workers))
+        self.total_bytes = 0
+        self.done_bytes = 0
+        self.total_pairs = 0
+        self.done_pairs = 0
+        self.remaining_cost = 0.0
+        self._pairs = {}
+        self._measured = False
+        self._sample_cost = 0.0
+        self._sample_start = 0.0
+
+    def add(self, file, size, target_fmt):
+        """Register one pair of the batch."""
+        cost = self.cost_model.estimate(size, file.suffix.lstrip('.'), target_fmt)
+        self._pairs[(file, target_fmt)] = (size, cost)
+        self.total_bytes += size
+        self.total_pairs += 1
+        self.remaining_cost += cost
+
+    def complete(self, file, target_fmt, elapsed, cached=False):
+        """Mark a pair done; `elapsed` is active (unpaused) batch time so far."""
+        size, cost = self._pairs.pop((file, target_fmt), (0, 0.0))
+        self.done_bytes += size
+        self.done_pairs += 1
+        self.remaining_cost = max(self.remaining_cost - cost, 0.0)
+        if cached:
+            # Cache hits cost nothing; counting them would inflate the rate
+            return
+
+        self._sample_cost += cost
+        interval = elapsed - self._sample_start
+        if interval >= self.MIN_SAMPLE_SECONDS:
+            sample = self._sample_cost / interval
+            self.rate = sample if not self._measured else self.rate + SMOOTHING * (sample - self.rate)
+            self._measured = True
+            self._sample_cost = 0.0
+            self._sample_start = elapsed
+
+    @property
+    def progress(self):
+        """Percent done by bytes (by pair count when sizes are unknown)."""
+        if self.total_bytes:
+            return self.done_bytes / self.total_bytes * 100
+        return self.done_pairs / self.total_pairs * 100 if self.total_pairs else 0.0
+
+    def eta_seconds(self):
+        """Estimated seconds until the batch finishes."""
+        if not self.remaining_cost or self.done_pairs == self.total_pairs:
+            return 0
+        return int(self.remaining_cost / self.rate)
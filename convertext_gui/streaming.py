@@ -0,0 +1,374 @@
+"""Chunked conversions for very large text sources.
+
+The regular converters read a whole file into one string, build a full parse
+tree and a Document, and only then write. These streamers produce the same
+output for TXT->MD, HTML/HTM->TXT and MD->HTML while holding at most one
+chunk plus the largest single paragraph in memory. They are used only for
+files at or above `ConversionThread(stream_over=...)`, and only while the
+registry still maps the pair to the converter whose output they reproduce.
+"""
+
+import logging
+import re
+import time
+from collections import deque
+from html.parser import HTMLParser
+
+from convertext_gui.conversion import ConversionRecord, _effective_config
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+# Blocks held back while an HTML document's title is still unknown
+TITLE_LOOKAHEAD = 4 * 1024 * 1024
+
+
+def _encoding(config):
+    return config.get('documents', {}).get('encoding', 'utf-8')
+
+
+def _title_override(source, config):
+    if config.get('documents', {}).get('title_from_filename', False):
+        return source.stem
+    return None
+
+
+def stream_txt_to_md(source, target, config):
+    """Plain text to Markdown, paragraph by paragraph (mirrors TxtConverter)."""
+    with open(source, 'r', encoding=_encoding(config)) as src, \
+            open(target, 'w', encoding='utf-8') as out:
+        head = ''
+        header = None
+        while header is None:
+            chunk = src.read(CHUNK_SIZE)
+            head += chunk
+            header = _txt_header(head, final=not chunk)
+        title, author, buffer = header
+        title = _title_override(source, config) or title
+        if title:
+            out.write(f"# {title}\n\n")
+        if author:
+            out.write(f"**Author:** {author}\n\n")
+
+        while True:
+            # Splitting what has been read so far finds the same separators as
+            # splitting the whole file; the last piece may still be growing
+            parts = buffer.split('\n\n')
+            buffer = parts.pop()
+            for paragraph in parts:
+                if paragraph.strip():
+                    out.write(paragraph.strip() + '\n\n')
+            chunk = src.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            buffer += chunk
+
+        if buffer.strip():
+            out.write(buffer.strip() + '\n\n')
+    return True
+
+
+def _txt_header(head, final):
+    """(title, author, rest) for the ``Title`` / ``=====`` / ``By:`` header read_txt understands.
+
+    Returns None while `head` ends before the header can be decided; unless
+    `final`, its last line may be incomplete.
+    """
+    lines = head.split('\n')
+    complete = len(lines) if final else len(lines) - 1
+    title = author = None
+    i = 0
+    if complete < 2 and not final:
+        return None
+    if len(lines) >= 2 and lines[1].strip() and all(c == '=' for c in lines[1].strip()):
+        title = lines[0].strip()
+        i = 2
+        while i < complete and not lines[i].strip():
+            i += 1
+        if i == complete and not final:
+            return None
+        if i < complete and lines[i].startswith('By:'):
+            author = lines[i][3:].strip()
+            i += 1
+        # Blank lines left here only yield empty paragraphs, which are skipped
+        while i < complete and not lines[i].strip():
+            i += 1
+    return title, author, '\n'.join(lines[i:])
+
+
+class _BlockParser(HTMLParser):
+    """Incremental HTML reader emitting the heading/paragraph blocks collect_blocks finds.
+
+    Tags are nested the way BeautifulSoup's html.parser builder nests them:
+    void elements are never opened and an end tag closes everything opened
+    since its matching start tag. Lists and tables produce no blocks; text
+    writers drop those anyway. A block takes its place in the output when
+    its tag opens, as collect_blocks walks the tree in document order, and
+    is emitted once it and every block before it have closed.
+    """
+
+    HEADINGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+    CONTAINERS = {'ul', 'ol', 'table', 'blockquote'}
+    BLOCKS = {'p', 'pre', 'div'} | HEADINGS | CONTAINERS
+    CAPTURED = {'p', 'pre', 'div', 'blockquote'} | HEADINGS
+    VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param',
+            'source', 'track', 'wbr'}
+    RAW_TEXT = {'script', 'style'}
+
+    def __init__(self, on_block):
+        super().__init__(convert_charrefs=True)
+        self.on_block = on_block
+        # Like read_html, only the first <title> and the first <h1> count, even when empty
+        self.title = None
+        self.title_seen = False
+        self.first_h1 = None
+        self.h1_seen = False
+        self._title_parts = None
+        self._h1_parts = None
+        self._h1_depth = None
+        # [tag, text parts or None when not captured, output slot or None]
+        self._stack = []
+        # [kind, text, closed] in document order
+        self._slots = deque()
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'br':
+            self._add_text('\n')
+        if tag in self.VOID:
+            return
+        if tag in self.BLOCKS:
+            # Enclosing divs now hold a block, so they are not leaf paragraphs
+            for entry in self._stack:
+                if entry[0] == 'div' and entry[1] is not None:
+                    entry[1] = None
+                    entry[2][2] = True
+            self._flush()
+        if tag == 'title' and not self.title_seen and self._title_parts is None:
+            self._title_parts = []
+        if tag == 'h1' and not self.h1_seen and self._h1_parts is None:
+            self._h1_parts = []
+            self._h1_depth = len(self._stack)
+        slot = None
+        if tag in self.CAPTURED and not self._inside_container():
+            slot = ['heading' if tag in self.HEADINGS else 'paragraph', None, False]
+            self._slots.append(slot)
+        self._stack.append([tag, [] if slot else None, slot])
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in self.VOID:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > index:
+            self._close(*self._stack.pop())
+        self._flush()
+
+    def handle_data(self, data):
+        if self._stack and self._stack[-1][0] in self.RAW_TEXT:
+            return
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        if self._h1_parts is not None:
+            self._h1_parts.append(data)
+        self._add_text(data)
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self._close(*self._stack.pop())
+        self._flush()
+
+    def _add_text(self, data):
+        for _, parts, _ in self._stack:
+            if parts is not None:
+                parts.append(data)
+
+    def _inside_container(self):
+        return any(tag in self.CONTAINERS for tag, _, _ in self._stack)
+
+    def _close(self, tag, parts, slot):
+        if tag == 'title' and self._title_parts is not None:
+            self.title = ''.join(self._title_parts).strip() or None
+            self.title_seen = True
+            self._title_parts = None
+        if tag == 'h1' and self._h1_depth == len(self._stack):
+            self.first_h1 = ''.join(self._h1_parts).strip() or None
+            self.h1_seen = True
+            self._h1_parts = self._h1_depth = None
+        if slot is None:
+            return
+        if parts is not None:
+            slot[1] = ''.join(parts).strip()
+        slot[2] = True
+
+    def _flush(self):
+        """Emit the closed blocks at the front of the output order."""
+        while self._slots and self._slots[0][2]:
+            kind, text, _ = self._slots.popleft()
+            if text:
+                self.on_block(kind, text)
+
+
+def stream_html_to_txt(source, target, config):
+    """HTML to plain text, block by block (mirrors HtmlConverter)."""
+    override = _title_override(source, config)
+    held = []
+    held_bytes = 0
+    title_decided = False
+
+    with open(source, 'r', encoding=_encoding(config)) as src, \
+            open(target, 'w', encoding='utf-8') as out:
+
+        def write_block(kind, text):
+            if kind == 'heading':
+                out.write('\n' + text.upper() + '\n')
+                out.write('-' * len(text) + '\n\n')
+            else:
+                out.write(text + '\n\n')
+
+        def decide_title():
+            nonlocal title_decided
+            title = override or parser.title or parser.first_h1
+            if title:
+                out.write(title + '\n')
+                out.write('=' * len(title) + '\n\n')
+            for block in held:
+                write_block(*block)
+            held.clear()
+            title_decided = True
+
+        def on_block(kind, text):
+            nonlocal held_bytes
+            if title_decided:
+                write_block(kind, text)
+                return
+            held.append((kind, text))
+            held_bytes += len(text)
+
+        parser = _BlockParser(on_block)
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), ''):
+            parser.feed(chunk)
+            # The title comes from <title>, else the first <h1>; blocks wait until it is known
+            if not title_decided and (override or parser.title or parser.h1_seen
+                                      or held_bytes > TITLE_LOOKAHEAD):
+                decide_title()
+        parser.close()
+        if not title_decided:
+            decide_title()
+    return True
+
+
+_LIST_ITEM = re.compile(r'([-*+]|\d+[.)])\s')
+_FENCE = re.compile(r'\s*(```|~~~)')
+
+
+def stream_md_to_html(source, target, config):
+    """Markdown to HTML, rendering runs of whole blocks at a time (mirrors MarkdownConverter)."""
+    from convertext.converters.utils import escape_html
+
+    with open(source, 'r', encoding=_encoding(config)) as src, \
+            open(target, 'w', encoding='utf-8') as out:
+        out.write('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+                  '<title>Document</title>\n</head>\n<body>')
+
+        def render(lines):
+            for block in _markdown_blocks(''.join(lines)):
+                if block['type'] == 'paragraph':
+                    out.write(f"\n<p>{escape_html(block['data'])}</p>")
+                elif block['type'] == 'heading':
+                    level = block['level']
+                    out.write(f"\n<h{level}>{escape_html(block['data'])}</h{level}>")
+
+        lines = []
+        size = 0
+        in_fence = False
+        previous_blank = False
+        for line in src:
+            # Only cut before an unindented, non-list line that follows a blank
+            # line outside a code fence, so no block spans two chunks
+            if (size >= CHUNK_SIZE and previous_blank and not in_fence and line.strip()
+                    and not line[0].isspace() and not _LIST_ITEM.match(line)):
+                render(lines)
+                lines = []
+                size = 0
+            if _FENCE.match(line):
+                in_fence = not in_fence
+            previous_blank = not line.strip()
+            lines.append(line)
+            size += len(line)
+        render(lines)
+        out.write('\n</body>\n</html>')
+    return True
+
+
+def _markdown_blocks(text):
+    """Content blocks of a Markdown fragment, parsed exactly as read_markdown does."""
+    import markdown
+    from bs4 import BeautifulSoup
+    from convertext.converters.base import Document
+    from convertext.converters.readers import collect_blocks
+
+    doc = Document()
+    html = markdown.markdown(text, extensions=['tables', 'fenced_code'])
+    collect_blocks(BeautifulSoup(html, 'html.parser'), doc)
+    return doc.content
+
+
+# (source format, target format) -> (converter the output mirrors, streamer)
+STREAMERS = {
+    ('txt', 'md'): ('TxtConverter', stream_txt_to_md),
+    ('html', 'txt'): ('HtmlConverter', stream_html_to_txt),
+    ('htm', 'txt'): ('HtmlConverter', stream_html_to_txt),
+    ('md', 'html'): ('MarkdownConverter', stream_md_to_html),
+    ('markdown', 'html'): ('MarkdownConverter', stream_md_to_html),
+}
+
+
+def can_stream(engine, file, fmt):
+    """True if `file` -> `fmt` has a streamer matching the registered converter."""
+    key = (file.suffix.lstrip('.').lower(), fmt.lower())
+    if key not in STREAMERS:
+        return False
+    converter = engine.registry.get_converter(*key)
+    return type(converter).__name__ == STREAMERS[key][0]
+
+
+def stream_convert(engine, file, fmt):
+    """Streamed equivalent of `convert_pair`, never raising."""
+    logger.debug("Streaming %s to %s", file.name, fmt)
+    start = time.perf_counter()
+    cpu_start = time.thread_time()
+    converter_name, streamer = STREAMERS[(file.suffix.lstrip('.').lower(), fmt.lower())]
+
+    target_path = None
+    try:
+        config = _effective_config(engine, file)
+        target_path = engine._get_target_path(file, fmt, config)
+        if target_path.exists() and not config.get('output.overwrite', False):
+            return ConversionRecord(
+                success=False,
+                source_path=file,
+                target_path=target_path,
+                error="Target file already exists (use --overwrite)"
+            )
+        ok = streamer(file, target_path, config.config)
+        error = None if ok else "Conversion failed"
+    except Exception as e:
+        logger.exception("Streaming conversion failed for %s to %s: %s", file.name, fmt, e)
+        ok, error = False, str(e)
+
+    return ConversionRecord(
+        success=bool(ok),
+        source_path=file,
+        target_path=target_path,
+        error=error,
+        seconds=time.perf_counter() - start,
+        cpu_seconds=time.thread_time() - cpu_start,
+        converter=f"{converter_name} (streaming)"
+    )
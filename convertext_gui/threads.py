@@ -2,18 +2,147 @@
 
 import threading
 import logging
+import multiprocessing
+import os
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
 from convertext.core import ConversionEngine
+from convertext_gui.conversion import ConversionRecord, _effective_config, convert_source, streamed_formats
+from convertext_gui.engines import EnginePool, engine_with_overrides
+from convertext_gui.incremental import settings_key
+from convertext_gui.memory import estimate_memory
+from convertext_gui.metrics import summarize
+from convertext_gui.scheduler import CostModel, ETAEstimator
 
 logger = logging.getLogger(__name__)
 
+BACKENDS = ("thread", "process")
+
+# Per-process engines by config snapshot, built once by _init_process_worker
+_worker_engines = None
+
+
+def _init_process_worker():
+    """Load converters and set up this worker process's engines once."""
+    global _worker_engines
+    from convertext.converters.loader import load_converters
+    from convertext.config import Config
+
+    load_converters()
+    _worker_engines = EnginePool(Config())
+
+
+def _convert_in_process(overrides, file, formats, keep_intermediate, cache, profile, stream_over):
+    """Process-pool entry point reusing the worker's engine for `overrides`."""
+    # A worker process converts one unit at a time, so its memory growth is the unit's own
+    engine = _worker_engines.get(overrides, keep_intermediate)
+    return convert_source(engine, file, formats, keep_intermediate, cache, profile, stream_over,
+                          measure_memory=True)
+
+
+class CancelToken:
+    """Cooperative cancel/pause flag shared by a batch and its workers."""
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+        self._paused_at = None
+        self.paused_seconds = 0.0
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def cancel(self):
+        """Stop starting new conversions; in-flight ones finish."""
+        self._cancelled.set()
+        self.resume()
+
+    def pause(self):
+        """Hold new conversions until `resume`."""
+        if self._running.is_set():
+            self._paused_at = time.time()
+            self._running.clear()
+
+    def resume(self):
+        """Release a pause."""
+        if not self._running.is_set():
+            self.paused_seconds += time.time() - self._paused_at
+            self._running.set()
+
+    def checkpoint(self):
+        """Block while paused; False once cancelled."""
+        self._running.wait()
+        return not self.cancelled
+
 
 class ConversionThread(threading.Thread):
-    """Background thread for file conversion."""
+    """Background thread for file conversion.
+
+    With ``workers > 1`` the (file, format) pairs are spread across a pool:
+    threads share ``engine``, while the ``"process"`` backend gives each worker
+    process its own engine so CPU-bound parsing escapes the GIL. Results are
+    collected back on this thread, so the callback always sees monotonically
+    increasing progress and the final completion signal last.
 
-    def __init__(self, engine, files, formats, output_dir, overwrite, keep_intermediate, callback):
+    With ``multi_target`` each file is one work unit: it is parsed once and
+    every selected format is written from that parse where possible. A
+    ``cache`` (see `convertext_gui.cache.ConversionCache`) short-circuits
+    conversions of unchanged content.
+
+    ``token`` is checked before each unit starts, both here and inside the
+    pool, so cancelling lets in-flight files finish and skips the rest; the
+    final callback then reports the partial result.
+
+    With a ``cost_model`` (see `convertext_gui.scheduler.CostModel`) units
+    start most expensive first, and every fresh conversion's timing is fed
+    back into the model, which is saved when the batch ends. ``profile``
+    (see `convertext_gui.profiling.ProfileSettings`) saves a cProfile dump for
+    every unit slower than its threshold.
+
+    Sources of at least ``stream_over`` bytes are converted in chunks where a
+    streamer exists (see `convertext_gui.streaming`). A ``memory_budget``
+    (see `convertext_gui.memory.MemoryBudget`) holds back units whose
+    estimated memory would not fit next to the ones already running or in
+    the live resident memory; estimates come from the cost model's measured
+    memory per byte where it has one. ``admitted_units`` and ``queued_units``
+    count units started and not yet finished, and units not yet started.
+
+    The batch's output options never touch ``engine``: they are applied as
+    overrides on an engine of their own, taken from ``engine_pool`` (see
+    `convertext_gui.engines.EnginePool`) when given, so batches with
+    different settings can run at the same time.
+
+    With a ``scheduler`` (see `convertext_gui.jobs.FairScheduler`) a batch
+    runs its units on the scheduler's shared workers instead of a pool of
+    its own, getting a share of them proportional to ``weight``; process
+    batches hand each unit on to the scheduler's shared process pool.
+
+    With a ``journal`` (see `convertext_gui.journal.BatchJournal`) every
+    outcome is appended to it as it arrives, pairs it already lists as done
+    are skipped, and it is removed when the batch ends, so only a batch
+    that died midway or was stopped with `interrupt` leaves one to resume
+    from.
+
+    With ``incremental`` (see `convertext_gui.incremental.OutputManifest`)
+    pairs whose outputs are up to date are skipped before anything is
+    queued, judged from file stats alone; the rest are rebuilt over their
+    stale outputs. ``skipped`` counts the pairs left alone, and the final
+    status reports converted, up-to-date and failed pairs separately.
+    """
+
+    def __init__(self, engine, files, formats, output_dir, overwrite, keep_intermediate, callback,
+                 workers=1, backend="thread", multi_target=False, cache=None, token=None,
+                 cost_model=None, profile=None, stream_over=None, memory_budget=None, engine_pool=None,
+                 scheduler=None, weight=1.0, journal=None, incremental=None):
         super().__init__(daemon=True)
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
         self.engine = engine
         self.files = files
         self.formats = formats
@@ -21,6 +150,30 @@ class ConversionThread(threading.Thread):
         self.overwrite = overwrite
         self.keep_intermediate = keep_intermediate
         self.callback = callback
+        self.workers = max(1, int(workers))
+        self.backend = backend
+        self.multi_target = multi_target
+        self.cache = cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.token = token or CancelToken()
+        self.cost_model = cost_model
+        self.profile = profile
+        self.stream_over = stream_over
+        self.memory_budget = memory_budget
+        self.engine_pool = engine_pool
+        self.scheduler = scheduler
+        self.weight = weight
+        self.journal = journal
+        self.resumed = 0
+        self.interrupted = False
+        self.incremental = incremental
+        self.skipped = 0
+        self._settings = {}
+        self._model = None
+        self._sizes = {}
+        self.admitted_units = 0
+        self.queued_units = 0
         self.results = []
         self.start_time = None
 
@@ -30,67 +183,378 @@ class ConversionThread(threading.Thread):
         completed = 0
         self.start_time = time.time()
 
-        logger.info(f"Starting conversion: {len(self.files)} files, {len(self.formats)} formats")
+        logger.info("Starting conversion: %d files, %d formats, %d %s worker(s)",
+                    len(self.files), len(self.formats), self.workers, self.backend)
+
+        # This batch's options live in its own engine; the shared one is never modified
+        overrides = self._config_overrides()
+        if overrides:
+            keep = self.keep_intermediate or self.engine.keep_intermediate
+            self.engine = (self.engine_pool.get(overrides, keep) if self.engine_pool
+                           else engine_with_overrides(self.engine, overrides))
 
-        # Update config
+        if self.multi_target:
+            units = [(file, list(self.formats)) for file in self.files]
+        else:
+            units = [(file, [fmt]) for file in self.files for fmt in self.formats]
+
+        if self.journal:
+            units = [(file, [fmt for fmt in formats if not self.journal.is_done(file, fmt)]) for file, formats in units]
+            units = [unit for unit in units if unit[1]]
+            self.resumed = total - sum(len(formats) for _, formats in units)
+            completed = self.resumed
+            if self.resumed:
+                logger.info("Skipping %d conversions finished before the batch was interrupted", self.resumed)
+
+        if self.incremental is not None:
+            units = self._outdated(units)
+            completed += self.skipped
+
+        # Without a persistent model the defaults still weight work by size
+        sizes = self._sizes = self._source_sizes(file for file, _ in units)
+        self._model = self.cost_model or CostModel()
+        estimator = ETAEstimator(self._model, self.scheduler.workers if self._scheduled else self.workers)
+        for file, formats in units:
+            for fmt in formats:
+                estimator.add(file, sizes[file], fmt)
+        if self.cost_model:
+            units = self.cost_model.order(units, sizes)
+        self.queued_units = len(units)
+
+        if self._scheduled:
+            outcomes = self._run_scheduled(units)
+        elif self.backend == "process":
+            outcomes = self._run_processes(units)
+        elif self.workers > 1:
+            outcomes = self._run_threads(units)
+        else:
+            outcomes = self._run_inline(units)
+
+        for result in (record for records in outcomes for record in records):
+            self.results.append(result)
+            if self.journal:
+                self.journal.record(result)
+            if self.incremental is not None and result.success and result.target_path:
+                _, key = self._output_settings(result.source_path)
+                if key:
+                    self.incremental.record(result.source_path, result.target_format, result.target_path, key)
+            if result.success:
+                logger.info("✓ %s → %s%s", result.source_path.name, result.target_path.name,
+                            " (cached)" if result.cached else "")
+            else:
+                logger.error("✗ %s: %s", result.source_path.name, result.error)
+
+            if self.cost_model and result.success and not result.cached:
+                size = sizes.get(result.source_path, 0)
+                source_fmt = result.source_path.suffix.lstrip('.')
+                self.cost_model.observe(size, source_fmt, result.target_format, result.seconds)
+                self.cost_model.observe_memory(size, source_fmt, result.target_format, result.memory_bytes)
+
+            if self.cache is not None:
+                if result.cached:
+                    self.cache_hits += 1
+                else:
+                    self.cache_misses += 1
+
+            # Update progress with ETA
+            completed += 1
+            elapsed = time.time() - self.start_time - self.token.paused_seconds
+            estimator.complete(result.source_path, result.target_format, elapsed, result.cached)
+            progress = estimator.progress
+            eta_seconds = estimator.eta_seconds()
+            if eta_seconds > 60:
+                eta = f"{eta_seconds // 60}m {eta_seconds % 60}s"
+            else:
+                eta = f"{eta_seconds}s"
+
+            status = f"Converting... {int(progress)}% | ETA: {eta}{self._memory_status()}{self._cache_status()}"
+            self.callback(progress, status, result)
+
+        # Finish
+        successful = sum(1 for r in self.results if r.success)
+        summary = summarize(self.results)
+        logger.info("Batch metrics: %.1fs wall, %.1fs CPU, %d bytes in, %d bytes out, peak RSS %s",
+                    summary['seconds'], summary['cpu_seconds'], summary['input_bytes'],
+                    summary['output_bytes'], summary['peak_rss'])
+        if self.cache is not None:
+            logger.info("Cache: %d hits, %d misses", self.cache_hits, self.cache_misses)
+            self.cache.evict()
+        if self.cost_model:
+            self.cost_model.save()
+        if self.journal:
+            self.journal.finish(remove=not self.interrupted)
+        if self.incremental is not None:
+            self.incremental.save()
+            logger.info("Incremental: %d converted, %d up to date, %d failed",
+                        successful, self.skipped, len(self.results) - successful)
+
+        if self.cancelled:
+            logger.info("Conversion cancelled: %d/%d successful, %d not started",
+                        successful, len(self.results), total - completed)
+            self.callback(estimator.progress,
+                          f"Conversion cancelled: {completed}/{total} done{self._counts_status()}{self._cache_status()}",
+                          None)
+        else:
+            logger.info("Conversion complete: %d/%d successful", successful, len(self.results))
+            self.callback(100, f"Conversion complete!{self._counts_status()}{self._cache_status()}", None)
+
+    @property
+    def cancelled(self):
+        return self.token.cancelled
+
+    def interrupt(self):
+        """Cancel, keeping the journal so the batch can be resumed later."""
+        self.interrupted = True
+        self.token.cancel()
+
+    @property
+    def _scheduled(self):
+        return self.scheduler is not None
+
+    def set_weight(self, weight):
+        """Change this batch's share of a shared scheduler while it runs."""
+        self.weight = weight
+        if self.scheduler is not None:
+            self.scheduler.set_weight(self, weight)
+
+    def _cache_status(self):
+        """Status-line suffix with cache hit/miss counts."""
+        if self.cache is None:
+            return ""
+        return f" | Cache: {self.cache_hits} hits / {self.cache_misses} misses"
+
+    def _counts_status(self):
+        """Status-line suffix with converted/up-to-date/failed counts in incremental mode."""
+        if self.incremental is None:
+            return ""
+        failed = sum(1 for r in self.results if not r.success)
+        return f" {len(self.results) - failed} converted, {self.skipped} up to date, {failed} failed"
+
+    def _memory_status(self):
+        """Status-line suffix with the admitted/queued breakdown under a memory budget."""
+        if self.memory_budget is None:
+            return ""
+        return (f" | {self.admitted_units} admitted, {self.queued_units} queued, "
+                f"{self.memory_budget.in_use / 1024 ** 3:.1f}/{self.memory_budget.max_bytes / 1024 ** 3:.1f} GB")
+
+    def _source_sizes(self, files):
+        """Size in bytes of every source file (0 if it cannot be read)."""
+        sizes = {}
+        for file in files:
+            try:
+                sizes[file] = file.stat().st_size
+            except OSError:
+                sizes[file] = 0
+        return sizes
+
+    def _config_overrides(self):
+        """Config overrides implied by this batch's options."""
+        overrides = {}
         if self.output_dir:
-            self.engine.config.override({'output': {'directory': str(self.output_dir)}})
-            logger.debug(f"Output directory: {self.output_dir}")
+            overrides.setdefault('output', {})['directory'] = str(self.output_dir)
+            logger.debug("Output directory: %s", self.output_dir)
 
-        if self.overwrite:
-            self.engine.config.override({'output': {'overwrite': True}})
+        # Incremental batches only rebuild stale outputs, so those must be replaced
+        if self.overwrite or self.incremental is not None:
+            overrides.setdefault('output', {})['overwrite'] = True
             logger.debug("Overwrite enabled")
 
         if self.keep_intermediate:
-            self.engine.config.override({'conversion': {'keep_intermediate': True}})
+            overrides['conversion'] = {'keep_intermediate': True}
             logger.debug("Keep intermediate files enabled")
 
-        for file in self.files:
-            for fmt in self.formats:
-                logger.info(f"Converting {file.name} to {fmt}")
+        return overrides
 
-                try:
-                    # Convert
-                    result = self.engine.convert(file, fmt)
-                    self.results.append(result)
+    def _output_settings(self, file):
+        """(config, settings key) for `file`, or (None, None) if its target paths cannot be worked out.
+
+        Folder configs make these per directory, so a large tree costs one
+        config build per folder rather than per file.
+        """
+        directory = os.path.dirname(file)
+        settings = self._settings.get(directory)
+        if settings is None:
+            try:
+                config = _effective_config(self.engine, file)
+                settings = (config, settings_key(config))
+            except Exception as e:
+                logger.debug("Cannot check outputs in %s: %s", file.parent, e)
+                settings = (None, None)
+            self._settings[directory] = settings
+        return settings
+
+    def _outdated(self, units):
+        """Units narrowed to the pairs whose outputs are missing or stale."""
+        outdated = []
+        for file, formats in units:
+            config, key = self._output_settings(file)
+            if config is None:
+                outdated.append((file, formats))
+                continue
+            stale = [fmt for fmt in formats
+                     if not self.incremental.up_to_date(file, fmt, self.engine._get_target_path(file, fmt, config), key)]
+            self.skipped += len(formats) - len(stale)
+            if stale:
+                outdated.append((file, stale))
+        if self.skipped:
+            logger.info("Skipping %d conversions whose outputs are up to date", self.skipped)
+        return outdated
 
-                    if result.success:
-                        logger.info(f"✓ {file.name} → {result.target_path.name}")
-                    else:
-                        logger.error(f"✗ {file.name}: {result.error}")
+    def _memory_estimate(self, file, formats):
+        """Estimated peak memory of converting one unit (its formats share one parse)."""
+        size = self._sizes.get(file, 0)
+        source_fmt = file.suffix.lstrip('.').lower()
+        streamed = streamed_formats(self.engine, file, formats, self.stream_over, size)
+        estimates = []
+        for fmt in formats:
+            factor = self.cost_model.memory_per_byte(source_fmt, fmt) if self.cost_model else None
+            estimates.append(estimate_memory(size, streamed=fmt in streamed, factor=factor))
+        return max(estimates)
 
+    def _reserve_memory(self, file, formats, block):
+        """Reserve budget for a unit: bytes reserved (0 without a budget) or None if refused."""
+        if self.memory_budget is None:
+            return 0
+        amount = self._memory_estimate(file, formats)
+        if block:
+            admitted = self.memory_budget.acquire(amount, should_stop=lambda: self.token.cancelled)
+        else:
+            admitted = self.memory_budget.try_acquire(amount)
+        if not admitted:
+            return None
+        logger.debug("Admitted %s (~%d MB estimated)", file.name, amount // 1024 ** 2)
+        return amount
+
+    def _run_inline(self, units):
+        """Convert units one by one on this thread."""
+        for file, formats in units:
+            if not self.token.checkpoint():
+                return
+            reserved = self._reserve_memory(file, formats, block=True)
+            if reserved is None:
+                return
+            self._start_unit()
+            try:
+                records = convert_source(self.engine, file, formats, self.keep_intermediate, self.cache,
+                                         self.profile, self.stream_over, measure_memory=True)
+            finally:
+                self.admitted_units -= 1
+                if reserved:
+                    self.memory_budget.release(reserved)
+            yield records
+
+    def _start_unit(self):
+        self.queued_units -= 1
+        self.admitted_units += 1
+
+    def _convert_unit(self, file, formats):
+        """Thread-pool task; skips units that were queued before a cancel."""
+        if self.token.cancelled:
+            return []
+        # Other workers' allocations would count against this unit
+        alone = (self.scheduler.workers if self._scheduled else self.workers) == 1
+        return convert_source(self.engine, file, formats, self.keep_intermediate, self.cache,
+                              self.profile, self.stream_over, measure_memory=alone)
+
+    def _convert_unit_in_process(self, file, formats):
+        """Scheduler task of a process batch: convert the unit on the shared process pool."""
+        if self.token.cancelled:
+            return []
+        return self.scheduler.submit_process(_init_process_worker, _convert_in_process, self.engine.overrides, file,
+                                             formats, self.keep_intermediate, self.cache, self.profile,
+                                             self.stream_over).result()
+
+    def _run_threads(self, units):
+        """Convert units on a thread pool, yielding their records as they finish."""
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="convert") as pool:
+            submit = lambda file, formats: pool.submit(self._convert_unit, file, formats)
+            yield from self._outcomes(self._feed(submit, units))
+
+    def _run_scheduled(self, units):
+        """Convert units on the shared fair-share scheduler, yielding their records as they finish."""
+        def submit(file, formats):
+            source_fmt = file.suffix.lstrip('.')
+            cost = sum(self._model.estimate(self._sizes.get(file, 0), source_fmt, fmt) for fmt in formats)
+            task = self._convert_unit_in_process if self.backend == "process" else self._convert_unit
+            return self.scheduler.submit(self, cost, task, file, formats)
+
+        self.scheduler.register(self, self.weight)
+        try:
+            yield from self._outcomes(self._feed(submit, units, self.scheduler.workers))
+        finally:
+            self.scheduler.unregister(self)
+
+    def _run_processes(self, units):
+        """Convert units on a process pool, yielding their records as they finish."""
+        # spawn: forking a process that runs Tk and other threads is unsafe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                 initializer=_init_process_worker) as pool:
+            submit = lambda file, formats: pool.submit(
+                _convert_in_process, self.engine.overrides, file, formats, self.keep_intermediate, self.cache,
+                self.profile, self.stream_over)
+            yield from self._outcomes(self._feed(submit, units))
+
+    def _outcomes(self, finished):
+        """Records of each finished (unit, future) from `_feed`."""
+        for (file, formats), future in finished:
+            try:
+                yield future.result()
+            except Exception as e:
+                # Worker raised or died (e.g. crashed converter); report instead of aborting the batch
+                logger.error("Worker failed for %s: %s", file.name, e)
+                yield [ConversionRecord(success=False, source_path=file, target_path=None, error=str(e),
+                                        target_format=fmt)
+                       for fmt in formats]
+
+    def _feed(self, submit, units, workers=None):
+        """Submit units a few at a time, yielding (unit, future) as they finish.
+
+        Keeping only ~2 units per worker in flight is what makes pause and
+        cancel prompt: nothing is queued that would have to be unwound. A
+        unit that does not fit the memory budget waits for running units to
+        finish; it only blocks here when nothing of this batch is running.
+        """
+        pending = {}
+        remaining = iter(units)
+        limit = (workers or self.workers) * 2
+        exhausted = False
+        unit = None
+
+        while True:
+            while not exhausted and len(pending) < limit and not self.token.paused and not self.token.cancelled:
+                if unit is None:
+                    unit = next(remaining, None)
+                    if unit is None:
+                        exhausted = True
+                        break
+                reserved = self._reserve_memory(*unit, block=not pending)
+                if reserved is None:
+                    break
+                try:
+                    future = submit(*unit)
                 except Exception as e:
-                    logger.exception(f"Conversion failed for {file.name} to {fmt}: {e}")
-                    # Create a mock result for error tracking
-                    from types import SimpleNamespace
-                    result = SimpleNamespace(
-                        success=False,
-                        source_path=file,
-                        target_path=None,
-                        error=str(e)
-                    )
-                    self.results.append(result)
-
-                # Update progress with ETA
-                completed += 1
-                progress = (completed / total) * 100
-
-                # Calculate ETA
-                elapsed = time.time() - self.start_time
-                if completed > 0:
-                    avg_time = elapsed / completed
-                    remaining = total - completed
-                    eta_seconds = int(avg_time * remaining)
-                    if eta_seconds > 60:
-                        eta = f"{eta_seconds // 60}m {eta_seconds % 60}s"
-                    else:
-                        eta = f"{eta_seconds}s"
-                else:
-                    eta = "calculating..."
+                    # e.g. a broken process pool; surface it as this unit's outcome
+                    future = Future()
+                    future.set_exception(e)
+                if reserved:
+                    future.add_done_callback(lambda _, amount=reserved: self.memory_budget.release(amount))
+                pending[future] = unit
+                self._start_unit()
+                unit = None
 
-                status = f"Converting... {int(progress)}% | ETA: {eta}"
-                self.callback(progress, status, result)
+            if self.token.cancelled:
+                for future in pending:
+                    future.cancel()
 
-        # Finish
-        logger.info(f"Conversion complete: {sum(1 for r in self.results if r.success)}/{len(self.results)} successful")
-        self.callback(100, "Conversion complete!", None)
+            if not pending:
+                if exhausted or not self.token.checkpoint():
+                    return
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished = pending.pop(future)
+                self.admitted_units -= 1
+                if not future.cancelled():
+                    yield finished, future
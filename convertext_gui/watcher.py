@@ -0,0 +1,339 @@
+"""Watch folders and report new or changed files once they are fully written."""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Seconds a file's size and mtime must hold still before it counts as written
+SETTLE_SECONDS = 2.0
+POLL_INTERVAL = 1.0
+# Most files handed over at once, so a burst arrives as several steady batches
+MAX_BATCH = 500
+
+# inotify(7)
+IN_MODIFY = 0x2
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_ONLYDIR
+_EVENT = struct.Struct("iIII")
+
+
+def _stat(path):
+    """(size, mtime_ns) of a file, or None if it is gone."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def within(path, folder):
+    """True if `path` is `folder` or somewhere below it."""
+    path, folder = os.path.abspath(path), os.path.abspath(folder)
+    return path == folder or path.startswith(folder.rstrip(os.sep) + os.sep)
+
+
+class Debouncer:
+    """Files seen changing, released once they have held still for `settle` seconds.
+
+    Every event pushes a file's deadline back. At the deadline its size and
+    mtime are compared with the last look, so a file still being written
+    without events (a network copy under polling) gets another interval
+    rather than being converted half-done.
+    """
+
+    def __init__(self, settle=SETTLE_SECONDS, clock=time.monotonic):
+        self.settle = settle
+        self.clock = clock
+        self._pending = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def touch(self, path):
+        self._pending[path] = (self.clock() + self.settle, _stat(path))
+
+    def next_deadline(self):
+        return min((deadline for deadline, _ in self._pending.values()), default=None)
+
+    def ready(self):
+        """Settled files, in name order; files that vanished are dropped."""
+        now = self.clock()
+        ready = []
+        for path, (deadline, seen) in list(self._pending.items()):
+            if deadline > now:
+                continue
+            current = _stat(path)
+            if current is None:
+                del self._pending[path]
+            elif current != seen:
+                self._pending[path] = (now + self.settle, current)
+            else:
+                del self._pending[path]
+                ready.append(path)
+        return sorted(ready)
+
+
+class _Inotify:
+    """Linux inotify through libc, one watch per directory."""
+
+    name = "inotify"
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._poll = select.poll()
+        self._poll.register(self.fd, select.POLLIN)
+        self._dirs = {}
+
+    def watch(self, directory):
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), directory)
+        self._dirs[wd] = directory
+
+    def read(self, timeout):
+        """(path, is_dir) per change within `timeout` seconds; None if the kernel dropped events."""
+        if not self._poll.poll(timeout * 1000):
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                events.append(None)
+            elif mask & IN_IGNORED:
+                # Directory deleted or moved away
+                self._dirs.pop(wd, None)
+            elif name and wd in self._dirs:
+                events.append((os.path.join(self._dirs[wd], os.fsdecode(name)), bool(mask & IN_ISDIR)))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _Poller:
+    """Portable fallback: stat each watched directory, relist only those that changed."""
+
+    name = "poll"
+
+    def __init__(self, interval, stop_event):
+        self.interval = interval
+        self._stop_event = stop_event
+        self._dirs = {}
+        self._last_poll = time.monotonic()
+
+    def watch(self, directory):
+        listing = _listing(directory)
+        if listing is not None:
+            self._dirs[directory] = listing
+
+    def read(self, timeout):
+        wait = min(timeout, max(0.0, self._last_poll + self.interval - time.monotonic()))
+        if self._stop_event.wait(wait) or time.monotonic() < self._last_poll + self.interval:
+            return []
+        self._last_poll = time.monotonic()
+
+        events = []
+        for directory, (mtime, entries) in list(self._dirs.items()):
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                del self._dirs[directory]
+                continue
+            # Coarse mtimes (FAT, some network shares) can hide a second change within the same tick
+            if current == mtime and time.time_ns() - mtime > 2 * 10 ** 9:
+                continue
+            listing = _listing(directory)
+            if listing is None:
+                continue
+            self._dirs[directory] = listing
+            for name, info in listing[1].items():
+                seen = entries.get(name)
+                # Subfolders watch their own contents; only new ones are news here
+                if info[2] and seen is not None and seen[2]:
+                    continue
+                if seen != info:
+                    events.append((os.path.join(directory, name), info[2]))
+        return events
+
+    def close(self):
+        pass
+
+
+def _listing(directory):
+    """(mtime_ns, {name: (size, mtime_ns, is_dir)}) of a directory, or None if unreadable."""
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+        entries = {}
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    entries[entry.name] = (st.st_size, st.st_mtime_ns, entry.is_dir(follow_symlinks=False))
+                except OSError:
+                    continue
+        return mtime, entries
+    except OSError:
+        return None
+
+
+class FolderWatcher(threading.Thread):
+    """Watch folder trees and report matching files once they are fully written.
+
+    Uses inotify on Linux and polls directory mtimes elsewhere, or when
+    inotify is unavailable or runs out of watches. Either way only the
+    directory an event names is looked at: a new subfolder is walked once
+    and watched, and the whole tree is walked again only if the kernel
+    dropped events. Files already in the folders are reported on start when
+    ``initial`` is set.
+
+    `on_ready(paths)` is called from this thread with at most ``max_batch``
+    settled files at a time and must hand them off itself. ``exclude``
+    folders (e.g. the output folder) and symlinked folders are never
+    watched.
+    """
+
+    def __init__(self, roots, extensions, on_ready, settle=SETTLE_SECONDS, poll_interval=POLL_INTERVAL,
+                 backend="auto", initial=True, exclude=(), max_batch=MAX_BATCH):
+        super().__init__(daemon=True)
+        if backend not in ("auto", "inotify", "poll"):
+            raise ValueError(f"Unknown watch backend: {backend}")
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.extensions = {ext.lower().lstrip('.') for ext in extensions}
+        self.on_ready = on_ready
+        self.poll_interval = poll_interval
+        self.initial = initial
+        self.exclude = [os.path.abspath(path) for path in exclude if path]
+        self.max_batch = max_batch
+        self.debouncer = Debouncer(settle)
+        self.directories = set()
+        self._stop_event = threading.Event()
+        self._source = self._open_backend(backend)
+
+    @property
+    def backend(self):
+        return self._source.name
+
+    def stop(self):
+        """Stop watching; files not yet settled are not reported."""
+        self._stop_event.set()
+
+    @property
+    def stopped(self):
+        return self._stop_event.is_set()
+
+    def run(self):
+        logger.info("Watching %d folder(s) with %s", len(self.roots), self.backend)
+        try:
+            for root in self.roots:
+                self._add_tree(root, report=self.initial)
+            while not self.stopped:
+                deadline = self.debouncer.next_deadline()
+                timeout = self.poll_interval
+                if deadline is not None:
+                    timeout = min(timeout, max(0.0, deadline - self.debouncer.clock()))
+                for event in self._source.read(timeout):
+                    self._handle(event)
+                ready = self.debouncer.ready()
+                for start in range(0, len(ready), self.max_batch):
+                    if self.stopped:
+                        break
+                    self.on_ready(ready[start:start + self.max_batch])
+        finally:
+            self._source.close()
+            logger.info("Stopped watching %d folder(s)", len(self.roots))
+
+    def _open_backend(self, backend):
+        if backend == "inotify" or (backend == "auto" and sys.platform.startswith("linux")):
+            try:
+                return _Inotify()
+            except (OSError, AttributeError) as e:
+                if backend == "inotify":
+                    raise
+                logger.info("inotify unavailable (%s); polling instead", e)
+        return _Poller(self.poll_interval, self._stop_event)
+
+    def _handle(self, event):
+        if event is None:
+            logger.warning("Watch events were dropped; checking the watched folders again")
+            for root in self.roots:
+                self._add_tree(root, report=True)
+            return
+        path, is_dir = event
+        if is_dir:
+            self._add_tree(path, report=True)
+        elif self._matches(path) and not self._excluded(path):
+            self.debouncer.touch(path)
+
+    def _add_tree(self, directory, report):
+        """Watch a folder and its subfolders, optionally reporting the files already in them."""
+        stack = [directory]
+        while stack and not self.stopped:
+            current = stack.pop()
+            if self._excluded(current):
+                continue
+            self._watch(current)
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif report and entry.is_file() and self._matches(entry.name):
+                                self.debouncer.touch(entry.path)
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.warning("Cannot watch %s: %s", current, e)
+
+    def _watch(self, directory):
+        try:
+            self._source.watch(directory)
+        except OSError as e:
+            if e.errno != errno.ENOSPC:
+                logger.warning("Cannot watch %s: %s", directory, e)
+                return
+            # Out of inotify watches (fs.inotify.max_user_watches); poll everything instead
+            logger.warning("Too many folders for inotify; polling instead")
+            self._source.close()
+            self._source = _Poller(self.poll_interval, self._stop_event)
+            for known in self.directories:
+                self._source.watch(known)
+            self._source.watch(directory)
+        self.directories.add(directory)
+
+    def _excluded(self, path):
+        return any(within(path, folder) for folder in self.exclude)
+
+    def _matches(self, name):
+        _, ext = os.path.splitext(name)
+        return ext[1:].lower() in self.extensions
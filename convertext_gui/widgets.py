@@ -3,6 +3,8 @@
 import tkinter as tk
 import ttkbootstrap as ttk
 import logging
+import threading
+from collections import deque
 from pathlib import Path
 from ttkbootstrap.constants import *
 
@@ -10,7 +12,11 @@ logger = logging.getLogger(__name__)
 
 
 class DropZone(ttk.Frame):
-    """Drag-and-drop file zone."""
+    """Drag-and-drop file zone.
+
+    Dropped or browsed folders are passed to `on_drop_callback` as-is; the
+    callback decides how to expand them.
+    """
 
     def __init__(self, parent, on_drop_callback):
         super().__init__(parent, height=144)
@@ -29,7 +35,16 @@ class DropZone(ttk.Frame):
             style='Convert.TButton',
             width=21
         )
-        self.browse_btn.pack()
+        self.browse_btn.pack(side=LEFT, padx=8)
+
+        self.folder_btn = ttk.Button(
+            button_frame,
+            text="Add Folder...",
+            command=self._on_folder_click,
+            style='Convert.TButton',
+            width=13
+        )
+        self.folder_btn.pack(side=LEFT, padx=8)
 
         # Hover effects
         self.browse_btn.bind('<Enter>', self._on_hover_enter)
@@ -40,7 +55,7 @@ class DropZone(ttk.Frame):
         files = self.tk.splitlist(event.data)
         self.on_drop_callback(files)
 
-    def _on_click(self):
+    def _on_click(self, event=None):
         """Handle click to browse."""
         from tkinter import filedialog
         files = filedialog.askopenfilenames(
@@ -64,6 +79,13 @@ class DropZone(ttk.Frame):
         if files:
             self.on_drop_callback(files)
 
+    def _on_folder_click(self):
+        """Handle click to add a whole folder tree."""
+        from tkinter import filedialog
+        directory = filedialog.askdirectory(title="Select Folder to Convert")
+        if directory:
+            self.on_drop_callback([directory])
+
     def _on_hover_enter(self, event):
         """Hover effect - white background."""
         pass  # Handled by ttk style mapping
@@ -74,89 +96,164 @@ class DropZone(ttk.Frame):
 
 
 class FileList(ttk.Frame):
-    """Display and manage selected files."""
+    """Display and manage selected files.
+
+    Rows live in a ttk.Treeview, which only draws what is visible, and are
+    inserted in batches from idle callbacks so a large drop never blocks the
+    event loop. Membership is a dict index, so adds and removes stay linear
+    in the number of files touched rather than the size of the list.
+    """
+
+    ROW_BATCH = 2000
 
     def __init__(self, parent):
         super().__init__(parent)
-        self.files = []
+        self._index = {}  # Path -> row id, in insertion order
+        self._paths = {}  # row id -> Path
+        self._pending_rows = deque()
+        self._flush_scheduled = False
+        self._next_id = 0
 
         # Header
-        header = ttk.Label(
+        self.header = ttk.Label(
             self,
             text="Selected Files:",
             font=("Monaco", 12, "bold")
         )
-        header.pack(anchor=W, pady=(10, 5))
+        self.header.pack(anchor=W, pady=(10, 5))
 
-        # Scrollable frame
-        self.canvas = tk.Canvas(self, height=150, bg="#000000")
-        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
+        # Buttons
+        btn_frame = ttk.Frame(self)
+        btn_frame.pack(side=BOTTOM, fill=X, pady=(5, 0))
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        remove_btn = ttk.Button(
+            btn_frame,
+            text="Remove Selected",
+            bootstyle="danger-link",
+            command=self.remove_selected
         )
+        remove_btn.pack(side=LEFT)
 
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        clear_btn = ttk.Button(
+            btn_frame,
+            text="Clear",
+            bootstyle="danger-link",
+            command=self.clear
+        )
+        clear_btn.pack(side=LEFT, padx=5)
+
+        # Virtualized list
+        style = ttk.Style()
+        style.configure('Files.Treeview',
+                        background='#000000',
+                        fieldbackground='#000000',
+                        foreground='#FFD700',
+                        font=("Monaco", 10),
+                        rowheight=20)
+
+        self.tree = ttk.Treeview(
+            self,
+            show="tree",
+            selectmode="extended",
+            style='Files.Treeview',
+            height=7
+        )
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
 
-        self.canvas.pack(side=LEFT, fill=BOTH, expand=True)
+        self.tree.pack(side=LEFT, fill=BOTH, expand=True)
         self.scrollbar.pack(side=RIGHT, fill=Y)
 
-        self.file_widgets = []
+        self.tree.bind('<Delete>', lambda e: self.remove_selected())
+        self.tree.bind('<BackSpace>', lambda e: self.remove_selected())
+
+    @property
+    def files(self):
+        """Selected files in the order they were added."""
+        return list(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, path):
+        return Path(path) in self._index
 
     def add_files(self, file_paths):
-        """Add files to list."""
+        """Add files to list, returning the ones that were new."""
+        added = []
         for path in file_paths:
             p = Path(path)
-            if p not in self.files:
-                self.files.append(p)
-                self._add_file_widget(p)
-
-    def _add_file_widget(self, file_path):
-        """Add file widget to scrollable list."""
-        frame = ttk.Frame(self.scrollable_frame)
-        frame.pack(fill=X, pady=2)
-
-        # File icon and name
-        label = ttk.Label(
-            frame,
-            text=f"📄 {file_path.name}",
-            font=("Monaco", 10)
-        )
-        label.pack(side=LEFT, padx=5)
-
-        # Remove button
-        remove_btn = ttk.Button(
-            frame,
-            text="✕",
-            bootstyle="danger-link",
-            width=3,
-            command=lambda: self._remove_file(file_path, frame)
-        )
-        remove_btn.pack(side=RIGHT, padx=5)
+            if p not in self._index:
+                iid = f"f{self._next_id}"
+                self._next_id += 1
+                self._index[p] = iid
+                self._paths[iid] = p
+                self._pending_rows.append((iid, p))
+                added.append(p)
+
+        if added:
+            self._schedule_flush()
+            self._update_header()
+        return added
+
+    def remove_files(self, file_paths):
+        """Remove files from list."""
+        iids = []
+        for path in file_paths:
+            iid = self._index.pop(Path(path), None)
+            if iid is not None:
+                del self._paths[iid]
+                iids.append(iid)
 
-        self.file_widgets.append((file_path, frame))
+        if iids:
+            existing = [iid for iid in iids if self.tree.exists(iid)]
+            if existing:
+                self.tree.delete(*existing)
+            self._update_header()
 
-    def _remove_file(self, file_path, frame):
-        """Remove file from list."""
-        self.files.remove(file_path)
-        frame.destroy()
-        self.file_widgets = [(p, f) for p, f in self.file_widgets if p != file_path]
+    def remove_selected(self):
+        """Remove the rows currently selected in the list."""
+        self.remove_files([self._paths[iid] for iid in self.tree.selection() if iid in self._paths])
 
     def clear(self):
         """Clear all files."""
-        for _, frame in self.file_widgets:
-            frame.destroy()
-        self.files.clear()
-        self.file_widgets.clear()
+        self._pending_rows.clear()
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._index.clear()
+        self._paths.clear()
+        self._update_header()
+
+    def _schedule_flush(self):
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_rows)
+
+    def _flush_rows(self):
+        """Insert the next batch of pending rows, yielding to the event loop between batches."""
+        self._flush_scheduled = False
+        for _ in range(min(self.ROW_BATCH, len(self._pending_rows))):
+            iid, path = self._pending_rows.popleft()
+            # Skip rows removed before they were ever drawn
+            if iid in self._paths:
+                self.tree.insert("", END, iid=iid, text=f"📄 {path.name}")
+        if self._pending_rows:
+            self._flush_scheduled = True
+            self.after(1, self._flush_rows)
+
+    def _update_header(self):
+        count = len(self._index)
+        self.header.configure(text=f"Selected Files: ({count})" if count else "Selected Files:")
 
 
 class DebugConsole(tk.Toplevel):
-    """Debug console window for viewing logs."""
+    """Debug console window for viewing logs.
 
-    def __init__(self, parent):
+    Keeps at most `max_lines` lines; older ones are trimmed as new ones arrive.
+    """
+
+    def __init__(self, parent, max_lines=5000):
         super().__init__(parent)
         self.title("Debug Console")
         self.geometry("800x400")
@@ -187,7 +284,7 @@ class DebugConsole(tk.Toplevel):
         clear_btn.pack(side=LEFT, padx=5)
 
         # Add logging handler
-        self.handler = TextHandler(self.text)
+        self.handler = TextHandler(self.text, max_lines=max_lines)
         self.handler.setLevel(logging.DEBUG)
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         self.handler.setFormatter(formatter)
@@ -197,6 +294,7 @@ class DebugConsole(tk.Toplevel):
 
     def clear(self):
         """Clear console text."""
+        self.handler.discard_pending()
         self.text.configure(state=tk.NORMAL)
         self.text.delete(1.0, tk.END)
         self.text.configure(state=tk.DISABLED)
@@ -204,25 +302,226 @@ class DebugConsole(tk.Toplevel):
     def on_close(self):
         """Handle window close."""
         logging.getLogger().removeHandler(self.handler)
+        self.handler.close()
         self.destroy()
 
 
 class TextHandler(logging.Handler):
-    """Logging handler that writes to a Text widget."""
+    """Logging handler that writes to a Text widget.
 
-    def __init__(self, text_widget):
+    `emit` may run on any thread and only appends to a buffer; a timer on
+    the Tk thread inserts everything buffered in one go every `flush_ms`.
+    Both the buffer and the widget are capped at `max_lines`.
+    """
+
+    def __init__(self, text_widget, max_lines=5000, flush_ms=100):
         super().__init__()
         self.text_widget = text_widget
+        self.max_lines = max_lines
+        self.flush_ms = flush_ms
+        self._pending = deque(maxlen=max_lines)
+        self._pending_lock = threading.Lock()
+        self._timer = self.text_widget.after(self.flush_ms, self._flush)
 
     def emit(self, record):
-        """Emit a log record to the text widget."""
-        msg = self.format(record) + '\n'
-
-        def append():
-            self.text_widget.configure(state=tk.NORMAL)
-            self.text_widget.insert(tk.END, msg)
+        """Buffer a log record for the next flush."""
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._pending_lock:
+            self._pending.append(msg)
+
+    def discard_pending(self):
+        """Drop buffered records that have not been shown yet."""
+        with self._pending_lock:
+            self._pending.clear()
+
+    def close(self):
+        """Stop the flush timer."""
+        if self._timer:
+            try:
+                self.text_widget.after_cancel(self._timer)
+            except tk.TclError:
+                pass
+            self._timer = None
+        super().close()
+
+    def _flush(self):
+        """Insert buffered lines and trim the oldest (runs in main thread)."""
+        with self._pending_lock:
+            lines, self._pending = self._pending, deque(maxlen=self.max_lines)
+
+        if lines:
+            try:
+                self._append(lines)
+            except tk.TclError:
+                # Widget destroyed
+                self._timer = None
+                return
+        self._timer = self.text_widget.after(self.flush_ms, self._flush)
+
+    def _append(self, lines):
+        # Only follow the tail if the user has not scrolled up
+        at_bottom = self.text_widget.yview()[1] >= 1.0
+        self.text_widget.configure(state=tk.NORMAL)
+        self.text_widget.insert(tk.END, "\n".join(lines) + "\n")
+
+        line_count = int(self.text_widget.index('end-1c').split('.')[0]) - 1
+        if line_count > self.max_lines:
+            self.text_widget.delete('1.0', f'{line_count - self.max_lines + 1}.0')
+
+        self.text_widget.configure(state=tk.DISABLED)
+        if at_bottom:
             self.text_widget.see(tk.END)
-            self.text_widget.configure(state=tk.DISABLED)
 
-        # Thread-safe update
-        self.text_widget.after(0, append)
+
+class MetricsPanel(tk.Toplevel):
+    """Performance summary of one batch, with CSV/JSON export."""
+
+    COLUMNS = (
+        ('converter', "Converter", 220),
+        ('conversions', "Files", 60),
+        ('seconds', "Wall (s)", 80),
+        ('cpu_seconds', "CPU (s)", 80),
+        ('slowest', "Slowest (s)", 90),
+        ('mb_per_second', "MB/s", 70),
+        ('output', "Out / In", 80),
+    )
+
+    def __init__(self, parent, records):
+        from convertext_gui.metrics import summarize
+
+        super().__init__(parent)
+        self.title("Performance Report")
+        self.geometry("720x360")
+        self.records = records
+        summary = summarize(records)
+
+        peak = f"{summary['peak_rss'] / 1024 ** 2:.0f} MB" if summary['peak_rss'] else "n/a"
+        totals = ttk.Label(
+            self,
+            text=(f"{summary['succeeded']} succeeded, {summary['failed']} failed, {summary['cached']} cached  |  "
+                  f"Wall {summary['seconds']:.1f}s, CPU {summary['cpu_seconds']:.1f}s  |  "
+                  f"{summary['input_bytes'] / 1024 ** 2:.1f} MB in, "
+                  f"{summary['output_bytes'] / 1024 ** 2:.1f} MB out  |  Peak memory {peak}"),
+            font=("Monaco", 10)
+        )
+        totals.pack(anchor=W, padx=10, pady=(10, 5))
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in self.COLUMNS], show='headings')
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=W if key == 'converter' else E)
+        self.tree.pack(fill=BOTH, expand=True, padx=10)
+
+        # Slowest converters first
+        converters = sorted(summary['converters'].items(), key=lambda item: item[1]['seconds'], reverse=True)
+        for name, stats in converters:
+            rate = stats['mb_per_second']
+            ratio = stats['output_bytes'] / stats['input_bytes'] if stats['input_bytes'] else 0
+            self.tree.insert('', END, values=(
+                name,
+                stats['conversions'],
+                f"{stats['seconds']:.2f}",
+                f"{stats['cpu_seconds']:.2f}",
+                f"{stats['slowest']:.2f}",
+                f"{rate:.1f}" if rate is not None else "-",
+                f"{ratio:.2f}",
+            ))
+
+        btn_frame = ttk.Frame(self)
+        btn_frame.pack(fill=X, padx=10, pady=10)
+        ttk.Button(btn_frame, text="Export CSV...", command=lambda: self.export(".csv"),
+                   bootstyle=SECONDARY).pack(side=LEFT, padx=5)
+        ttk.Button(btn_frame, text="Export JSON...", command=lambda: self.export(".json"),
+                   bootstyle=SECONDARY).pack(side=LEFT, padx=5)
+        ttk.Button(btn_frame, text="Close", command=self.destroy).pack(side=RIGHT, padx=5)
+
+    def export(self, suffix):
+        """Ask for a file name and write the per-conversion report."""
+        from tkinter import filedialog, messagebox
+        from convertext_gui.metrics import export_report
+
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export Performance Report",
+            defaultextension=suffix,
+            filetypes=[("CSV", "*.csv")] if suffix == ".csv" else [("JSON", "*.json")]
+        )
+        if not path:
+            return
+        try:
+            export_report(self.records, Path(path))
+            logger.info("Performance report exported: %s", path)
+        except OSError as e:
+            messagebox.showerror("Export failed", str(e), parent=self)
+
+
+class JobQueuePanel(tk.Toplevel):
+    """Submitted batches with their priority and progress.
+
+    Actions are forwarded to `controller` (the main window), which owns the
+    queue and the running threads; `refresh` redraws from `controller.jobs`.
+    """
+
+    COLUMNS = (
+        ('name', "Batch", 220),
+        ('priority', "Priority", 70),
+        ('state', "State", 80),
+        ('formats', "Formats", 110),
+        ('output', "Output", 160),
+        ('progress', "Done", 110),
+    )
+
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.title("Job Queue")
+        self.geometry("800x360")
+        self.controller = controller
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in self.COLUMNS], show='headings', selectmode='browse')
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=E if key == 'progress' else W)
+        self.tree.pack(fill=BOTH, expand=True, padx=10, pady=(10, 0))
+
+        btn_frame = ttk.Frame(self)
+        btn_frame.pack(fill=X, padx=10, pady=10)
+        for text, action in (
+            ("Raise Priority", lambda job_id: controller.change_job_priority(job_id, +1)),
+            ("Lower Priority", lambda job_id: controller.change_job_priority(job_id, -1)),
+            ("Pause/Resume", controller.toggle_job_pause),
+            ("Cancel", controller.cancel_job),
+            ("Remove", controller.remove_job),
+        ):
+            ttk.Button(btn_frame, text=text, command=lambda action=action: self._on_selected(action),
+                       bootstyle=SECONDARY).pack(side=LEFT, padx=5)
+        ttk.Button(btn_frame, text="Clear Finished", command=controller.clear_finished_jobs,
+                   bootstyle=SECONDARY).pack(side=LEFT, padx=5)
+        ttk.Button(btn_frame, text="Close", command=self.destroy).pack(side=RIGHT, padx=5)
+
+        self.refresh()
+
+    def _on_selected(self, action):
+        selection = self.tree.selection()
+        if selection:
+            action(selection[0])
+
+    def refresh(self):
+        """Redraw every job, keeping the selection."""
+        selection = self.tree.selection()
+        self.tree.delete(*self.tree.get_children())
+        for job in self.controller.jobs.jobs:
+            self.tree.insert('', END, iid=job.id, values=(
+                job.name,
+                job.priority,
+                job.state,
+                ", ".join(job.formats),
+                str(job.output_dir) if job.output_dir else "beside sources",
+                f"{job.completed}/{job.total}" + (f" ({job.failed} failed)" if job.failed else ""),
+            ))
+        for job_id in selection:
+            if self.tree.exists(job_id):
+                self.tree.selection_set(job_id)
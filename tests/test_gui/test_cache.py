@@ -0,0 +1,82 @@
+"""Tests for the conversion cache."""
+
+import os
+import pickle
+
+
+class TestConversionCache:
+    """Tests for ConversionCache."""
+
+    def test_key_tracks_content_format_and_settings(self, tmp_path):
+        """Test keys change with content, format and settings."""
+        from convertext_gui.cache import ConversionCache
+
+        cache = ConversionCache(root=tmp_path / "cache")
+        source = tmp_path / "doc.txt"
+        source.write_text("one")
+
+        key = cache.key(source, "html", {"documents": {"encoding": "utf-8"}})
+        assert key == cache.key(source, "html", {"documents": {"encoding": "utf-8"}})
+        assert key != cache.key(source, "md", {"documents": {"encoding": "utf-8"}})
+        assert key != cache.key(source, "html", {"documents": {"encoding": "latin-1"}})
+
+        source.write_text("two")
+        os.utime(source, ns=(1, 1))
+        assert key != cache.key(source, "html", {"documents": {"encoding": "utf-8"}})
+
+    def test_store_and_fetch(self, tmp_path):
+        """Test a stored output is copied back out on a hit."""
+        from convertext_gui.cache import ConversionCache
+
+        cache = ConversionCache(root=tmp_path / "cache")
+        output = tmp_path / "doc.html"
+        output.write_text("<p>hi</p>")
+
+        target = tmp_path / "again" / "doc.html"
+        assert cache.fetch("ab" * 32, "html", target) is False
+
+        cache.store("ab" * 32, "html", output)
+        assert cache.fetch("ab" * 32, "html", target) is True
+        assert target.read_text() == "<p>hi</p>"
+
+    def test_clone_leaves_entry_untouched(self, tmp_path):
+        """Test a cloned (or copied) hit can be rewritten in place without changing the cache."""
+        from convertext_gui.cache import ConversionCache
+
+        cache = ConversionCache(root=tmp_path / "cache", clone=True)
+        output = tmp_path / "doc.html"
+        output.write_text("<p>hi</p>")
+        cache.store("ab" * 32, "html", output)
+
+        target = tmp_path / "again" / "doc.html"
+        assert cache.fetch("ab" * 32, "html", target) is True
+        entry = cache._entry_path("ab" * 32, "html")
+        assert not os.path.samefile(entry, target)
+
+        with open(target, 'r+') as f:
+            f.write("<p>no</p>")
+        assert entry.read_text() == "<p>hi</p>"
+
+    def test_evict_least_recently_used(self, tmp_path):
+        """Test eviction drops the oldest entries first."""
+        from convertext_gui.cache import ConversionCache
+
+        cache = ConversionCache(root=tmp_path / "cache", max_bytes=10)
+        output = tmp_path / "out.txt"
+        output.write_text("12345678")
+
+        cache.store("aa" * 32, "txt", output)
+        cache.store("bb" * 32, "txt", output)
+        os.utime(cache._entry_path("aa" * 32, "txt"), (1, 1))
+
+        assert cache.evict() == 1
+        assert not cache._entry_path("aa" * 32, "txt").exists()
+        assert cache._entry_path("bb" * 32, "txt").exists()
+
+    def test_pickles_for_process_workers(self, tmp_path):
+        """Test the cache can be sent to process-pool workers."""
+        from convertext_gui.cache import ConversionCache
+
+        cache = ConversionCache(root=tmp_path / "cache")
+        clone = pickle.loads(pickle.dumps(cache))
+        assert clone.root == cache.root
@@ -0,0 +1,85 @@
+"""Tests for the command-line entry point."""
+
+import json
+import pytest
+
+
+@pytest.fixture
+def converters():
+    try:
+        from convertext.converters.loader import load_converters  # noqa: F401
+    except (ImportError, SyntaxError) as e:
+        pytest.skip(f"convertext converters unavailable: {e}")
+
+
+class TestHeadless:
+    """Tests for headless batch mode."""
+
+    def test_requires_formats(self, capsys):
+        """Test headless mode refuses to run without formats."""
+        from convertext_gui.cli import main
+
+        with pytest.raises(SystemExit) as exc:
+            main(["--headless", "somefile.txt"])
+        assert exc.value.code == 2
+
+    def test_converts_folder(self, converters, tmp_path, capsys):
+        """Test a folder batch prints JSON progress and exits 0."""
+        from convertext_gui.cli import main
+
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.txt").write_text("Hello.\n")
+        (src / "ignored.bin").write_text("x")
+
+        with pytest.raises(SystemExit) as exc:
+            main(["--headless", "--formats", "html,md", "--out", str(tmp_path / "out"),
+                  "--no-cache", "--workers", "1", str(src)])
+
+        events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert exc.value.code == 0
+        assert events[0] == {"event": "start", "files": 1, "formats": ["html", "md"]}
+        assert [e["success"] for e in events if e["event"] == "result"] == [True, True]
+        assert events[-1]["event"] == "done"
+        assert (tmp_path / "out" / "a.html").exists()
+
+    def test_scans_tree_once(self, converters, tmp_path, capsys):
+        """Test a folder batch walks the tree a single time."""
+        from unittest.mock import patch
+        from convertext_gui import cli
+
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.txt").write_text("Hello.\n")
+
+        with patch.object(cli, "collect_files", wraps=cli.collect_files) as collect:
+            with pytest.raises(SystemExit):
+                cli.main(["--headless", "--formats", "md", "--out", str(tmp_path / "out"),
+                          "--no-cache", str(src)])
+        collect.assert_called_once()
+
+    def test_failure_exit_code(self, converters, tmp_path, capsys):
+        """Test any failed conversion makes the exit code non-zero."""
+        from convertext_gui.cli import main
+
+        source = tmp_path / "a.txt"
+        source.write_text("Hello.\n")
+
+        with pytest.raises(SystemExit) as exc:
+            main(["--headless", "--formats", "nosuchformat", "--out", str(tmp_path / "out"),
+                  "--no-cache", str(source)])
+
+        assert exc.value.code == 1
+        done = json.loads(capsys.readouterr().out.splitlines()[-1])
+        assert done["failed"] == 1
+
+    def test_entry_module_inert_on_import(self):
+        """Test spawned workers re-importing the frozen entry script do not start the app."""
+        import runpy
+        from unittest.mock import patch
+
+        with patch("convertext_gui.cli.main") as main:
+            runpy.run_module("convertext_gui", run_name="__mp_main__")
+            main.assert_not_called()
+            runpy.run_module("convertext_gui", run_name="__main__")
+            main.assert_called_once_with()
@@ -0,0 +1,84 @@
+"""Tests for per-file conversion units."""
+
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Real conversion engine writing into tmp_path/out."""
+    try:
+        from convertext.converters.loader import load_converters
+    except (ImportError, SyntaxError) as e:
+        pytest.skip(f"convertext converters unavailable: {e}")
+    from convertext.config import Config
+    from convertext.core import ConversionEngine
+
+    load_converters()
+    out = tmp_path / "out"
+    out.mkdir()
+    config = Config()
+    config.override({'output': {'directory': str(out), 'overwrite': True}})
+    return ConversionEngine(config)
+
+
+class TestConvertSource:
+    """Tests for parse-once multi-target conversion."""
+
+    def test_single_format_uses_engine(self):
+        """Test a single target goes straight through engine.convert."""
+        from convertext_gui.conversion import convert_source
+
+        engine = Mock()
+        engine.convert.return_value = Mock(success=True, target_path=Path("/tmp/a.txt"), error=None)
+
+        records = convert_source(engine, Path("/tmp/a.md"), ["txt"])
+
+        engine.convert.assert_called_once_with(Path("/tmp/a.md"), "txt")
+        assert records[0].success is True
+
+    def test_parses_once_for_all_formats(self, engine, tmp_path):
+        """Test every in-memory target is written from one parse."""
+        from convertext.converters import readers
+        from convertext_gui.conversion import convert_source
+
+        source = tmp_path / "doc.txt"
+        source.write_text("Title\n=====\n\nFirst paragraph.\n\nSecond paragraph.\n")
+
+        with patch.object(readers, "read_source", wraps=readers.read_source) as read:
+            records = convert_source(engine, source, ["html", "md", "epub"])
+
+        assert read.call_count == 1
+        assert [r.success for r in records] == [True, True, True]
+        assert [r.target_path.suffix for r in records] == [".html", ".md", ".epub"]
+        assert "Second paragraph." in records[0].target_path.read_text()
+
+    def test_keep_intermediate_writes_document(self, engine, tmp_path):
+        """Test keep_intermediate saves the shared parse beside the source."""
+        from convertext_gui.conversion import convert_source
+
+        source = tmp_path / "doc.txt"
+        source.write_text("Hello world.\n")
+
+        convert_source(engine, source, ["html", "md"], keep_intermediate=True)
+
+        assert (tmp_path / "doc_intermediate.json").exists()
+
+    def test_cache_hit_skips_conversion(self, engine, tmp_path):
+        """Test a second run is served from the cache."""
+        from convertext_gui.cache import ConversionCache
+        from convertext_gui.conversion import convert_source
+
+        cache = ConversionCache(root=tmp_path / "cache")
+        source = tmp_path / "doc.txt"
+        source.write_text("Hello world.\n")
+
+        first = convert_source(engine, source, ["html"], cache=cache)
+        with patch.object(engine, "convert") as convert:
+            second = convert_source(engine, source, ["html"], cache=cache)
+
+        convert.assert_not_called()
+        assert first[0].cached is False
+        assert second[0].cached is True
+        assert second[0].target_path.read_text() == first[0].target_path.read_text()
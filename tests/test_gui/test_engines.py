@@ -0,0 +1,111 @@
+"""Tests for per-snapshot conversion engines."""
+
+import copy
+from pathlib import Path
+from unittest.mock import Mock
+
+
+class TestEnginePool:
+    """Tests for EnginePool and override snapshots."""
+
+    def test_reuses_engine_per_snapshot(self):
+        """Test equal overrides share an engine and different ones do not."""
+        from convertext.config import Config
+        from convertext_gui.engines import EnginePool
+
+        pool = EnginePool(Config())
+        first = pool.get({'output': {'overwrite': True, 'directory': '/tmp/a'}})
+        same = pool.get({'output': {'directory': '/tmp/a', 'overwrite': True}})
+        other = pool.get({'output': {'directory': '/tmp/b'}})
+
+        assert first is same
+        assert other is not first
+        assert first.config is other.config
+
+    def test_snapshot_is_copied(self):
+        """Test changing the caller's dict afterwards does not reach the engine."""
+        from convertext.config import Config
+        from convertext_gui.engines import EnginePool
+
+        overrides = {'output': {'overwrite': True}}
+        engine = EnginePool(Config()).get(overrides)
+        overrides['output']['overwrite'] = False
+        assert engine.overrides == {'output': {'overwrite': True}}
+
+    def test_evicts_least_recently_used(self):
+        """Test the pool keeps at most max_engines engines."""
+        from convertext.config import Config
+        from convertext_gui.engines import EnginePool
+
+        pool = EnginePool(Config(), max_engines=2)
+        a = pool.get({'output': {'directory': 'a'}})
+        pool.get({'output': {'directory': 'b'}})
+        pool.get({'output': {'directory': 'a'}})
+        pool.get({'output': {'directory': 'c'}})
+
+        assert pool.get({'output': {'directory': 'a'}}) is a
+        assert len(pool._engines) == 2
+
+    def test_keep_intermediate_is_part_of_key(self):
+        """Test engines that keep intermediates are built and pooled apart."""
+        from convertext.config import Config
+        from convertext_gui.engines import EnginePool
+
+        pool = EnginePool(Config())
+        overrides = {'conversion': {'keep_intermediate': True}}
+        keep = pool.get(overrides, keep_intermediate=True)
+
+        assert keep.keep_intermediate is True
+        assert pool.get(overrides) is not keep
+        assert pool.get(overrides).keep_intermediate is False
+        assert pool.get(overrides, keep_intermediate=True) is keep
+
+    def test_merge_overrides(self):
+        """Test nested overrides merge without modifying either input."""
+        from convertext_gui.engines import merge_overrides
+
+        base = {'output': {'directory': 'a', 'overwrite': False}, 'documents': {'encoding': 'latin-1'}}
+        update = {'output': {'overwrite': True}}
+        merged = merge_overrides(base, update)
+
+        assert merged == {'output': {'directory': 'a', 'overwrite': True}, 'documents': {'encoding': 'latin-1'}}
+        assert base['output']['overwrite'] is False
+
+    def test_thread_leaves_shared_engine_alone(self, tmp_path):
+        """Test batch options go to a batch engine, not the shared config."""
+        from convertext.config import Config
+        from convertext.core import ConversionEngine
+        from convertext_gui.threads import ConversionThread
+
+        shared = ConversionEngine(Config())
+        before = copy.deepcopy(shared.config.config)
+
+        thread = ConversionThread(shared, [], ["txt"], tmp_path, True, False, Mock())
+        thread.run()
+
+        assert shared.config.config == before
+        assert shared.overrides == {}
+        assert thread.engine is not shared
+        assert thread.engine.overrides['output'] == {'directory': str(tmp_path), 'overwrite': True}
+
+        later = ConversionThread(shared, [], ["txt"], None, False, False, Mock())
+        later.run()
+        assert later.engine is shared
+
+    def test_thread_uses_pool(self, tmp_path):
+        """Test batches with the same options reuse the pooled engine."""
+        from convertext.config import Config
+        from convertext.core import ConversionEngine
+        from convertext_gui.engines import EnginePool
+        from convertext_gui.threads import ConversionThread
+
+        config = Config()
+        pool = EnginePool(config)
+        engines = []
+        for _ in range(2):
+            thread = ConversionThread(ConversionEngine(config), [], ["txt"], Path(tmp_path), True, False, Mock(),
+                                      engine_pool=pool)
+            thread.run()
+            engines.append(thread.engine)
+
+        assert engines[0] is engines[1]
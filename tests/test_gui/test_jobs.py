@@ -0,0 +1,237 @@
+"""Tests for the job queue and fair-share scheduler."""
+
+import threading
+import time
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+
+class TestJobQueue:
+    """Tests for Job and JobQueue."""
+
+    def test_round_trip(self, tmp_path):
+        """Test jobs survive a save and load."""
+        from convertext_gui.jobs import Job, JobQueue
+
+        queue = JobQueue(path=tmp_path / "jobs.json")
+        job = queue.add(Job(files=[Path("/a/b.pdf")], formats=["txt", "epub"], output_dir=Path("/out"),
+                            priority="high", backend="process", workers=3, cache=True, profile_threshold=2.0))
+        queue.save()
+
+        loaded = JobQueue.load(tmp_path / "jobs.json")
+        restored = loaded.get(job.id)
+        assert restored == job
+        assert restored.total == 2
+        resumed = Job.from_journal({'id': job.id, 'options': job.options})
+        assert (resumed.backend, resumed.workers, resumed.cache, resumed.profile_threshold) == ("process", 3, True, 2.0)
+
+    def test_interrupted_jobs_requeued(self, tmp_path):
+        """Test batches running when the app stopped come back interrupted."""
+        from convertext_gui.jobs import Job, JobQueue
+
+        queue = JobQueue(path=tmp_path / "jobs.json")
+        running = queue.add(Job(files=[Path("a.txt")], formats=["md"], state="running"))
+        done = queue.add(Job(files=[Path("b.txt")], formats=["md"], state="done"))
+        queue.save()
+
+        loaded = JobQueue.load(tmp_path / "jobs.json")
+        assert loaded.get(running.id).state == "interrupted"
+        assert loaded.get(done.id).state == "done"
+
+    def test_watch_job_options(self, tmp_path):
+        """Test a watch batch keeps its folder through a save and a journal."""
+        from convertext_gui.jobs import Job, JobQueue
+
+        queue = JobQueue(path=tmp_path / "jobs.json")
+        job = queue.add(Job(files=[Path("/in/a.txt")], formats=["md"], incremental=True, watched_folder="/in"))
+        queue.save()
+        assert JobQueue.load(tmp_path / "jobs.json").get(job.id).watched_folder == "/in"
+        assert Job.from_journal({'id': job.id, 'options': job.options}).watched_folder == "/in"
+
+    def test_load_missing(self, tmp_path):
+        """Test a missing or corrupt file gives an empty queue."""
+        from convertext_gui.jobs import JobQueue
+
+        path = tmp_path / "jobs.json"
+        assert JobQueue.load(path).jobs == []
+        path.write_text("{")
+        assert JobQueue.load(path).jobs == []
+
+    def test_next_queued_by_priority_then_age(self):
+        """Test the highest-priority, oldest queued job starts next."""
+        from convertext_gui.jobs import Job, JobQueue
+
+        queue = JobQueue()
+        old_normal = queue.add(Job(files=[], formats=["md"], created=1))
+        queue.add(Job(files=[], formats=["md"], created=2))
+        high = queue.add(Job(files=[], formats=["md"], priority="high", created=3))
+        queue.add(Job(files=[], formats=["md"], priority="high", created=0, state="done"))
+
+        assert queue.next_queued() is high
+        high.state = "running"
+        assert queue.next_queued() is old_normal
+
+    def test_clear_finished(self):
+        """Test finished jobs are dropped and the rest kept."""
+        from convertext_gui.jobs import Job, JobQueue
+
+        queue = JobQueue()
+        keep = queue.add(Job(files=[], formats=["md"]))
+        queue.add(Job(files=[], formats=["md"], state="cancelled"))
+        queue.clear_finished()
+        assert queue.jobs == [keep]
+
+
+class TestFairScheduler:
+    """Tests for FairScheduler."""
+
+    def test_late_small_batch_not_stuck(self):
+        """Test a batch submitted behind a long one runs its tasks next."""
+        from convertext_gui.jobs import FairScheduler
+
+        scheduler = FairScheduler(1)
+        order = []
+        gate = threading.Event()
+        started = threading.Event()
+
+        def task(name):
+            if name == "long-0":
+                # Runs well past its estimate, as the long batch's work does
+                started.set()
+                gate.wait(2)
+                time.sleep(0.1)
+            order.append(name)
+
+        scheduler.register("long", 1.0)
+        futures = [scheduler.submit("long", 0.01, task, f"long-{i}") for i in range(10)]
+        started.wait(2)
+        scheduler.register("urgent", 4.0)
+        futures += [scheduler.submit("urgent", 0.01, task, f"urgent-{i}") for i in range(3)]
+        gate.set()
+        for future in futures:
+            future.result(timeout=5)
+        scheduler.shutdown()
+
+        assert order[0] == "long-0"
+        assert order[1:4] == ["urgent-0", "urgent-1", "urgent-2"]
+
+    def test_weights_share_workers(self):
+        """Test two busy batches are served in proportion to their weights."""
+        from convertext_gui.jobs import FairScheduler
+
+        scheduler = FairScheduler(1)
+        order = []
+        gate = threading.Event()
+        scheduler.register("hold", 1.0)
+        started = threading.Event()
+        scheduler.submit("hold", 0.0, lambda: (started.set(), gate.wait(2)))
+        started.wait(2)
+        scheduler.register("low", 1.0)
+        scheduler.register("high", 3.0)
+        futures = [scheduler.submit(name, 1.0, order.append, name) for _ in range(8) for name in ("low", "high")]
+        gate.set()
+        for future in futures:
+            future.result(timeout=5)
+        scheduler.shutdown()
+
+        assert order[:8].count("high") >= 5
+
+    def test_exceptions_and_unregister(self):
+        """Test task errors reach the future and unregister cancels queued tasks."""
+        import pytest
+        from convertext_gui.jobs import FairScheduler
+
+        scheduler = FairScheduler(1)
+        gate = threading.Event()
+        scheduler.register("batch")
+        started = threading.Event()
+        failing = scheduler.submit("batch", 0.0, lambda: (started.set(), gate.wait(2), 1 / 0))
+        started.wait(2)
+        queued = scheduler.submit("batch", 0.0, lambda: "never")
+        scheduler.unregister("batch")
+        gate.set()
+
+        with pytest.raises(ZeroDivisionError):
+            failing.result(timeout=5)
+        assert queued.cancelled()
+        scheduler.shutdown()
+
+    def test_conversion_threads_share_scheduler(self, tmp_path):
+        """Test two batches on one scheduler both complete and then leave it."""
+        from convertext_gui.jobs import FairScheduler
+        from convertext_gui.threads import ConversionThread
+
+        engine = Mock()
+        engine.convert = Mock(side_effect=lambda file, fmt: SimpleNamespace(
+            success=True, target_path=file.with_suffix(".txt"), error=None))
+        scheduler = FairScheduler(2)
+
+        threads = []
+        for batch in range(2):
+            files = [tmp_path / f"{batch}-{i}.pdf" for i in range(5)]
+            thread = ConversionThread(engine, files, ["txt"], None, False, False, Mock(),
+                                      scheduler=scheduler, weight=batch + 1)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join(5)
+
+        assert [len(thread.results) for thread in threads] == [5, 5]
+        assert all(r.success for thread in threads for r in thread.results)
+        assert scheduler._queues == {}
+        scheduler.shutdown()
+
+    def test_process_batches_share_one_pool(self, tmp_path):
+        """Test process-backend batches with different options run on the scheduler's one process pool."""
+        try:
+            from convertext.converters.loader import load_converters  # noqa: F401
+        except (ImportError, SyntaxError) as e:
+            pytest.skip(f"convertext converters unavailable: {e}")
+        from convertext.config import Config
+        from convertext.core import ConversionEngine
+        from convertext_gui.jobs import FairScheduler
+        from convertext_gui.threads import ConversionThread
+
+        scheduler = FairScheduler(2)
+        threads = []
+        for batch in range(2):
+            out = tmp_path / f"out{batch}"
+            out.mkdir()
+            files = []
+            for i in range(3):
+                path = tmp_path / f"{batch}-{i}.txt"
+                path.write_text(f"Document {batch}-{i}.\n")
+                files.append(path)
+            thread = ConversionThread(ConversionEngine(Config()), files, ["md"], out, False, False, Mock(),
+                                      backend="process", scheduler=scheduler)
+            thread.start()
+            threads.append(thread)
+        try:
+            for thread in threads:
+                thread.join(60)
+            pool = scheduler._process_pool
+            assert [len(thread.results) for thread in threads] == [3, 3]
+            assert all(r.success for thread in threads for r in thread.results)
+            assert sorted(p.name for p in (tmp_path / "out1").iterdir()) == ["1-0.md", "1-1.md", "1-2.md"]
+            assert len(pool._processes) <= 2
+        finally:
+            scheduler.shutdown()
+
+    def test_process_pool_replaced_on_resize(self):
+        """Test a resize swaps the process pool without failing tasks on the old one."""
+        from convertext_gui.jobs import FairScheduler
+
+        scheduler = FairScheduler(1)
+        try:
+            slow = scheduler.submit_process(None, time.sleep, 0.3)
+            first = scheduler._process_pool
+            scheduler.resize(2)
+            assert scheduler.submit_process(None, abs, -3).result(30) == 3
+            assert scheduler._process_pool is not first
+            assert slow.result(30) is None
+        finally:
+            scheduler.shutdown()
+        with pytest.raises(RuntimeError):
+            scheduler.submit_process(None, abs, -1)
@@ -0,0 +1,148 @@
+"""Tests for batch journals and resuming interrupted batches."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+
+def _record(source, target, fmt, success=True):
+    from convertext_gui.conversion import ConversionRecord
+
+    return ConversionRecord(success=success, source_path=source, target_path=target, target_format=fmt,
+                            error=None if success else "boom")
+
+
+class TestBatchJournal:
+    """Tests for BatchJournal."""
+
+    def test_replays_verified_outputs(self, tmp_path):
+        """Test completed pairs survive a reopen only while their outputs are intact."""
+        from convertext_gui.journal import BatchJournal
+
+        source = tmp_path / "a.txt"
+        source.write_text("hello")
+        md, html = tmp_path / "a.md", tmp_path / "a.html"
+        md.write_text("# hello")
+        html.write_text("<p>hello</p>")
+
+        journal = BatchJournal.open("b1", [source], ["md", "html", "epub"], {'overwrite': True},
+                                    directory=tmp_path / "journal")
+        journal.record(_record(source, md, "md"))
+        journal.record(_record(source, html, "html"))
+        journal.record(_record(source, None, "epub", success=False))
+        journal.close()
+
+        html.write_text("<p>hel")
+        resumed = BatchJournal.open("b1", directory=tmp_path / "journal")
+        assert resumed.header['formats'] == ["md", "html", "epub"]
+        assert resumed.header['options'] == {'overwrite': True}
+        assert resumed.is_done(source, "md")
+        assert not resumed.is_done(source, "html")
+        assert not resumed.is_done(source, "epub")
+
+    def test_changed_source_is_redone(self, tmp_path):
+        """Test a pair is redone when its source changed after conversion."""
+        from convertext_gui.journal import BatchJournal
+
+        source, target = tmp_path / "a.txt", tmp_path / "a.md"
+        source.write_text("hello")
+        target.write_text("# hello")
+        journal = BatchJournal.open("b1", [source], ["md"], directory=tmp_path)
+        journal.record(_record(source, target, "md"))
+        journal.close()
+
+        source.write_text("hello again")
+        assert not BatchJournal.open("b1", directory=tmp_path).is_done(source, "md")
+
+    def test_torn_line_ignored(self, tmp_path):
+        """Test a half-written last line from a crash does not break replay."""
+        from convertext_gui.journal import BatchJournal, unfinished
+
+        source, target = tmp_path / "a.txt", tmp_path / "a.md"
+        source.write_text("hello")
+        target.write_text("# hello")
+        journal = BatchJournal.open("b1", [source], ["md"], directory=tmp_path / "j")
+        journal.record(_record(source, target, "md"))
+        journal.close()
+        with open(journal.path, 'a') as f:
+            f.write('{"event": "done", "sour')
+
+        journals = unfinished(tmp_path / "j")
+        assert [j.batch_id for j in journals] == ["b1"]
+        assert journals[0].is_done(source, "md")
+
+    def test_finish_removes(self, tmp_path):
+        """Test a finished batch leaves nothing to resume."""
+        from convertext_gui.journal import BatchJournal, unfinished
+
+        journal = BatchJournal.open("b1", [], ["md"], directory=tmp_path)
+        journal.finish()
+        assert unfinished(tmp_path) == []
+        assert unfinished(tmp_path / "missing") == []
+
+    def test_job_from_journal(self, tmp_path):
+        """Test an orphaned journal becomes an interrupted job with its options."""
+        from pathlib import Path
+        from convertext_gui.jobs import Job
+        from convertext_gui.journal import BatchJournal
+
+        job = Job(files=[Path("/x/a.txt")], formats=["md"], output_dir=Path("/out"), overwrite=True, priority="high")
+        journal = BatchJournal.open(job.id, job.files, job.formats, job.options, directory=tmp_path)
+        journal.close()
+
+        restored = Job.from_journal(BatchJournal.load(journal.path).header)
+        assert restored.id == job.id
+        assert restored.state == "interrupted"
+        assert (restored.files, restored.formats, restored.output_dir) == (job.files, job.formats, job.output_dir)
+        assert restored.overwrite and restored.priority == "high"
+
+
+class TestResume:
+    """Tests for ConversionThread with a journal."""
+
+    def test_thread_skips_journaled_pairs(self, tmp_path):
+        """Test a resumed batch converts only what was not done, then drops its journal."""
+        from convertext_gui.journal import BatchJournal
+        from convertext_gui.threads import ConversionThread
+
+        files = []
+        for name in ("a", "b"):
+            path = tmp_path / f"{name}.pdf"
+            path.write_text(name)
+            files.append(path)
+        done = tmp_path / "a.txt"
+        done.write_text("a")
+
+        journal = BatchJournal.open("b1", files, ["txt", "md"], directory=tmp_path / "j")
+        journal.record(_record(files[0], done, "txt"))
+        journal.close()
+
+        engine = Mock()
+        engine.convert = Mock(side_effect=lambda file, fmt: SimpleNamespace(
+            success=True, target_path=file.with_suffix("." + fmt), error=None))
+        callback = Mock()
+        thread = ConversionThread(engine, files, ["txt", "md"], None, False, False, callback,
+                                  journal=BatchJournal.open("b1", directory=tmp_path / "j"))
+        thread.run()
+
+        converted = sorted((call.args[0].name, call.args[1]) for call in engine.convert.call_args_list)
+        assert converted == [("a.pdf", "md"), ("b.pdf", "md"), ("b.pdf", "txt")]
+        assert thread.resumed == 1
+        assert not (tmp_path / "j" / "b1.jsonl").exists()
+        assert callback.call_args_list[-1][0][1].startswith("Conversion complete")
+
+    def test_interrupted_thread_keeps_journal(self, tmp_path):
+        """Test a batch stopped with interrupt() can still be resumed."""
+        from convertext_gui.journal import BatchJournal, unfinished
+        from convertext_gui.threads import ConversionThread
+
+        source = tmp_path / "a.pdf"
+        source.write_text("a")
+        engine = Mock()
+        thread = ConversionThread(engine, [source], ["txt"], None, False, False, Mock(),
+                                  journal=BatchJournal.open("b1", [source], ["txt"], directory=tmp_path / "j"))
+        thread.interrupt()
+        thread.run()
+
+        assert thread.cancelled and thread.interrupted
+        engine.convert.assert_not_called()
+        assert [j.batch_id for j in unfinished(tmp_path / "j")] == ["b1"]
@@ -0,0 +1,36 @@
+"""Tests for the format manifest cache."""
+
+import json
+
+
+class TestFormatManifest:
+    """Tests for load_manifest/save_manifest."""
+
+    def test_round_trip(self, tmp_path):
+        """Test saved formats load back unchanged."""
+        from convertext_gui.manifest import load_manifest, save_manifest
+
+        path = tmp_path / "formats.json"
+        formats = {"md": ["html", "txt"], "txt": ["epub", "md"]}
+        save_manifest(formats, path)
+        assert load_manifest(path) == formats
+
+    def test_missing_or_corrupt(self, tmp_path):
+        """Test a missing or unreadable manifest is ignored."""
+        from convertext_gui.manifest import load_manifest
+
+        path = tmp_path / "formats.json"
+        assert load_manifest(path) is None
+        path.write_text("{not json")
+        assert load_manifest(path) is None
+
+    def test_stale_key(self, tmp_path):
+        """Test a manifest written for other converters is ignored."""
+        from convertext_gui.manifest import load_manifest, save_manifest
+
+        path = tmp_path / "formats.json"
+        save_manifest({"txt": ["md"]}, path)
+        data = json.loads(path.read_text())
+        data["key"] = "0" * 64
+        path.write_text(json.dumps(data))
+        assert load_manifest(path) is None
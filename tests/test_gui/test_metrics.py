@@ -0,0 +1,113 @@
+"""Tests for conversion metrics and reports."""
+
+import csv
+import json
+import pytest
+from pathlib import Path
+
+from convertext_gui.conversion import ConversionRecord
+
+
+def _record(name, converter="TXTConverter", seconds=1.0, success=True, cached=False):
+    return ConversionRecord(
+        success=success, source_path=Path(name), target_path=Path(name).with_suffix(".md") if success else None,
+        error=None if success else "boom", cached=cached, seconds=seconds, target_format="md",
+        cpu_seconds=seconds / 2, peak_rss=100 * 1024 ** 2, input_bytes=2048, output_bytes=1024,
+        converter=converter
+    )
+
+
+class TestMetrics:
+    """Tests for summarize and export_report."""
+
+    def test_summarize(self):
+        """Test batch totals and per-converter figures."""
+        from convertext_gui.metrics import summarize
+
+        summary = summarize([
+            _record("a.txt", seconds=1.0),
+            _record("b.txt", seconds=3.0),
+            _record("c.pdf", converter="PDFConverter", seconds=2.0),
+            _record("d.txt", converter="cache", cached=True),
+            _record("e.txt", success=False),
+        ])
+        assert summary['conversions'] == 5
+        assert summary['succeeded'] == 4
+        assert summary['failed'] == 1
+        assert summary['cached'] == 1
+        assert summary['seconds'] == 6.0
+        assert summary['input_bytes'] == 3 * 2048
+        assert set(summary['converters']) == {"TXTConverter", "PDFConverter"}
+        assert summary['converters']["TXTConverter"]['slowest'] == 3.0
+        assert summary['converters']["TXTConverter"]['conversions'] == 2
+
+    def test_export_csv(self, tmp_path):
+        """Test a CSV report has one row per conversion."""
+        from convertext_gui.metrics import export_report, REPORT_FIELDS
+
+        path = tmp_path / "report.csv"
+        export_report([_record("a.txt"), _record("b.txt", success=False)], path)
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert list(rows[0]) == [*REPORT_FIELDS, 'app_version', 'convertext_version']
+        assert rows[0]['converter'] == "TXTConverter"
+        assert rows[1]['app_version'] and rows[1]['convertext_version']
+        assert rows[1]['target_path'] == ""
+
+    def test_export_json(self, tmp_path):
+        """Test a JSON report carries versions, summary and conversions."""
+        from convertext_gui.metrics import export_report
+
+        path = tmp_path / "report.json"
+        export_report([_record("a.txt")], path)
+        report = json.loads(path.read_text())
+        assert report['app_version']
+        assert report['summary']['succeeded'] == 1
+        assert report['conversions'][0]['source_path'] == "a.txt"
+
+    def test_conversion_records_metrics(self, tmp_path):
+        """Test convert_source fills in byte counts and timings."""
+        from types import SimpleNamespace
+        from unittest.mock import Mock
+        from convertext_gui.conversion import convert_source
+
+        source = tmp_path / "a.txt"
+        source.write_text("hello")
+        target = tmp_path / "a.md"
+        target.write_text("hello world")
+        engine = Mock()
+        engine.convert = Mock(return_value=SimpleNamespace(
+            success=True, source_path=source, target_path=target, error=None, conversion_path=None))
+
+        record, = convert_source(engine, source, ["md"])
+        assert record.input_bytes == 5
+        assert record.output_bytes == 11
+        assert record.seconds >= 0
+        assert record.target_format == "md"
+
+    def test_memory_measured_only_when_alone(self, tmp_path):
+        """Test memory growth is attributed to a unit only when nothing else could have caused it."""
+        from types import SimpleNamespace
+        from unittest.mock import Mock
+        from convertext_gui.conversion import convert_source
+        from convertext_gui.memory import process_rss
+        from convertext_gui.metrics import peak_rss_bytes
+
+        if process_rss() is None or peak_rss_bytes() is None:
+            pytest.skip("resident memory unreadable here")
+        source = tmp_path / "a.txt"
+        source.write_text("hello")
+
+        def convert(file, fmt):
+            # Enough touched pages to push the high-water mark up
+            ballast = bytearray(peak_rss_bytes() - process_rss() + 64 * 1024 ** 2)
+            ballast[::4096] = b"x" * len(ballast[::4096])
+            return SimpleNamespace(success=True, source_path=file, target_path=file.with_suffix(".md"),
+                                   error=None, conversion_path=None)
+
+        engine = Mock()
+        engine.convert = Mock(side_effect=convert)
+        alone, = convert_source(engine, source, ["md"], measure_memory=True)
+        assert alone.memory_bytes > 32 * 1024 ** 2
+        shared, = convert_source(engine, source, ["md"])
+        assert shared.memory_bytes is None
@@ -0,0 +1,82 @@
+"""Tests for slow-conversion profiling."""
+
+import time
+from pathlib import Path
+
+
+class TestProfiling:
+    """Tests for run_profiled."""
+
+    def test_slow_call_saves_profile(self, tmp_path):
+        """Test a call over the threshold leaves .prof and .txt files."""
+        from convertext_gui.profiling import ProfileSettings, run_profiled
+
+        settings = ProfileSettings(threshold=0.0, directory=tmp_path)
+        assert run_profiled(settings, Path("book.pdf"), ["txt"], lambda: 42) == 42
+
+        assert len(list(tmp_path.glob("book-txt-*.prof"))) == 1
+        summary, = tmp_path.glob("book-txt-*.txt")
+        assert summary.read_text().startswith("book.pdf -> txt")
+
+    def test_dotted_name_kept(self, tmp_path):
+        """Test dots in the source name do not cut the profile names short."""
+        from convertext_gui.profiling import ProfileSettings, run_profiled
+
+        settings = ProfileSettings(threshold=0.0, directory=tmp_path)
+        run_profiled(settings, Path("report.v2.final.pdf"), ["txt"], lambda: None)
+
+        assert len(list(tmp_path.glob("report.v2.final-txt-*.prof"))) == 1
+        assert len(list(tmp_path.glob("report.v2.final-txt-*.txt"))) == 1
+
+    def test_fast_call_saves_nothing(self, tmp_path):
+        """Test calls under the threshold are not kept."""
+        from convertext_gui.profiling import ProfileSettings, run_profiled
+
+        settings = ProfileSettings(threshold=60.0, directory=tmp_path)
+        run_profiled(settings, Path("book.pdf"), ["txt"], lambda: time.sleep(0.01))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_concurrent_call_sampled(self, tmp_path):
+        """Test a call made while another holds cProfile is sampled rather than left out."""
+        import threading
+        from convertext_gui.profiling import ProfileSettings, run_profiled
+
+        settings = ProfileSettings(threshold=0.0, directory=tmp_path)
+        started, release = threading.Event(), threading.Event()
+
+        def hold():
+            started.set()
+            release.wait(5)
+
+        holder = threading.Thread(target=run_profiled, args=(settings, Path("first.pdf"), ["txt"], hold))
+        holder.start()
+        started.wait(5)
+        try:
+            run_profiled(settings, Path("second.pdf"), ["txt"], lambda: time.sleep(0.2))
+        finally:
+            release.set()
+            holder.join(5)
+
+        assert len(list(tmp_path.glob("first-txt-*.prof"))) == 1
+        summary, = tmp_path.glob("second-txt-*-sampled.txt")
+        assert "<lambda>" in summary.read_text()
+        folded, = tmp_path.glob("second-txt-*-sampled.folded")
+        assert "<lambda>" in folded.read_text()
+
+    def test_convert_source_profiles(self, tmp_path):
+        """Test convert_source routes conversions through the profiler."""
+        from types import SimpleNamespace
+        from unittest.mock import Mock
+        from convertext_gui.conversion import convert_source
+        from convertext_gui.profiling import ProfileSettings
+
+        source = tmp_path / "a.txt"
+        source.write_text("hello")
+        engine = Mock()
+        engine.convert = Mock(return_value=SimpleNamespace(
+            success=True, source_path=source, target_path=tmp_path / "a.md", error=None))
+
+        profiles = tmp_path / "profiles"
+        record, = convert_source(engine, source, ["md"], profile=ProfileSettings(threshold=0.0, directory=profiles))
+        assert record.success
+        assert len(list(profiles.glob("a-md-*.prof"))) == 1
@@ -0,0 +1,51 @@
+"""Tests for the progress channel."""
+
+from pathlib import Path
+
+from convertext_gui.conversion import ConversionRecord
+
+
+def _record(name):
+    return ConversionRecord(success=True, source_path=Path(name), target_path=Path(name + ".md"))
+
+
+class TestProgressChannel:
+    """Tests for ProgressChannel."""
+
+    def test_coalesces_progress_and_batches_results(self):
+        """Test only the latest progress survives while every result is kept."""
+        from convertext_gui.progress import ProgressChannel
+
+        channel = ProgressChannel()
+        channel.publish(10, "a", _record("one"))
+        channel.publish(20, "b", _record("two"))
+        channel.publish(30, "c", _record("three"))
+
+        latest, results, finished = channel.drain()
+        assert latest == (30, "c")
+        assert [r.source_path.name for r in results] == ["one", "two", "three"]
+        assert finished is False
+        assert channel.merged == 2
+        assert channel.refreshes == 1
+
+    def test_empty_drain(self):
+        """Test draining with nothing published."""
+        from convertext_gui.progress import ProgressChannel
+
+        channel = ProgressChannel()
+        assert channel.drain() == (None, [], False)
+        assert channel.refreshes == 0
+
+    def test_batch_end(self):
+        """Test a None result marks the batch finished."""
+        from convertext_gui.progress import ProgressChannel
+
+        channel = ProgressChannel()
+        channel.publish(50, "half", _record("one"))
+        channel.publish(100, "Conversion complete!", None)
+
+        latest, results, finished = channel.drain()
+        assert latest == (100, "Conversion complete!")
+        assert len(results) == 1
+        assert finished is True
+        assert channel.drain() == (None, [], False)
@@ -0,0 +1,44 @@
+"""Tests for background folder scanning."""
+
+from pathlib import Path
+
+
+class TestFolderScanThread:
+    """Tests for FolderScanThread."""
+
+    def test_scan_filters_and_batches(self, tmp_path):
+        """Test nested folders are walked and filtered by extension."""
+        from convertext_gui.scanner import FolderScanThread
+
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        for name in ["one.txt", "two.PDF", "skip.exe", "a/three.md", "a/b/four.txt", "a/b/skip.png"]:
+            (tmp_path / name).write_text("x")
+
+        batches = []
+        done = []
+        thread = FolderScanThread(
+            [tmp_path],
+            {"txt", "pdf", "md"},
+            on_batch=lambda paths, found: batches.append(list(paths)),
+            on_done=done.append,
+            batch_size=2
+        )
+        thread.run()
+
+        found = [Path(p).relative_to(tmp_path).as_posix() for batch in batches for p in batch]
+        assert sorted(found) == ["a/b/four.txt", "a/three.md", "one.txt", "two.PDF"]
+        assert all(len(batch) <= 3 for batch in batches)
+        assert done == [4]
+
+    def test_stop(self, tmp_path):
+        """Test a stopped scan reports nothing further."""
+        from convertext_gui.scanner import FolderScanThread
+
+        (tmp_path / "doc.txt").write_text("x")
+        batches = []
+        thread = FolderScanThread([tmp_path], {"txt"}, on_batch=lambda p, n: batches.append(p))
+        thread.stop()
+        thread.run()
+
+        assert batches == []
+        assert thread.found == 0
@@ -0,0 +1,150 @@
+"""Tests for the conversion cost model and ETA estimator."""
+
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+
+class TestCostModel:
+    """Tests for CostModel."""
+
+    def test_defaults_scale_with_size(self, tmp_path):
+        """Test an empty model still ranks bigger files as more expensive."""
+        from convertext_gui.scheduler import CostModel
+
+        model = CostModel(path=tmp_path / "cost_model.json")
+        assert model.estimate(10_000_000, "pdf", "txt") > model.estimate(1_000, "pdf", "txt")
+
+    def test_observe_smooths_and_persists(self, tmp_path):
+        """Test measured timings move the estimate and survive a reload."""
+        from convertext_gui.scheduler import CostModel
+
+        path = tmp_path / "cost_model.json"
+        model = CostModel(path=path)
+        model.observe(1_000_000, "pdf", "txt", 10.0)
+        slow = model.seconds_per_byte("pdf", "txt")
+        model.observe(1_000_000, "pdf", "txt", 1.0)
+        assert model.seconds_per_byte("pdf", "txt") < slow
+
+        model.save()
+        loaded = CostModel.load(path)
+        assert loaded.pairs == model.pairs
+        # Unmeasured pairs borrow the typical measured rate
+        assert loaded.seconds_per_byte("md", "html") == loaded.seconds_per_byte("pdf", "txt")
+
+    def test_observe_memory(self, tmp_path):
+        """Test memory per byte is learned for measured pairs from large enough sources."""
+        from convertext_gui.scheduler import CostModel
+
+        model = CostModel(path=tmp_path / "cost_model.json")
+        model.observe_memory(4 * 1024 ** 2, "pdf", "txt", 40 * 1024 ** 2)
+        assert model.memory_per_byte("pdf", "txt") is None
+
+        model.observe(4 * 1024 ** 2, "pdf", "txt", 1.0)
+        model.observe_memory(1024, "pdf", "txt", 40 * 1024 ** 2)
+        assert model.memory_per_byte("pdf", "txt") is None
+
+        model.observe_memory(4 * 1024 ** 2, "pdf", "txt", 40 * 1024 ** 2)
+        assert model.memory_per_byte("pdf", "txt") == 10
+        model.observe_memory(4 * 1024 ** 2, "pdf", "txt", 20 * 1024 ** 2)
+        assert 5 < model.memory_per_byte("pdf", "txt") < 10
+
+    def test_load_missing(self, tmp_path):
+        """Test a missing or corrupt file gives an empty model."""
+        from convertext_gui.scheduler import CostModel
+
+        path = tmp_path / "cost_model.json"
+        assert CostModel.load(path).pairs == {}
+        path.write_text("[]")
+        assert CostModel.load(path).pairs == {}
+
+    def test_order_largest_first(self, tmp_path):
+        """Test units are ordered by estimated cost, most expensive first."""
+        from convertext_gui.scheduler import CostModel
+
+        model = CostModel(path=tmp_path / "cost_model.json")
+        model.observe(1_000, "txt", "md", 0.03)
+        model.observe(1_000, "pdf", "txt", 2.0)
+        small, big, slow = Path("small.txt"), Path("big.txt"), Path("slow.pdf")
+        sizes = {small: 1_000, big: 1_000_000, slow: 10_000}
+
+        units = [(small, ["md"]), (big, ["md"]), (slow, ["txt"])]
+        assert [unit[0] for unit in model.order(units, sizes)] == [slow, big, small]
+
+    def test_thread_uses_and_updates_model(self, tmp_path):
+        """Test ConversionThread starts the largest file first and records timings."""
+        from convertext_gui.scheduler import CostModel
+        from convertext_gui.threads import ConversionThread
+
+        small = tmp_path / "small.txt"
+        small.write_text("x")
+        big = tmp_path / "big.txt"
+        big.write_text("x" * 100_000)
+
+        engine = Mock()
+        engine.convert = Mock(side_effect=lambda file, fmt: SimpleNamespace(
+            success=True, source_path=file, target_path=file.with_suffix(".md"), error=None))
+        model = CostModel(path=tmp_path / "cost_model.json")
+
+        thread = ConversionThread(
+            engine=engine,
+            files=[small, big],
+            formats=["md"],
+            output_dir=None,
+            overwrite=False,
+            keep_intermediate=False,
+            callback=Mock(),
+            cost_model=model
+        )
+        thread.run()
+
+        assert [call.args[0] for call in engine.convert.call_args_list] == [big, small]
+        assert (tmp_path / "cost_model.json").exists()
+
+
+class TestETAEstimator:
+    """Tests for ETAEstimator."""
+
+    def test_progress_is_weighted_by_bytes(self, tmp_path):
+        """Test finishing a big file moves progress further than a small one."""
+        from convertext_gui.scheduler import CostModel, ETAEstimator
+
+        estimator = ETAEstimator(CostModel(path=tmp_path / "cost_model.json"))
+        estimator.add(Path("small.txt"), 1_000, "md")
+        estimator.add(Path("big.txt"), 99_000, "md")
+
+        estimator.complete(Path("small.txt"), "md", elapsed=0.1)
+        assert estimator.progress == pytest.approx(1.0)
+        estimator.complete(Path("big.txt"), "md", elapsed=1.0)
+        assert estimator.progress == pytest.approx(100.0)
+        assert estimator.eta_seconds() == 0
+
+    def test_rate_tracks_measured_throughput(self, tmp_path):
+        """Test the ETA follows how fast estimated work is really finishing."""
+        from convertext_gui.scheduler import CostModel, ETAEstimator
+
+        model = CostModel(path=tmp_path / "cost_model.json")
+        model.observe(1_000_000, "pdf", "txt", 10.02)
+        estimator = ETAEstimator(model, workers=1)
+        for i in range(3):
+            estimator.add(Path(f"{i}.pdf"), 1_000_000, "txt")
+        assert estimator.eta_seconds() == 30
+
+        # First file took twice as long as the model predicted
+        estimator.complete(Path("0.pdf"), "txt", elapsed=20.0)
+        assert estimator.eta_seconds() == 40
+
+    def test_seeded_from_history(self, tmp_path):
+        """Test earlier sessions' timings shape the first estimate."""
+        from convertext_gui.scheduler import CostModel, ETAEstimator
+
+        fresh = ETAEstimator(CostModel(path=tmp_path / "fresh.json"))
+        fresh.add(Path("a.pdf"), 10_000_000, "txt")
+
+        slow_model = CostModel(path=tmp_path / "slow.json")
+        slow_model.observe(1_000_000, "pdf", "txt", 100.0)
+        seeded = ETAEstimator(slow_model)
+        seeded.add(Path("a.pdf"), 10_000_000, "txt")
+
+        assert seeded.eta_seconds() > fresh.eta_seconds()
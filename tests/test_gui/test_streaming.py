@@ -0,0 +1,257 @@
+"""Tests for streamed conversions and the memory budget."""
+
+import threading
+import pytest
+from unittest.mock import patch
+
+DOCUMENTS = {
+    "notes.txt": "Notes\n=====\n\nBy: Ann\n\nFirst line\nsecond line\n\n\n\nTwo  \n\n"
+                 + "\n\n".join(f"paragraph {i} " * 20 for i in range(50)),
+    "page.html": "<html><head><title>Page &amp; more</title><style>p {}</style></head><body>"
+                 "<h1>Top</h1><div>leaf</div><div><p>inner</p></div><p>a<br>b</p>"
+                 "<ul><li><p>listed</p></li></ul><table><tr><td>cell</td></tr></table><h2>Sub</h2>"
+                 + "".join(f"<p>para {i} &eacute;</p>\n" for i in range(50)) + "</body></html>",
+    "untitled.htm": "<body><p>before</p><h1>First</h1><p>after</p></body>",
+    "unclosed.html": "<body><p>one<p>two<div>three</div><p>four <b>bold</b></body>",
+    "nested.htm": "<body><div><p>outer<p>inner</p>tail</p><h2>Head<p>in heading</p></h2></div>"
+                  "<blockquote><p>quoted</p></blockquote><p>last</p></body>",
+    "empty-h1.html": "<body><h1></h1><p>intro</p><h1>Second</h1><p>body</p></body>",
+    "empty-title.html": "<html><head><title> </title></head><body><p>x</p><h1>Head</h1></body></html>",
+    "readme.md": "# Title\n\nSome *text* & <b>\n\n```\ncode\n\nmore\n```\n\n- a\n\n- b\n\n"
+                 "| a | b |\n|---|---|\n| 1 | 2 |\n\n"
+                 + "\n\n".join(f"## Part {i}\n\nBody {i}" for i in range(50)),
+}
+TARGETS = {"txt": "md", "html": "txt", "htm": "txt", "md": "html"}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Real conversion engine writing into tmp_path/out."""
+    try:
+        from convertext.converters.loader import load_converters
+    except (ImportError, SyntaxError) as e:
+        pytest.skip(f"convertext converters unavailable: {e}")
+    from convertext.config import Config
+    from convertext.core import ConversionEngine
+
+    load_converters()
+    out = tmp_path / "out"
+    out.mkdir()
+    config = Config()
+    config.override({'output': {'directory': str(out), 'overwrite': True}})
+    return ConversionEngine(config)
+
+
+class TestStreaming:
+    """Tests for chunked TXT/HTML/Markdown conversion."""
+
+    @pytest.mark.parametrize("name", sorted(DOCUMENTS))
+    def test_matches_regular_converter(self, engine, tmp_path, name):
+        """Test streamed output is identical to engine.convert, even with tiny chunks."""
+        from convertext_gui import streaming
+
+        source = tmp_path / name
+        source.write_text(DOCUMENTS[name], encoding="utf-8")
+        fmt = TARGETS[source.suffix.lstrip('.')]
+        expected = engine.convert(source, fmt).target_path.read_text(encoding="utf-8")
+
+        assert streaming.can_stream(engine, source, fmt)
+        with patch.object(streaming, "CHUNK_SIZE", 17):
+            record = streaming.stream_convert(engine, source, fmt)
+
+        assert record.success, record.error
+        assert record.converter.endswith("(streaming)")
+        assert record.target_path.read_text(encoding="utf-8") == expected
+
+    def test_unsupported_pair_not_streamed(self, engine, tmp_path):
+        """Test pairs without a streamer use the regular path."""
+        from convertext_gui.streaming import can_stream
+
+        assert not can_stream(engine, tmp_path / "book.txt", "epub")
+
+    def test_convert_source_streams_large_files(self, engine, tmp_path):
+        """Test sources over the threshold are streamed, other targets converted normally."""
+        from convertext_gui.conversion import convert_source
+
+        source = tmp_path / "notes.txt"
+        source.write_text(DOCUMENTS["notes.txt"], encoding="utf-8")
+
+        streamed, regular = convert_source(engine, source, ["md", "html"], stream_over=1)
+        assert streamed.success and streamed.converter == "TxtConverter (streaming)"
+        assert regular.success and "streaming" not in regular.converter
+
+        small, = convert_source(engine, source, ["md"], stream_over=10 ** 9)
+        assert "streaming" not in small.converter
+
+    def test_existing_target_not_overwritten(self, engine, tmp_path):
+        """Test the usual overwrite check applies to streamed targets."""
+        from convertext_gui.streaming import stream_convert
+
+        engine.config.override({'output': {'overwrite': False}})
+        source = tmp_path / "notes.txt"
+        source.write_text("hello", encoding="utf-8")
+        (tmp_path / "out" / "notes.md").write_text("keep")
+
+        record = stream_convert(engine, source, "md")
+        assert not record.success
+        assert "already exists" in record.error
+        assert (tmp_path / "out" / "notes.md").read_text() == "keep"
+
+    def test_config_error_becomes_failed_record(self, engine, tmp_path):
+        """Test a failure while resolving the target is reported, not raised."""
+        from convertext_gui.streaming import stream_convert
+
+        source = tmp_path / "notes.txt"
+        source.write_text("hello", encoding="utf-8")
+        with patch.object(engine, "_get_target_path", side_effect=KeyError("pattern")):
+            record = stream_convert(engine, source, "md")
+        assert not record.success
+        assert record.target_path is None
+        assert "pattern" in record.error
+
+
+class TestMemoryBudget:
+    """Tests for MemoryBudget admission."""
+
+    def test_admits_within_budget(self):
+        """Test reservations are admitted until the budget is full."""
+        from convertext_gui.memory import MemoryBudget
+
+        budget = MemoryBudget(100, measure=None)
+        assert budget.try_acquire(60)
+        assert not budget.try_acquire(60)
+        budget.release(60)
+        assert budget.try_acquire(60)
+
+    def test_oversized_job_runs_alone(self):
+        """Test a job larger than the budget is admitted when nothing else runs."""
+        from convertext_gui.memory import MemoryBudget
+
+        budget = MemoryBudget(100, measure=None)
+        assert budget.acquire(500)
+        assert not budget.try_acquire(1)
+        budget.release(500)
+        assert budget.in_use == 0 and budget.running == 0
+
+    def test_acquire_waits_for_release(self):
+        """Test a blocked acquire proceeds once memory is released."""
+        from convertext_gui.memory import MemoryBudget
+
+        budget = MemoryBudget(100, measure=None)
+        budget.acquire(80)
+        admitted = []
+        waiter = threading.Thread(target=lambda: admitted.append(budget.acquire(50)))
+        waiter.start()
+        waiter.join(0.3)
+        assert admitted == []
+
+        budget.release(80)
+        waiter.join(2)
+        assert admitted == [True]
+
+    def test_acquire_gives_up_when_stopped(self):
+        """Test should_stop ends the wait without reserving."""
+        from convertext_gui.memory import MemoryBudget
+
+        budget = MemoryBudget(100, measure=None)
+        budget.acquire(80)
+        assert not budget.acquire(50, should_stop=lambda: True)
+        assert budget.in_use == 80
+
+    def test_live_memory_holds_back_jobs(self):
+        """Test a job that fits the estimates still waits while resident memory is high."""
+        from convertext_gui.memory import MemoryBudget
+
+        rss = [90]
+        budget = MemoryBudget(100, measure=lambda: rss[0])
+        assert budget.try_acquire(10)
+        assert not budget.try_acquire(20)
+        rss[0] = 50
+        assert budget.try_acquire(20)
+
+    def test_live_rss_reads_proc(self):
+        """Test live_rss reports this process where /proc exists."""
+        import os
+        from convertext_gui.memory import live_rss
+
+        if not os.path.exists("/proc/self/statm"):
+            pytest.skip("no /proc")
+        assert live_rss() > 0
+
+    def test_platform_readings(self):
+        """Test resident and physical memory are read on Linux, macOS and Windows."""
+        import sys
+        from convertext_gui.memory import default_budget, process_rss, total_memory
+
+        if not sys.platform.startswith(("linux", "darwin", "win32")):
+            pytest.skip(f"no memory readings on {sys.platform}")
+        rss = process_rss()
+        assert 0 < rss < total_memory()
+        assert default_budget() == total_memory() // 2
+
+    def test_estimate_uses_measured_factor(self):
+        """Test learned memory per byte replaces the default factor."""
+        from convertext_gui.memory import IN_MEMORY_FACTOR, STREAMING_BYTES, estimate_memory
+
+        assert estimate_memory(1000) == 1000 * IN_MEMORY_FACTOR
+        assert estimate_memory(1000, factor=2.5) == 2500
+        assert estimate_memory(1000, streamed=True, factor=2.5) == STREAMING_BYTES
+
+    def test_status_shows_breakdown(self, tmp_path):
+        """Test the progress status reports admitted and queued units."""
+        from types import SimpleNamespace
+        from unittest.mock import Mock
+        from convertext_gui.memory import MemoryBudget
+        from convertext_gui.threads import ConversionThread
+
+        files = []
+        for i in range(3):
+            path = tmp_path / f"f{i}.pdf"
+            path.write_bytes(b"x")
+            files.append(path)
+        engine = Mock()
+        engine.convert = Mock(side_effect=lambda file, fmt: SimpleNamespace(
+            success=True, target_path=file.with_suffix(".txt"), error=None))
+        callback = Mock()
+        thread = ConversionThread(engine, files, ["txt"], None, False, False, callback,
+                                  memory_budget=MemoryBudget(10 ** 9, measure=None))
+        thread.run()
+
+        first_status = callback.call_args_list[0][0][1]
+        assert "0 admitted, 2 queued" in first_status
+
+    def test_thread_limits_concurrency(self, tmp_path):
+        """Test ConversionThread never runs more units than the budget allows."""
+        from types import SimpleNamespace
+        from unittest.mock import Mock
+        from convertext_gui.memory import MemoryBudget
+        from convertext_gui.threads import ConversionThread
+
+        files = []
+        for i in range(6):
+            path = tmp_path / f"f{i}.pdf"
+            path.write_bytes(b"x" * 100)
+            files.append(path)
+
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def convert(file, fmt):
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            threading.Event().wait(0.05)
+            with lock:
+                running[0] -= 1
+            return SimpleNamespace(success=True, target_path=file.with_suffix(".txt"), error=None)
+
+        engine = Mock()
+        engine.convert = convert
+        budget = MemoryBudget(2 * 100 * 8, measure=None)
+        thread = ConversionThread(engine, files, ["txt"], None, False, False, Mock(), workers=4,
+                                  memory_budget=budget)
+        thread.run()
+
+        assert len(thread.results) == 6
+        assert running[1] <= 2
+        assert budget.in_use == 0 and budget.running == 0
@@ -0,0 +1,148 @@
+"""Tests for watch-folder mode."""
+
+import queue
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _watch(tmp_path, backend, **kwargs):
+    """Started FolderWatcher on tmp_path/in with fast timings, and its queue of ready batches."""
+    from convertext_gui.watcher import FolderWatcher
+
+    ready = queue.Queue()
+    try:
+        watcher = FolderWatcher([tmp_path / "in"], {"txt", "md"}, on_ready=ready.put, settle=0.2,
+                                poll_interval=0.05, backend=backend, **kwargs)
+    except OSError as e:
+        pytest.skip(f"{backend} unavailable: {e}")
+    watcher.start()
+    return watcher, ready
+
+
+def _collect(ready, count, timeout=5):
+    """Paths from ready batches until `count` have arrived."""
+    paths = []
+    while len(paths) < count:
+        paths.extend(ready.get(timeout=timeout))
+    return sorted(paths)
+
+
+class TestDebouncer:
+    """Tests for Debouncer."""
+
+    def test_releases_settled_files(self, tmp_path):
+        """Test a file is released only after it holds still for the settle time."""
+        from convertext_gui.watcher import Debouncer
+
+        clock = FakeClock()
+        debouncer = Debouncer(settle=2.0, clock=clock)
+        path = tmp_path / "a.txt"
+        path.write_text("part")
+        debouncer.touch(str(path))
+
+        clock.now = 1.0
+        assert debouncer.ready() == []
+        assert debouncer.next_deadline() == 2.0
+
+        # Still growing at the deadline: wait another interval
+        path.write_text("partial, now longer")
+        clock.now = 2.5
+        assert debouncer.ready() == []
+        clock.now = 4.5
+        assert debouncer.ready() == [str(path)]
+        assert len(debouncer) == 0
+
+    def test_drops_vanished_files(self, tmp_path):
+        """Test a file deleted or moved away before settling is never released."""
+        from convertext_gui.watcher import Debouncer
+
+        clock = FakeClock()
+        debouncer = Debouncer(settle=1.0, clock=clock)
+        path = tmp_path / "a.txt.part"
+        path.write_text("x")
+        debouncer.touch(str(path))
+        path.unlink()
+        clock.now = 2.0
+        assert debouncer.ready() == []
+        assert len(debouncer) == 0
+
+    def test_within(self, tmp_path):
+        """Test folder containment checks whole path components."""
+        from convertext_gui.watcher import within
+
+        assert within(tmp_path / "a" / "b", tmp_path / "a")
+        assert within(tmp_path / "a", tmp_path / "a")
+        assert not within(tmp_path / "ab", tmp_path / "a")
+
+
+@pytest.mark.parametrize("backend", ["poll", "inotify"])
+class TestFolderWatcher:
+    """Tests for FolderWatcher on each backend."""
+
+    def test_reports_existing_and_new_files(self, tmp_path, backend):
+        """Test files present at start, new files and files in new folders are reported once."""
+        inbox, out = tmp_path / "in", tmp_path / "in" / "out"
+        out.mkdir(parents=True)
+        (inbox / "old.txt").write_text("old")
+        (inbox / "skip.pdf").write_text("not watched")
+
+        watcher, ready = _watch(tmp_path, backend, exclude=[out])
+        try:
+            assert _collect(ready, 1) == [str(inbox / "old.txt")]
+
+            (inbox / "new.md").write_text("# new")
+            (out / "old.md").write_text("an output")
+            sub = inbox / "sub" / "deeper"
+            sub.mkdir(parents=True)
+            (sub / "nested.txt").write_text("nested")
+            assert _collect(ready, 2) == [str(inbox / "new.md"), str(sub / "nested.txt")]
+
+            with pytest.raises(queue.Empty):
+                ready.get(timeout=0.5)
+        finally:
+            watcher.stop()
+            watcher.join(2)
+        assert not watcher.is_alive()
+
+    def test_waits_for_partial_writes(self, tmp_path, backend):
+        """Test a file still being written is reported after it stops changing."""
+        import time
+
+        inbox = tmp_path / "in"
+        inbox.mkdir()
+        watcher, ready = _watch(tmp_path, backend)
+        try:
+            with open(inbox / "big.txt", "w") as f:
+                for _ in range(6):
+                    f.write("chunk\n" * 1000)
+                    f.flush()
+                    time.sleep(0.1)
+                    assert ready.empty()
+            assert _collect(ready, 1) == [str(inbox / "big.txt")]
+            assert (inbox / "big.txt").stat().st_size == 36000
+        finally:
+            watcher.stop()
+            watcher.join(2)
+
+
+class TestWatchCli:
+    """Tests for headless --watch argument checks."""
+
+    @pytest.mark.parametrize("extra", [[], ["--out", "IN"], ["--out", "PARENT"]])
+    def test_rejects_unsafe_output(self, tmp_path, extra):
+        """Test watching needs an output folder outside the watched ones."""
+        from convertext_gui.cli import main
+
+        inbox = tmp_path / "in"
+        inbox.mkdir()
+        extra = [{"IN": str(inbox), "PARENT": str(tmp_path)}.get(arg, arg) for arg in extra]
+        with pytest.raises(SystemExit) as exc:
+            main(["--headless", "--watch", "--formats", "md", *extra, str(inbox)])
+        assert exc.value.code == 2
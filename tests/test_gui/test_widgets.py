@@ -62,7 +62,30 @@ class TestFileList:
 
             # Verify cleared
             assert len(file_list.files) == 0
-            assert len(file_list.file_widgets) == 0
+            assert len(file_list) == 0
+
+    def test_remove_files(self):
+        """Test removing files keeps order and the membership index in sync."""
+        import tkinter as tk
+        try:
+            root = tk.Tk()
+        except tk.TclError:
+            pytest.skip("no display")
+
+        try:
+            from convertext_gui.widgets import FileList
+
+            file_list = FileList(root)
+            file_list.add_files(["/tmp/a.pdf", "/tmp/b.pdf", "/tmp/c.pdf"])
+            root.update()
+            file_list.remove_files(["/tmp/b.pdf"])
+
+            assert file_list.files == [Path("/tmp/a.pdf"), Path("/tmp/c.pdf")]
+            assert "/tmp/b.pdf" not in file_list
+            assert len(file_list.tree.get_children()) == 2
+            assert file_list.add_files(["/tmp/b.pdf"]) == [Path("/tmp/b.pdf")]
+        finally:
+            root.destroy()
 
 
 class TestConversionThread:
@@ -155,6 +178,199 @@ class TestConversionThread:
         assert thread.results[0].success is False
         assert "Conversion failed" in thread.results[0].error
 
+    def test_thread_parallel_workers(self):
+        """Test pool conversion reports every pair and finishes last."""
+        from convertext_gui.threads import ConversionThread
+        from types import SimpleNamespace
+
+        def convert(file, fmt):
+            return SimpleNamespace(
+                success=True,
+                source_path=file,
+                target_path=file.with_suffix(f".{fmt}"),
+                error=None
+            )
+
+        engine = Mock()
+        engine.convert = Mock(side_effect=convert)
+        callback = Mock()
+
+        files = [Path(f"/tmp/test{i}.pdf") for i in range(5)]
+        thread = ConversionThread(
+            engine=engine,
+            files=files,
+            formats=["txt", "md"],
+            output_dir=None,
+            overwrite=False,
+            keep_intermediate=False,
+            callback=callback,
+            workers=4
+        )
+
+        thread.run()
+
+        assert engine.convert.call_count == 10
+        assert len(thread.results) == 10
+        progresses = [c.args[0] for c in callback.call_args_list]
+        assert progresses == sorted(progresses)
+        assert callback.call_args_list[-1].args == (100, "Conversion complete!", None)
+
+    @pytest.mark.parametrize("shared", [False, True])
+    def test_thread_worker_error_fails_unit(self, shared):
+        """Test a pool task that raises becomes a failed record and the batch still finishes."""
+        from unittest.mock import patch
+        from convertext_gui.jobs import FairScheduler
+        from convertext_gui.threads import ConversionThread, ConversionRecord
+
+        def convert_source(engine, file, formats, *args, **kwargs):
+            if file.name == "bad.pdf":
+                raise RuntimeError("worker blew up")
+            return [ConversionRecord(success=True, source_path=file, target_path=file.with_suffix(".txt"),
+                                     target_format=fmt) for fmt in formats]
+
+        callback = Mock()
+        thread = ConversionThread(
+            engine=Mock(),
+            files=[Path("/tmp/good.pdf"), Path("/tmp/bad.pdf")],
+            formats=["txt"],
+            output_dir=None,
+            overwrite=False,
+            keep_intermediate=False,
+            callback=callback,
+            workers=2,
+            scheduler=FairScheduler(2) if shared else None
+        )
+        with patch("convertext_gui.threads.convert_source", side_effect=convert_source):
+            thread.run()
+
+        outcomes = sorted((r.source_path.name, r.success, r.error) for r in thread.results)
+        assert outcomes == [("bad.pdf", False, "worker blew up"), ("good.pdf", True, None)]
+        assert callback.call_args_list[-1].args == (100, "Conversion complete!", None)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_thread_cancel(self, workers):
+        """Test cancelling stops new conversions and reports partial results."""
+        from convertext_gui.threads import ConversionThread, CancelToken
+        from types import SimpleNamespace
+
+        token = CancelToken()
+
+        def convert(file, fmt):
+            token.cancel()
+            return SimpleNamespace(success=True, source_path=file,
+                                   target_path=file.with_suffix(f".{fmt}"), error=None)
+
+        engine = Mock()
+        engine.convert = Mock(side_effect=convert)
+        callback = Mock()
+
+        thread = ConversionThread(
+            engine=engine,
+            files=[Path(f"/tmp/test{i}.pdf") for i in range(20)],
+            formats=["txt"],
+            output_dir=None,
+            overwrite=False,
+            keep_intermediate=False,
+            callback=callback,
+            workers=workers,
+            token=token
+        )
+
+        thread.run()
+
+        assert thread.cancelled is True
+        assert 1 <= len(thread.results) <= workers * 2
+        progress, status, result = callback.call_args_list[-1].args
+        assert result is None
+        assert progress < 100
+        assert "cancelled" in status
+
+    def test_token_pause_resume(self):
+        """Test pausing blocks the checkpoint until resumed."""
+        import threading
+        from convertext_gui.threads import CancelToken
+
+        token = CancelToken()
+        token.pause()
+        assert token.paused is True
+
+        threading.Timer(0.05, token.resume).start()
+        assert token.checkpoint() is True
+        assert token.paused is False
+        assert token.paused_seconds > 0
+
+    def test_thread_unknown_backend(self):
+        """Test unknown pool backends are rejected up front."""
+        from convertext_gui.threads import ConversionThread
+
+        with pytest.raises(ValueError):
+            ConversionThread(
+                engine=Mock(),
+                files=[],
+                formats=[],
+                output_dir=None,
+                overwrite=False,
+                keep_intermediate=False,
+                callback=Mock(),
+                backend="fibers"
+            )
+
+    def test_conversion_record_pickles(self):
+        """Test results are plain picklable records, not live objects."""
+        import pickle
+        from convertext_gui.threads import ConversionRecord
+
+        record = ConversionRecord(True, Path("/tmp/a.md"), Path("/tmp/a.html"))
+        assert pickle.loads(pickle.dumps(record)) == record
+
+
+class TestTextHandler:
+    """Tests for the debug console's log handler."""
+
+    def _handler(self, max_lines=3):
+        from convertext_gui.widgets import TextHandler
+        import logging
+
+        text = Mock()
+        text.yview.return_value = (0.0, 1.0)
+        handler = TextHandler(text, max_lines=max_lines)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        return handler, text
+
+    def _emit(self, handler, message):
+        import logging
+        handler.emit(logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None))
+
+    def test_emit_only_buffers(self):
+        """Test records wait for the timer instead of touching the widget."""
+        handler, text = self._handler()
+        text.after.assert_called_once()
+
+        self._emit(handler, "one")
+        text.insert.assert_not_called()
+
+    def test_flush_inserts_in_one_chunk(self):
+        """Test a flush inserts every buffered line at once, capped at max_lines."""
+        handler, text = self._handler(max_lines=3)
+        text.index.return_value = "4.0"
+        for message in ["one", "two", "three", "four"]:
+            self._emit(handler, message)
+
+        handler._flush()
+        text.insert.assert_called_once()
+        assert text.insert.call_args[0][1] == "two\nthree\nfour\n"
+        text.delete.assert_not_called()
+        text.see.assert_called_once()
+
+    def test_flush_trims_oldest_lines(self):
+        """Test the widget keeps only the newest max_lines lines."""
+        handler, text = self._handler(max_lines=3)
+        text.index.return_value = "6.0"
+        self._emit(handler, "new")
+
+        handler._flush()
+        text.delete.assert_called_once_with('1.0', '3.0')
+
 
 class TestLoggingConfig:
     """Tests for logging configuration."""
@@ -180,3 +396,35 @@ class TestLoggingConfig:
         # Verify logging is configured
         logger = logging.getLogger()
         assert logger.level == logging.DEBUG
+
+    def test_drop_policy_counts_and_reports(self):
+        """Test a full queue drops records and reports them once there is room."""
+        from convertext_gui.logging_config import BoundedQueueHandler
+        import logging
+        import queue
+
+        log_queue = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, "drop")
+        logger = logging.getLogger("convertext_gui.test_drop")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            for i in range(5):
+                logger.warning("record %d", i)
+            assert handler.dropped == 3
+
+            log_queue.get_nowait()
+            log_queue.get_nowait()
+            logger.warning("after")
+            messages = [log_queue.get_nowait().getMessage() for _ in range(log_queue.qsize())]
+            assert messages == ["after", "3 log records dropped (log queue full)"]
+        finally:
+            logger.removeHandler(handler)
+
+    def test_unknown_policy(self):
+        """Test an unknown overflow policy is rejected."""
+        from convertext_gui.logging_config import BoundedQueueHandler
+        import queue
+
+        with pytest.raises(ValueError):
+            BoundedQueueHandler(queue.Queue(), "spill")